@@ -0,0 +1,88 @@
+"""
+Per-frame cost of turning a captured region into a grayscale OCR input:
+the old PNG / PIL round-trips vs. the zero-copy NumPy capture path.
+
+Usage:
+    python benchmarks/bench_capture.py [width] [height]
+"""
+import io
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import numpy as np
+from mss.screenshot import ScreenShot
+from PIL import Image
+from PyQt5.QtCore import QBuffer
+from PyQt5.QtGui import QColor, QPixmap
+from PyQt5.QtWidgets import QApplication
+
+from src.ocr.capture import mss_to_array, qimage_to_array, to_grayscale
+
+
+def measure(fn, iterations=30):
+    """Return (median ms, peak traced bytes) for one call of fn."""
+    fn()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(samples), peak
+
+
+def report(name, before, after):
+    print(f"{name}")
+    print(f"  before: {before[0]:7.2f} ms/frame  {before[1] / 1024:9.0f} KiB allocated")
+    print(f"  after:  {after[0]:7.2f} ms/frame  {after[1] / 1024:9.0f} KiB allocated")
+
+
+if __name__ == "__main__":
+    width = int(sys.argv[1]) if len(sys.argv) > 1 else 1280
+    height = int(sys.argv[2]) if len(sys.argv) > 2 else 720
+    app = QApplication.instance() or QApplication(sys.argv)
+    print(f"=== Capture conversion benchmark ({width}x{height}) ===")
+    print("(allocations are Python/NumPy heap; Pillow's internal buffers are not traced)")
+
+    # mss path
+    raw = bytearray(np.random.randint(0, 255, width * height * 4, dtype=np.uint8).tobytes())
+    monitor = {'left': 0, 'top': 0, 'width': width, 'height': height}
+
+    # A fresh ScreenShot per call, as sct.grab returns; .rgb is cached per instance
+    def mss_before():
+        shot = ScreenShot(raw, monitor)
+        img = Image.frombytes('RGB', shot.size, shot.rgb)
+        return img.convert('L')
+
+    def mss_after():
+        shot = ScreenShot(raw, monitor)
+        return to_grayscale(mss_to_array(shot))
+
+    report("mss grab -> grayscale", measure(mss_before), measure(mss_after))
+
+    # Qt path
+    pixmap = QPixmap(width, height)
+    pixmap.fill(QColor(40, 120, 200))
+
+    def qt_before():
+        buffer = QBuffer()
+        buffer.open(QBuffer.ReadWrite)
+        pixmap.save(buffer, "PNG")
+        img = Image.open(io.BytesIO(buffer.data()))
+        buffer.close()
+        return img.convert('L')
+
+    def qt_after():
+        return to_grayscale(qimage_to_array(pixmap.toImage()))
+
+    report("QPixmap -> grayscale", measure(qt_before), measure(qt_after))
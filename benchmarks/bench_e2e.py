@@ -0,0 +1,275 @@
+"""
+Headless end-to-end benchmark: capture -> preprocess -> OCR -> speech.
+
+Known text is rendered with PIL in several fonts, sizes and backgrounds onto
+a synthetic screen that stands in for mss, then read back through
+OCRProcessor and spoken through TTSSpeaker on a silent speech engine. Reports
+per-stage latency percentiles, throughput and accuracy, and compares them
+with a stored baseline; any regression makes the run exit with status 1.
+
+Usage:
+    python benchmarks/bench_e2e.py [--iterations N] [--baseline PATH]
+                                   [--update-baseline] [--tolerance 0.5]
+                                   [--output results.json] [--font PATH ...]
+"""
+import argparse
+import difflib
+import json
+import os
+import platform
+import sys
+import time
+from unittest import mock
+
+# Run without a display: Qt renders offscreen
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+from mss.screenshot import ScreenShot
+from PIL import Image, ImageDraw, ImageFont
+from PyQt5.QtWidgets import QApplication
+
+from src.config import DEFAULT_CONFIG, _merge
+from src.ocr import processor as processor_module
+from src.ocr.capture import to_grayscale
+from src.ocr.processor import OCRProcessor
+from src.tts.speaker import TTSSpeaker
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+STAGES = ('capture', 'preprocess', 'ocr', 'speech', 'total')
+
+LINES = [
+    "Press E to open the gate",
+    "Quest updated: Find the missing merchant",
+    "You have 3 new messages",
+]
+SIZES = (16, 24, 36)
+BACKGROUNDS = ('plain', 'gradient', 'noisy')
+REGIONS = {
+    # name: (width, height, lines, preprocess preset, OCR profile)
+    'subtitle': (640, 64, 1, 'subtitle', {'psm': 7}),
+    'dialog': (900, 200, 3, 'busy_background', {'psm': 6}),
+}
+SYSTEM_FONTS = ('DejaVuSans.ttf', 'LiberationSans-Regular.ttf', 'arial.ttf', 'DejaVuSerif.ttf')
+SCREEN_SIZE = (1280, 720)
+
+
+def load_fonts(paths):
+    """Font factories for the given files, the common system fonts found, and Pillow's default."""
+    fonts = {}
+    for path in list(paths) + list(SYSTEM_FONTS):
+        try:
+            ImageFont.truetype(path, 12)
+        except OSError:
+            continue
+        fonts[os.path.splitext(os.path.basename(path))[0]] = (
+            lambda size, path=path: ImageFont.truetype(path, size)
+        )
+    fonts['default'] = lambda size: ImageFont.load_default(size=size)
+    return fonts
+
+
+def background(kind, width, height, rng):
+    if kind == 'plain':
+        return np.full((height, width), 235, dtype=np.uint8)
+    gradient = np.linspace(150, 250, width)[None, :].repeat(height, axis=0)
+    if kind == 'noisy':
+        gradient = gradient + rng.integers(-35, 36, (height, width))
+    return np.clip(gradient, 0, 255).astype(np.uint8)
+
+
+def render_case(font, size, kind, width, height, lines, rng):
+    """Render dark text on a background; returns (RGB image, expected text)."""
+    text = '\n'.join(LINES[:lines])
+    img = Image.fromarray(background(kind, width, height, rng)).convert('RGB')
+    ImageDraw.Draw(img).multiline_text((12, 10), text, fill=(15, 15, 15), font=font(size),
+                                       spacing=size // 2)
+    return img, text
+
+
+class NullSpeechEngine:
+    """Silent pyttsx3 engine stand-in that reports every word instantly.
+
+    pyttsx3's own 'dummy' driver stops pumping its loop after the first
+    utterance, so it cannot drive a speaker for more than one line.
+    """
+
+    def __init__(self):
+        self.callbacks = []
+        self.text = ''
+
+    def connect(self, topic, callback):
+        self.callbacks.append(callback)
+
+    def setProperty(self, name, value):
+        pass
+
+    def say(self, text):
+        self.text = text
+
+    def runAndWait(self):
+        location = 0
+        for word in self.text.split():
+            for callback in self.callbacks:
+                callback('utterance', location, len(word))
+            location += len(word) + 1
+
+    def stop(self):
+        pass
+
+
+class SyntheticScreen:
+    """Stands in for mss.mss(): one monitor whose pixels the benchmark paints."""
+
+    def __init__(self, width, height):
+        self.monitors = [{'left': 0, 'top': 0, 'width': width, 'height': height}] * 2
+        self.pixels = np.zeros((height, width, 4), dtype=np.uint8)
+
+    def show(self, img, left, top):
+        """Paint an RGB image onto the screen as BGRA."""
+        rgb = np.asarray(img)
+        h, w = rgb.shape[:2]
+        self.pixels[top:top + h, left:left + w, :3] = rgb[:, :, ::-1]
+        self.pixels[top:top + h, left:left + w, 3] = 255
+
+    def grab(self, monitor):
+        x, y = monitor['left'], monitor['top']
+        w, h = monitor['width'], monitor['height']
+        # Copy out the region, as the OS does when mss grabs the screen
+        data = bytearray(self.pixels[y:y + h, x:x + w].tobytes())
+        return ScreenShot(data, {'left': x, 'top': y, 'width': w, 'height': h})
+
+    def close(self):
+        pass
+
+
+def accuracy(expected, text):
+    """1.0 for a perfect read, based on the character-level similarity."""
+    normalize = lambda s: ' '.join(s.split()).lower()
+    return difflib.SequenceMatcher(None, normalize(expected), normalize(text)).ratio()
+
+
+def percentiles(values):
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {'p50': float(p50), 'p95': float(p95), 'p99': float(p99)}
+
+
+def run(iterations, font_paths):
+    config = _merge(DEFAULT_CONFIG, {'cache': {'enabled': False}})
+    screen = SyntheticScreen(*SCREEN_SIZE)
+    with mock.patch.object(processor_module.mss, 'mss', lambda: screen):
+        ocr = OCRProcessor(config)
+    with mock.patch('src.tts.speaker.pyttsx3.init', return_value=NullSpeechEngine()):
+        tts = TTSSpeaker(max_queue=64)
+    fonts = load_fonts(font_paths)
+    rng = np.random.default_rng(0)
+
+    timings = {stage: [] for stage in STAGES}
+    scores = []
+    start_all = time.perf_counter()
+    for font_name, font in fonts.items():
+        for size in SIZES:
+            for kind in BACKGROUNDS:
+                for region_name, (width, height, lines, preset, profile) in REGIONS.items():
+                    img, expected = render_case(font, size, kind, width, height, lines, rng)
+                    screen.pixels[:] = 0
+                    screen.show(img, 100, 100)
+                    region = (100, 100, width, height)
+                    preprocessor = ocr.get_preprocessor(preset)
+                    for _ in range(iterations):
+                        t0 = time.perf_counter()
+                        frame = ocr.grab_region(region, 0)
+                        t1 = time.perf_counter()
+                        gray = preprocessor(to_grayscale(frame))
+                        t2 = time.perf_counter()
+                        text = ocr.recognize(gray, profile).strip()
+                        t3 = time.perf_counter()
+                        handle = tts.speak(f"{text} {t3}")  # Unique, so never dropped as a repeat
+                        handle.wait(5)
+                        t4 = time.perf_counter()
+                        for stage, seconds in zip(STAGES, (t1 - t0, t2 - t1, t3 - t2, t4 - t3, t4 - t0)):
+                            timings[stage].append(seconds * 1000)
+                    scores.append(accuracy(expected, text))
+    elapsed = time.perf_counter() - start_all
+    tts.shutdown()
+
+    return {
+        'backend': ocr.engine.backend,
+        'cases': len(scores),
+        'iterations': iterations,
+        'stages_ms': {stage: percentiles(values) for stage, values in timings.items()},
+        'throughput_fps': len(timings['total']) / elapsed,
+        'accuracy': float(np.mean(scores)),
+        'min_accuracy': float(np.min(scores)),
+    }
+
+
+def compare(results, baseline, tolerance):
+    """List human-readable regressions of results against a baseline."""
+    regressions = []
+    for stage, stats in baseline.get('stages_ms', {}).items():
+        for key in ('p50', 'p95'):
+            old, new = stats[key], results['stages_ms'][stage][key]
+            # Ignore sub-millisecond jitter on the cheap stages
+            if new > old * (1 + tolerance) and new - old > 1.0:
+                regressions.append(f"{stage} {key}: {new:.2f} ms vs baseline {old:.2f} ms")
+    if results['throughput_fps'] < baseline.get('throughput_fps', 0) / (1 + tolerance):
+        regressions.append(f"throughput: {results['throughput_fps']:.1f} fps "
+                           f"vs baseline {baseline['throughput_fps']:.1f} fps")
+    if results['accuracy'] < baseline.get('accuracy', 0) - 0.02:
+        regressions.append(f"accuracy: {results['accuracy']:.3f} vs baseline {baseline['accuracy']:.3f}")
+    return regressions
+
+
+def report(results):
+    print(f"=== End-to-end benchmark ({results['cases']} cases x {results['iterations']} runs, "
+          f"OCR backend: {results['backend']}) ===")
+    print(f"{'stage':<12}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for stage, stats in results['stages_ms'].items():
+        print(f"{stage:<12}{stats['p50']:10.2f}{stats['p95']:10.2f}{stats['p99']:10.2f}")
+    print(f"Throughput: {results['throughput_fps']:.1f} frames/s")
+    print(f"Accuracy:   {results['accuracy']:.3f} mean, {results['min_accuracy']:.3f} worst case")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--iterations', type=int, default=3)
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--update-baseline', action='store_true',
+                        help="Store this run as the new baseline instead of comparing")
+    parser.add_argument('--tolerance', type=float, default=0.5,
+                        help="Allowed relative slowdown before a stage counts as regressed")
+    parser.add_argument('--output', help="Also write the results to this JSON file")
+    parser.add_argument('--font', action='append', default=[], help="Extra TrueType font to test")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    results = run(args.iterations, args.font)
+    results['machine'] = f"{platform.system()} {platform.machine()}, Python {platform.python_version()}"
+    report(results)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=4)
+
+    if args.update_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(results, f, indent=4)
+        print(f"Baseline written to {args.baseline}")
+        sys.exit(0)
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one")
+        sys.exit(0)
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print("REGRESSIONS:")
+        for line in regressions:
+            print(f"  {line}")
+        sys.exit(1)
+    print("No regressions against baseline")
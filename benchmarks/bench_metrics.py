@@ -0,0 +1,39 @@
+"""
+Per-call overhead of the metrics layer (spans, observations, counters).
+
+Usage:
+    python benchmarks/bench_metrics.py [iterations]
+"""
+import os
+import sys
+import time
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.metrics import Metrics
+
+
+def per_call_us(fn, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+if __name__ == "__main__":
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    metrics = Metrics()
+
+    def span():
+        with metrics.span('stage'):
+            pass
+
+    print(f"=== Metrics overhead ({iterations} calls) ===")
+    print(f"empty loop:  {per_call_us(lambda: None, iterations):.2f} us")
+    print(f"span:        {per_call_us(span, iterations):.2f} us")
+    print(f"observe:     {per_call_us(lambda: metrics.observe('stage', 1.0), iterations):.2f} us")
+    print(f"incr:        {per_call_us(lambda: metrics.incr('frames'), iterations):.2f} us")
+    start = time.perf_counter()
+    metrics.snapshot()
+    print(f"snapshot:    {(time.perf_counter() - start) * 1000:.2f} ms")
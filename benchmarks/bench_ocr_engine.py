@@ -0,0 +1,60 @@
+"""
+Per-call OCR latency: pytesseract subprocess vs. persistent in-process engines.
+
+Usage:
+    python benchmarks/bench_ocr_engine.py [iterations]
+"""
+import os
+import statistics
+import sys
+import time
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PIL import Image, ImageDraw
+
+from src.ocr.engine import PytesseractEngine, create_engine_pool
+
+
+def make_sample():
+    """Render a small subtitle-like grayscale image."""
+    img = Image.new('L', (400, 40), color=255)
+    d = ImageDraw.Draw(img)
+    d.text((10, 12), "The quick brown fox jumps over the lazy dog", fill=0)
+    return img
+
+
+def time_calls(recognize, image, iterations):
+    """Return per-call latencies in milliseconds."""
+    recognize(image)  # warm-up
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        recognize(image)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def report(name, samples):
+    print(f"{name:>12}: mean {statistics.mean(samples):7.1f} ms  "
+          f"median {statistics.median(samples):7.1f} ms  "
+          f"min {min(samples):7.1f} ms")
+
+
+if __name__ == "__main__":
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    image = make_sample()
+    print(f"=== OCR engine benchmark ({iterations} calls, {image.size[0]}x{image.size[1]}) ===")
+
+    before = time_calls(PytesseractEngine().recognize, image, iterations)
+    report("pytesseract", before)
+
+    pool = create_engine_pool(size=1)
+    if pool.backend == 'capi':
+        after = time_calls(pool.recognize, image, iterations)
+        report("capi pool", after)
+        print(f"Speed-up: {statistics.median(before) / statistics.median(after):.1f}x")
+    else:
+        print("libtesseract not available; only the pytesseract path was measured")
+    pool.close()
@@ -0,0 +1,67 @@
+"""
+OCR latency and accuracy for each preprocessing preset on synthetic
+subtitle-like text over busy game-style backgrounds.
+
+Usage:
+    python benchmarks/bench_preprocess.py [iterations]
+"""
+import difflib
+import os
+import statistics
+import sys
+import time
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+from src.ocr.engine import create_engine_pool
+from src.ocr.preprocess import PRESETS, Preprocessor
+
+TEXT = "Press E to open the gate"
+
+
+def render(background, light_text):
+    """Render TEXT over a gradient-plus-noise background."""
+    rng = np.random.default_rng(0)
+    width, height = 520, 48
+    gradient = np.linspace(0, 1, width)[None, :] * np.ones((height, 1))
+    base = (gradient * 120 + (40 if light_text else 120)).astype(np.int16)
+    noise = rng.integers(-background, background + 1, (height, width))
+    img = Image.fromarray(np.clip(base + noise, 0, 255).astype(np.uint8))
+    font = ImageFont.load_default(size=22)
+    ImageDraw.Draw(img).text((12, 12), TEXT, fill=250 if light_text else 10, font=font)
+    return np.asarray(img)
+
+
+def accuracy(text):
+    return difflib.SequenceMatcher(None, TEXT.lower(), ' '.join(text.split()).lower()).ratio()
+
+
+if __name__ == "__main__":
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    engine = create_engine_pool(size=1)
+    samples = {
+        'dark text, clean': render(0, False),
+        'dark text, noisy': render(40, False),
+        'light text, noisy': render(40, True),
+    }
+    print(f"=== Preprocessing benchmark ({iterations} runs, OCR backend: {engine.backend}) ===")
+    print(f"{'sample':<20}{'preset':<18}{'prep ms':>9}{'ocr ms':>9}{'accuracy':>10}")
+    for sample_name, image in samples.items():
+        for preset in PRESETS:
+            preprocessor = Preprocessor.from_config(preset)
+            prep_times, ocr_times = [], []
+            for _ in range(iterations):
+                gray = image.copy()
+                start = time.perf_counter()
+                prepared = preprocessor(gray)
+                prep_times.append((time.perf_counter() - start) * 1000)
+                start = time.perf_counter()
+                text = engine.recognize(prepared)
+                ocr_times.append((time.perf_counter() - start) * 1000)
+            print(f"{sample_name:<20}{preset:<18}{statistics.median(prep_times):9.2f}"
+                  f"{statistics.median(ocr_times):9.1f}{accuracy(text):10.2f}")
+    engine.close()
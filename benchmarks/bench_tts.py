@@ -0,0 +1,66 @@
+"""
+Time to first audio of speaking a paragraph whole vs sentence by sentence.
+
+The engine is simulated: it synthesizes for ``ms_per_char`` per character
+of an utterance before its first word, as SAPI5 and eSpeak roughly do.
+
+Usage:
+    python benchmarks/bench_tts.py [ms_per_char]
+"""
+import os
+import sys
+import time
+from unittest import mock
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.tts.speaker import TTSSpeaker
+
+TEXT = ("The ancient gate creaks open before you. Beyond it, a narrow path winds "
+        "down into the valley, where the lights of the village flicker in the mist. "
+        "Somewhere below, a bell is ringing. You have until nightfall to reach the "
+        "temple, or the way back will be sealed for another hundred years.")
+
+
+class SimulatedEngine:
+    def __init__(self, ms_per_char):
+        self.ms_per_char = ms_per_char
+        self.callbacks = []
+        self.text = ''
+
+    def connect(self, topic, cb):
+        self.callbacks.append(cb)
+
+    def setProperty(self, name, value):
+        pass
+
+    def say(self, text):
+        self.text = text
+
+    def runAndWait(self):
+        time.sleep(len(self.text) * self.ms_per_char / 1000)
+        for cb in self.callbacks:
+            cb('utterance', 0, 0)
+
+    def stop(self):
+        pass
+
+
+def first_audio_ms(chunk_chars, ms_per_char):
+    with mock.patch('src.tts.speaker.pyttsx3.init', return_value=SimulatedEngine(ms_per_char)):
+        speaker = TTSSpeaker(chunk_chars=chunk_chars)
+    try:
+        handle = speaker.speak(TEXT)
+        handle.wait(30)
+        return handle.first_audio_ms, len(handle.chunks)
+    finally:
+        speaker.shutdown()
+
+
+if __name__ == "__main__":
+    ms_per_char = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    print(f"=== Time to first audio ({len(TEXT)} chars, {ms_per_char} ms/char) ===")
+    for label, chunk_chars in (('whole', 0), ('chunked', 120)):
+        ms, chunks = first_audio_ms(chunk_chars, ms_per_char)
+        print(f"{label:8} {ms:8.1f} ms  ({chunks} chunks)")
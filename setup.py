@@ -15,6 +15,7 @@ setup(
     entry_points={
         'console_scripts': [
             'streamer-ocr=src.main:main',
+            'streamer-ocr-cli=src.cli:main',
         ],
     },
     package_data={
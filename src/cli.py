@@ -0,0 +1,323 @@
+"""
+Headless StreamerOCR: OCR saved regions without the Qt window.
+
+Regions are read from regions.json by name (or all of them, or a group),
+captured with mss and recognized with the same engines as the GUI. Each
+result is written to stdout as one JSON object per line; log records go to
+stderr. No QApplication is created.
+
+Usage:
+    python -m src.cli [NAME ...] [--group GROUP] [--interval SECONDS]
+                      [--count N] [--changes-only] [--list]
+    python -m src.cli batch INPUT ... [--workers N] [--format jsonl|csv]
+                      [--output FILE] [--resume] [--as-completed]
+    python -m src.cli history [WORD ...] [--region NAME] [--since WHEN]
+                      [--until WHEN] [--limit N]
+
+Example output line:
+    {"ts": 1700000000.123, "seq": 0, "region": "chat", "text": "gg", "ms": 41.7}
+"""
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import time
+
+# Allow running as `python src/cli.py` as well as `python -m src.cli`
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from src.config import CONFIG_FILE, load_config
+from src.log import setup_logging, shutdown_logging
+
+REGIONS_FILE = 'regions.json'
+
+logger = logging.getLogger('src.cli')
+
+
+def load_regions(path=REGIONS_FILE):
+    """Saved regions from a regions.json file written by the GUI."""
+    with open(path, 'r') as f:
+        return json.load(f).get('regions', {})
+
+
+def select_regions(regions, names=None, group=None):
+    """
+    Pick the regions to process.
+
+    Args:
+        regions (dict): All saved regions
+        names (list): Region names to process; all regions if empty
+        group (str): Only process regions in this group
+
+    Returns:
+        dict: Region name -> region data, in the order asked for
+
+    Raises:
+        KeyError: If a named region does not exist
+    """
+    if names:
+        missing = [name for name in names if name not in regions]
+        if missing:
+            raise KeyError(', '.join(missing))
+        selected = {name: regions[name] for name in names}
+    else:
+        selected = dict(regions)
+    if group is not None:
+        selected = {name: data for name, data in selected.items() if data.get('group') == group}
+    return selected
+
+
+def run(ocr, regions, interval=None, count=None, changes_only=False, out=None, history=None):
+    """
+    OCR the regions once, or every ``interval`` seconds, writing JSON Lines.
+
+    Args:
+        ocr (OCRProcessor): Processor used to grab and recognize the regions
+        regions (dict): Region name -> region data
+        interval (float): Seconds between passes; a single pass if None
+        count (int): Stop after this many passes (None for no limit)
+        changes_only (bool): Skip regions whose text is the same as last pass
+        out: Text stream to write to (stdout by default)
+        history (HistoryStore): Also record the results written here
+
+    Returns:
+        int: Number of passes made
+    """
+    out = out or sys.stdout
+    if interval is None and count is None:
+        count = 1
+    last_text = {}
+    seq = 0
+    next_pass = time.monotonic()
+    while count is None or seq < count:
+        started = time.perf_counter()
+        results = ocr.process_regions(regions)
+        ms = round((time.perf_counter() - started) * 1000, 1)
+        ts = round(time.time(), 3)
+        for name, text in results.items():
+            text = text.strip()
+            if changes_only and last_text.get(name) == text:
+                continue
+            last_text[name] = text
+            out.write(json.dumps({'ts': ts, 'seq': seq, 'region': name, 'text': text, 'ms': ms}) + '\n')
+            if history is not None and text:
+                history.record(name, text, ms=ms, source='cli', ts=ts)
+        out.flush()
+        seq += 1
+
+        if interval is None or (count is not None and seq >= count):
+            continue
+        # Keep a fixed cadence; if a pass overran, start the next one right away
+        next_pass = max(next_pass + interval, time.monotonic())
+        time.sleep(max(0.0, next_pass - time.monotonic()))
+    return seq
+
+
+def drop_partial_line(path):
+    """Cut off a last line left unfinished by an interrupted run."""
+    with open(path, 'r+b') as f:
+        data = f.read()
+        if not data.endswith(b'\n'):
+            f.truncate(data.rfind(b'\n') + 1)
+
+
+def batch_main(argv):
+    """The ``batch`` subcommand: OCR image files, globs and directories."""
+    from src.ocr.preprocess import PRESETS
+    from src.ocr.profile import PROFILE_PRESETS
+
+    parser = argparse.ArgumentParser(
+        prog='streamer-ocr-cli batch',
+        description="OCR image files on a process pool and write JSON Lines or CSV"
+    )
+    parser.add_argument('inputs', nargs='+', metavar='INPUT',
+                        help="Image files, glob patterns or directories")
+    parser.add_argument('--workers', type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument('--format', choices=('jsonl', 'csv'), default='jsonl')
+    parser.add_argument('--output', help="Write to this file instead of stdout")
+    parser.add_argument('--resume', action='store_true',
+                        help="Skip files already in --output and append to it")
+    parser.add_argument('--as-completed', action='store_true',
+                        help="Write results as files finish instead of in input order")
+    parser.add_argument('--no-recursive', action='store_true',
+                        help="Do not look into subdirectories")
+    parser.add_argument('--preprocess', choices=sorted(PRESETS),
+                        help="Preprocessing preset (see README)")
+    parser.add_argument('--profile', default='default', choices=sorted(PROFILE_PRESETS),
+                        help="OCR profile preset")
+    parser.add_argument('--config', default=CONFIG_FILE, help="Path to config.json")
+    parser.add_argument('--log-level', help="Override the configured log level")
+    args = parser.parse_args(argv)
+    if args.resume and not args.output:
+        parser.error("--resume needs --output")
+
+    config = load_config(args.config)
+    if args.log_level:
+        config['logging']['level'] = args.log_level
+    setup_logging(config['logging'])
+
+    from src.ocr.batch import ResultWriter, completed_paths, iter_image_paths, ocr_files
+
+    skip = completed_paths(args.output, args.format) if args.resume else set()
+    if skip:
+        logger.info("Resuming: %d files already done", len(skip))
+    if args.output:
+        append = args.resume and os.path.exists(args.output) and os.path.getsize(args.output) > 0
+        if append:
+            drop_partial_line(args.output)
+        stream = open(args.output, 'a' if append else 'w', newline='', encoding='utf-8')
+    else:
+        append = False
+        stream = sys.stdout
+    writer = ResultWriter(stream, args.format, header=not append)
+
+    files = failed = 0
+    started = time.perf_counter()
+    try:
+        paths = iter_image_paths(args.inputs, recursive=not args.no_recursive)
+        for result in ocr_files(paths, args.workers, args.preprocess, args.profile,
+                                ordered=not args.as_completed, skip=skip):
+            writer.write(result)
+            files += 1
+            if result['error']:
+                failed += 1
+                logger.warning("%s: %s", result['path'], result['error'])
+    except KeyboardInterrupt:
+        logger.warning("Interrupted; rerun with --resume to continue")
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+        elapsed = time.perf_counter() - started
+        logger.info("OCR'd %d files (%d failed) in %.1f s", files, failed, elapsed)
+        shutdown_logging()
+    return 1 if failed else 0
+
+
+def history_main(argv):
+    """The ``history`` subcommand: search recorded OCR results."""
+    from src.history import HistoryStore, parse_time
+
+    parser = argparse.ArgumentParser(
+        prog='streamer-ocr-cli history',
+        description="Search the OCR history and print matches as JSON Lines, newest first"
+    )
+    parser.add_argument('words', nargs='*', metavar='WORD',
+                        help="Words that must all appear (prefixes match too)")
+    parser.add_argument('--region', help="Only results from this region")
+    parser.add_argument('--since', type=parse_time,
+                        help="Only results after WHEN: e.g. 30m, 2h, 7d or 2024-05-01T20:00")
+    parser.add_argument('--until', type=parse_time, help="Only results before WHEN")
+    parser.add_argument('--limit', type=int, default=50, help="At most N results (default: 50)")
+    parser.add_argument('--path', help="History database (default: from config.json)")
+    parser.add_argument('--config', default=CONFIG_FILE, help="Path to config.json")
+    parser.add_argument('--log-level', help="Override the configured log level")
+    args = parser.parse_args(argv)
+
+    config = load_config(args.config)
+    if args.log_level:
+        config['logging']['level'] = args.log_level
+    setup_logging(config['logging'])
+    path = args.path or config['history']['path']
+    if not os.path.exists(path):
+        logger.error("No history database at %s", path)
+        shutdown_logging()
+        return 1
+
+    history = HistoryStore.from_config(dict(config['history'], path=path))
+    try:
+        for row in history.search(' '.join(args.words), args.region, args.since,
+                                  args.until, args.limit):
+            print(json.dumps(row))
+    except BrokenPipeError:
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    finally:
+        history.close()
+        shutdown_logging()
+    return 0
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    # Subcommands; a region named "batch" or "history" can still be given after "--"
+    if argv and argv[0] == 'batch':
+        return batch_main(argv[1:])
+    if argv and argv[0] == 'history':
+        return history_main(argv[1:])
+
+    parser = argparse.ArgumentParser(
+        description="OCR saved StreamerOCR regions headlessly and print JSON Lines"
+    )
+    parser.add_argument('names', nargs='*', metavar='NAME',
+                        help="Regions to process (default: all saved regions)")
+    parser.add_argument('--group', help="Only process regions in this group")
+    parser.add_argument('--interval', type=float,
+                        help="Repeat every SECONDS instead of running once")
+    parser.add_argument('--count', type=int, help="Stop after N passes")
+    parser.add_argument('--changes-only', action='store_true',
+                        help="Only print a region when its text changed")
+    parser.add_argument('--regions', default=REGIONS_FILE, help="Path to regions.json")
+    parser.add_argument('--config', default=CONFIG_FILE, help="Path to config.json")
+    parser.add_argument('--log-level', help="Override the configured log level")
+    parser.add_argument('--list', action='store_true', help="List saved regions and exit")
+    args = parser.parse_args(argv)
+
+    config = load_config(args.config)
+    if args.log_level:
+        config['logging']['level'] = args.log_level
+    # stdout carries the results, so log records only go to stderr (or the log file)
+    setup_logging(config['logging'])
+
+    try:
+        regions = load_regions(args.regions)
+    except (OSError, ValueError) as e:
+        logger.error("Could not read regions from %s: %s", args.regions, e)
+        shutdown_logging()
+        return 1
+
+    if args.list:
+        for name, data in regions.items():
+            print(json.dumps({'region': name, **data}))
+        shutdown_logging()
+        return 0
+
+    try:
+        selected = select_regions(regions, args.names, args.group)
+    except KeyError as e:
+        logger.error("Unknown region(s): %s", e.args[0])
+        shutdown_logging()
+        return 2
+    if not selected:
+        logger.error("No regions to process")
+        shutdown_logging()
+        return 2
+
+    # Imported late so --list and argument errors return without loading OCR
+    from src.ocr.processor import OCRProcessor
+
+    ocr = OCRProcessor(config)
+    history = None
+    if config['history']['enabled']:
+        from src.history import HistoryStore
+        history = HistoryStore.from_config(config['history'])
+    try:
+        run(ocr, selected, args.interval, args.count, args.changes_only, history=history)
+    except KeyboardInterrupt:
+        pass
+    except BrokenPipeError:
+        # The reader went away (e.g. `| head`); stop quietly, without a
+        # second error when Python flushes stdout on exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    finally:
+        if history is not None:
+            history.close()
+        shutdown_logging()
+    return 0
+
+
+if __name__ == '__main__':
+    # Lets batch worker processes start in the frozen (PyInstaller) build
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""
+User settings for StreamerOCR, stored in config.json next to regions.json.
+"""
+import copy
+import json
+import logging
+import os
+
+CONFIG_FILE = 'config.json'
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONFIG = {
+    'watch': {
+        'interval_ms': 250,     # Fastest a watched region is re-captured
+        'max_interval_ms': 4000,  # Slowest, for regions that have not changed in a while
+        'backoff': 2.0,         # Interval multiplier after each unchanged capture
+        'max_fps': 20,          # Captures per second shared by all watched regions
+        'cpu_budget': 0.5,      # Cores' worth of capture + OCR time shared by them
+        'threshold': 0.0,       # Fraction of blocks that must change to re-run OCR
+        'downsample': 4,        # Keep every Nth pixel for the comparison
+        'block_size': 8,        # Block hash tile size, in downsampled pixels
+        'pixel_delta': 24,      # Minimum gray-level change that counts
+        'incremental': True,    # Only speak/show lines that were not read before
+        'similarity': 0.85,     # How alike two lines must be to count as the same
+    },
+    'tts': {
+        'max_queue': 8,         # Utterances waiting before the oldest is dropped
+        'barge_in': True,       # New text interrupts the current utterance
+        'cache_dir': 'speech_cache',  # Rendered clips of repeated phrases (None to disable)
+        'cache_mb': 64,
+        'cache_after': 2,       # Render a phrase once it was spoken this many times
+        'prewarm': 50,          # Render the most frequent lines from the history at start-up
+        'chunk_chars': 120,     # Speak long text in sentences/clauses up to this long (0: whole)
+    },
+    'cache': {
+        'enabled': True,
+        'max_mb': 16,           # In-memory LRU budget for cached OCR results
+        'perceptual': False,    # Also match near-identical images by dHash
+        'max_distance': 3,      # dHash bits that may differ for a perceptual hit
+        'disk_path': None,      # e.g. "ocr_cache.sqlite3" to keep results across restarts
+    },
+    'localize': {
+        'enabled': True,        # OCR only the text lines found in a region, not all of it
+        'edge_threshold': 40,   # Gray-level step that always counts as a glyph edge
+        'max_coverage': 0.6,    # OCR the whole region when text covers more than this
+    },
+    'overlay': {
+        'font_size': 20,
+        'max_width': 600,       # Text wraps at this many pixels
+        'max_lines': 6,         # Only the newest lines of longer text are shown
+    },
+    'history': {
+        'enabled': True,        # Keep every OCR result in a searchable database
+        'path': 'history.sqlite3',
+        'max_age_days': 30,     # Older results are deleted (0 keeps them forever)
+        'max_rows': 200000,     # Only the newest results are kept (0 for no limit)
+        'flush_ms': 1000,       # Results are written in batches at most this often
+    },
+    'selector': {
+        'freeze': False,        # Select over a still frame of the monitor, not the live screen
+    },
+    'metrics': {
+        'show_panel': True,     # Live latency/counter panel in the main window
+        'export_path': None,    # e.g. "metrics.prom" or "metrics.json", rewritten periodically
+        'export_interval_s': 10,
+    },
+    'logging': {
+        'level': 'INFO',        # DEBUG also logs every capture, OCR result and utterance
+        'console': True,        # Write records to stderr (from a background thread)
+        'file': None,           # e.g. "streamerocr.log" for a rotating log file
+        'ring_size': 500,       # Records kept in memory for the log panel
+        'show_panel': True,     # Show recent records in the main window
+    },
+    'hotkeys': {
+        'debounce_ms': 50,      # Presses closer together than this count once
+        'bindings': {           # Action -> key combination; null or "" to unbind
+            'process': 'alt+shift+space',
+            'process_all': 'alt+shift+a',
+            'select': 'alt+shift+m',
+            'watch': 'alt+shift+w',
+            'cancel': 'alt+shift+c',
+            'quit': 'alt+shift+n',
+        },
+    },
+}
+
+
+def _merge(defaults, overrides):
+    """Recursively overlay user settings on top of the defaults."""
+    merged = copy.deepcopy(defaults)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def load_config(path=CONFIG_FILE):
+    """Load settings from disk, falling back to the defaults for missing keys."""
+    if not os.path.exists(path):
+        return copy.deepcopy(DEFAULT_CONFIG)
+    try:
+        with open(path, 'r') as f:
+            return _merge(DEFAULT_CONFIG, json.load(f))
+    except Exception as e:
+        logger.error("Error loading config, using defaults: %s", e)
+        return copy.deepcopy(DEFAULT_CONFIG)
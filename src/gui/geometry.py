@@ -0,0 +1,105 @@
+"""
+Monitor layout and mapping between Qt's logical and physical screen pixels.
+
+Qt positions windows in device-independent (logical) pixels, while mss and
+OCR work on the pixels actually on screen. Regions are stored in physical
+pixels, in global screen coordinates, so they can be handed to mss as they
+are. As in Qt 5, a screen's logical top-left corner is its physical one and
+only distances within the screen are scaled by its device pixel ratio.
+"""
+from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtGui import QGuiApplication
+
+
+class Monitor:
+    """Position and scale of one screen."""
+
+    def __init__(self, index, left, top, width, height, scale=1.0, name=''):
+        self.index = index
+        self.left = left
+        self.top = top
+        self.width = width      # Logical pixels
+        self.height = height
+        self.scale = scale      # Physical pixels per logical pixel
+        self.name = name
+
+    @classmethod
+    def from_screen(cls, index, screen):
+        geometry = screen.geometry()
+        return cls(index, geometry.x(), geometry.y(), geometry.width(), geometry.height(),
+                   screen.devicePixelRatio(), screen.name())
+
+    @property
+    def physical(self):
+        """(left, top, width, height) of the whole screen in physical pixels."""
+        return (self.left, self.top,
+                round(self.width * self.scale), round(self.height * self.scale))
+
+    def to_physical(self, region):
+        """Map a global logical (x, y, width, height) to physical pixels."""
+        x, y, width, height = region
+        return (self.left + round((x - self.left) * self.scale),
+                self.top + round((y - self.top) * self.scale),
+                round(width * self.scale), round(height * self.scale))
+
+    def to_logical(self, region):
+        """Map a global physical (x, y, width, height) to logical pixels."""
+        x, y, width, height = region
+        return (self.left + round((x - self.left) / self.scale),
+                self.top + round((y - self.top) / self.scale),
+                round(width / self.scale), round(height / self.scale))
+
+    def __repr__(self):
+        return (f"Monitor({self.index}, {self.left}, {self.top}, {self.width}, "
+                f"{self.height}, scale={self.scale})")
+
+
+class ScreenGeometry(QObject):
+    """Cached layout of all screens, refreshed when Qt reports a change.
+
+    The layout is read from Qt once and kept until a screen is added or
+    removed or one changes geometry or DPI; ``changed`` is then emitted and
+    the next lookup reads it again.
+    """
+
+    changed = pyqtSignal()
+
+    def __init__(self, app=None, parent=None):
+        super().__init__(parent)
+        self.app = app or QGuiApplication.instance()
+        self._monitors = None
+        self.app.screenAdded.connect(self._on_screen_added)
+        self.app.screenRemoved.connect(self.invalidate)
+        for screen in self.app.screens():
+            self._watch(screen)
+
+    def _watch(self, screen):
+        screen.geometryChanged.connect(self.invalidate)
+        screen.logicalDotsPerInchChanged.connect(self.invalidate)
+        screen.physicalDotsPerInchChanged.connect(self.invalidate)
+
+    def _on_screen_added(self, screen):
+        self._watch(screen)
+        self.invalidate()
+
+    def invalidate(self, *args):
+        """Forget the cached layout, e.g. after a display settings change."""
+        self._monitors = None
+        self.changed.emit()
+
+    @property
+    def monitors(self):
+        if self._monitors is None:
+            self._monitors = [Monitor.from_screen(index, screen)
+                              for index, screen in enumerate(self.app.screens())]
+        return self._monitors
+
+    def monitor(self, index):
+        """The Monitor at ``index`` (0-based, in QGuiApplication.screens() order)."""
+        return self.monitors[index]
+
+    def to_physical(self, region, index):
+        return self.monitor(index).to_physical(region)
+
+    def to_logical(self, region, index):
+        return self.monitor(index).to_logical(region)
@@ -0,0 +1,137 @@
+import math
+
+from PyQt5.QtWidgets import QWidget, QApplication
+from PyQt5.QtCore import Qt, QPointF, QRect
+from PyQt5.QtGui import (QPainter, QColor, QFont, QStaticText, QTextLayout, QTextOption,
+                         QTransform)
+
+
+class OverlayWindow(QWidget):
+    """Always-on-top, click-through box showing the latest OCR text.
+
+    The font is built once and the text is laid out once per change into a
+    QStaticText, so repaints only replay the cached glyph layout. Setting
+    the same text again does nothing; the window is only resized when the
+    text's size changes, otherwise just the text area is repainted. Text is
+    capped to the last ``max_lines`` lines of at most ``max_chars``
+    characters, and wraps at ``max_width`` pixels.
+    """
+
+    def __init__(self, font_size=20, max_width=600, max_lines=6, max_chars=200):
+        super().__init__()
+        self.setWindowFlags(
+            Qt.FramelessWindowHint |
+            Qt.WindowStaysOnTopHint |
+            Qt.Tool
+        )
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.text = ""
+        self.font_size = font_size
+        self.max_width = max_width
+        self.max_lines = max_lines
+        self.max_chars = max_chars
+        self.text_color = QColor(255, 255, 255)  # White text
+        self.bg_color = QColor(0, 0, 0, 180)  # Semi-transparent black background
+        self.padding = 10
+
+        self.font = QFont()
+        self.font.setPointSize(self.font_size)
+        self.static_text = QStaticText()
+        self.static_text.setTextFormat(Qt.PlainText)
+        self.static_text.setPerformanceHint(QStaticText.AggressiveCaching)
+        self.static_text.setTextWidth(self.max_width)
+        option = QTextOption()
+        option.setWrapMode(QTextOption.WrapAtWordBoundaryOrAnywhere)
+        self.static_text.setTextOption(option)
+        self.text_size = QRect()
+        self.show()
+
+    def cap_text(self, text):
+        """Keep the newest lines of long text, shortening overlong lines."""
+        lines = text.strip().splitlines()[-self.max_lines:]
+        return '\n'.join(
+            line if len(line) <= self.max_chars else line[:self.max_chars - 1] + '…'
+            for line in lines
+        )
+
+    def set_text(self, text):
+        text = self.cap_text(text or "")
+        if text == self.text:
+            return
+        self.text = text
+        # QStaticText only breaks lines at Unicode line separators
+        self.static_text.setText(text.replace('\n', '\u2028'))
+        self.static_text.prepare(QTransform(), self.font)
+        self.text_size = self.layout_size(self.static_text.text())
+        if not text:
+            self.update()
+        elif not self.update_geometry():
+            # Same size: only the text area needs repainting
+            self.update(self.text_rect())
+
+    def layout_size(self, text):
+        """
+        Size of text as the QStaticText lays it out for drawing: the same
+        font, wrap mode and width, so the window fits exactly what is drawn.
+
+        Returns:
+            QRect: The text's bounding box, at the origin
+        """
+        layout = QTextLayout(text, self.font)
+        layout.setTextOption(self.static_text.textOption())
+        width = height = 0.0
+        layout.beginLayout()
+        while True:
+            line = layout.createLine()
+            if not line.isValid():
+                break
+            line.setLineWidth(self.max_width)
+            line.setPosition(QPointF(0, height))
+            height += line.height()
+            width = max(width, line.naturalTextWidth())
+        layout.endLayout()
+        return QRect(0, 0, math.ceil(width), math.ceil(height))
+
+    def text_rect(self):
+        return self.rect().adjusted(self.padding, self.padding, -self.padding, -self.padding)
+
+    def update_geometry(self):
+        """
+        Fit the window to the laid-out text in the top-right corner of the screen.
+
+        Returns:
+            bool: True if the window was resized (which repaints all of it)
+        """
+        if not self.text:
+            return False
+
+        width = min(self.text_size.width(), self.max_width) + (2 * self.padding)
+        height = self.text_size.height() + (2 * self.padding)
+
+        # Position in top-right corner of primary screen
+        screen_geometry = QApplication.primaryScreen().geometry()
+        x = screen_geometry.width() - width - 20  # 20px from right edge
+        y = 20  # 20px from top
+
+        geometry = QRect(x, y, width, height)
+        if geometry == self.geometry():
+            return False
+        self.setGeometry(geometry)
+        return True
+
+    def paintEvent(self, event):
+        # Translucent windows start each repaint from a cleared area
+        if not self.text:
+            return
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # Draw background
+        painter.fillRect(event.rect(), self.bg_color)
+
+        # Draw text
+        painter.setPen(self.text_color)
+        painter.setFont(self.font)
+        painter.drawStaticText(self.padding, self.padding, self.static_text)
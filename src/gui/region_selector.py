@@ -1,22 +1,73 @@
 from PyQt5.QtWidgets import QWidget, QApplication
-from PyQt5.QtCore import Qt, pyqtSignal, QPoint, QRect
-from PyQt5.QtGui import QPainter, QColor, QPen, QScreen
+from PyQt5.QtCore import Qt, pyqtSignal, QPoint, QRect, QRectF
+from PyQt5.QtGui import QPainter, QColor, QPen, QPixmap, QRegion, QScreen
+
+
+def selection_damage(old, new, border):
+    """
+    The area that changes when a selection moves from ``old`` to ``new``.
+
+    Inside both rectangles the fill stays the same and outside both the dim
+    overlay does, so only the difference between them and the borders of
+    each (``border`` pixels wide, drawn straddling the edge) need repainting.
+    A selection that appears or is cleared changes all of its area.
+
+    Args:
+        old (QRect): Previous selection, or None
+        new (QRect): New selection, or None
+        border (int): Width of the selection border
+
+    Returns:
+        QRegion: The region to repaint
+    """
+    region = QRegion()
+    grow = border // 2 + 1
+    for rect, other in ((old, new), (new, old)):
+        if rect is None:
+            continue
+        outer = rect.adjusted(-grow, -grow, grow, grow)
+        if other is None:
+            region = region.united(QRegion(outer))
+            continue
+        inner = rect.adjusted(grow, grow, -grow, -grow)
+        region = region.united(QRegion(outer).subtracted(QRegion(inner)))
+    if old is not None and new is not None:
+        region = region.united(QRegion(old).xored(QRegion(new)))
+    return region
+
 
 class RegionSelector(QWidget):
-    """Widget for selecting a screen region."""
-    
+    """Widget for selecting a screen region.
+
+    Moving the mouse only repaints the area between the old and new
+    selection rectangles. With ``freeze`` the monitor is captured once when
+    the selector opens and that still frame is shown behind the selection,
+    so the window is opaque and the compositor does not have to blend it
+    over the live screen; if the screen cannot be captured the selector
+    falls back to a translucent overlay.
+    """
+
     region_selected = pyqtSignal(tuple)
 
-    def __init__(self, screen):
+    def __init__(self, screen, freeze=False):
         super().__init__()
         self.screen = screen
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
-        self.setAttribute(Qt.WA_TranslucentBackground)
-        
+
         # Set geometry to match the selected screen
         screen_geometry = screen.geometry()
         self.setGeometry(screen_geometry)
-        
+
+        self.overlay_color = QColor(0, 0, 0, 128)
+        self.background = None  # Still frame of the screen, undimmed
+        self.dimmed = None      # The same frame with the overlay already applied
+        if freeze:
+            self.freeze(screen_geometry)
+        if self.background is None:
+            self.setAttribute(Qt.WA_TranslucentBackground)
+        else:
+            self.setAttribute(Qt.WA_OpaquePaintEvent)
+
         # Selection properties
         self.selection_start = None
         self.selection_end = None
@@ -24,49 +75,85 @@ class RegionSelector(QWidget):
         self.selection_color = QColor(255, 0, 0, 128)  # Semi-transparent red
         self.selection_border_color = QColor(255, 0, 0)  # Solid red
         self.selection_border_width = 2
-        
+
         # Show the selector
         self.showFullScreen()
         self.setCursor(Qt.CrossCursor)
 
+    def freeze(self, screen_geometry):
+        """Capture the screen once and pre-render its dimmed copy."""
+        pixmap = self.screen.grabWindow(0)
+        if pixmap.isNull() or screen_geometry.width() <= 0:
+            return
+        # Physical pixels per logical pixel, whether or not Qt set it
+        pixmap.setDevicePixelRatio(pixmap.width() / screen_geometry.width())
+        dimmed = QPixmap(pixmap)
+        painter = QPainter(dimmed)
+        painter.fillRect(dimmed.rect(), self.overlay_color)
+        painter.end()
+        self.background = pixmap
+        self.dimmed = dimmed
+
+    def draw_frame(self, painter, pixmap, rect):
+        """Copy the logical ``rect`` of a still frame onto the window."""
+        ratio = pixmap.devicePixelRatio()
+        source = QRectF(rect.x() * ratio, rect.y() * ratio,
+                        rect.width() * ratio, rect.height() * ratio)
+        painter.drawPixmap(QRectF(rect), pixmap, source)
+
     def paintEvent(self, event):
-        """Draw the selection overlay."""
+        """Draw the selection overlay over the damaged area only."""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Draw semi-transparent overlay
-        painter.fillRect(self.rect(), QColor(0, 0, 0, 128))
-        
-        # Draw selection rectangle if there is one
+        # The damage is often a thin L-shaped strip, so paint its rectangles
+        # rather than their bounding box
+        for damaged in event.region().rects():
+            # Draw semi-transparent overlay
+            if self.dimmed is not None:
+                self.draw_frame(painter, self.dimmed, damaged)
+            else:
+                painter.fillRect(damaged, self.overlay_color)
+
+            # Draw selection rectangle if there is one
+            if self.selection_rect:
+                inside = self.selection_rect.intersected(damaged)
+                if not inside.isEmpty():
+                    if self.background is not None:
+                        self.draw_frame(painter, self.background, inside)
+                    else:
+                        # Clear the selected area
+                        painter.eraseRect(inside)
+                    # Draw semi-transparent fill
+                    painter.fillRect(inside, self.selection_color)
+
         if self.selection_rect:
-            # Clear the selected area
-            painter.eraseRect(self.selection_rect)
-            
             # Draw border around selection
             painter.setPen(QPen(self.selection_border_color, self.selection_border_width))
             painter.drawRect(self.selection_rect)
-            
-            # Draw semi-transparent fill
-            painter.fillRect(self.selection_rect, self.selection_color)
+
+    def set_selection(self, rect):
+        """Change the selection and repaint just what it uncovered or covered."""
+        damage = selection_damage(self.selection_rect, rect, self.selection_border_width)
+        self.selection_rect = rect
+        if not damage.isEmpty():
+            self.update(damage)
 
     def mousePressEvent(self, event):
         """Handle mouse press to start selection."""
         if event.button() == Qt.LeftButton:
             self.selection_start = event.pos()
             self.selection_end = self.selection_start
-            self.update()
+            self.set_selection(None)
 
     def mouseMoveEvent(self, event):
         """Handle mouse movement to update selection."""
         if self.selection_start:
             self.selection_end = event.pos()
-            self.selection_rect = QRect(
+            self.set_selection(QRect(
                 min(self.selection_start.x(), self.selection_end.x()),
                 min(self.selection_start.y(), self.selection_end.y()),
                 abs(self.selection_start.x() - self.selection_end.x()),
                 abs(self.selection_start.y() - self.selection_end.y())
-            )
-            self.update()
+            ))
 
     def mouseReleaseEvent(self, event):
         """Handle mouse release to complete selection."""
@@ -86,4 +173,4 @@ class RegionSelector(QWidget):
     def keyPressEvent(self, event):
         """Handle escape key to cancel selection."""
         if event.key() == Qt.Key_Escape:
-            self.close() 
\ No newline at end of file
+            self.close()
\ No newline at end of file
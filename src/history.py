@@ -0,0 +1,347 @@
+"""
+Searchable history of OCR results.
+
+Every result is kept in a SQLite database with its time, region name,
+source, timing and (where known) confidence, and indexed with FTS5 for
+full-text search. ``record`` only puts the result on a queue: a writer
+thread inserts queued results in batches, so the capture and OCR threads
+never wait for the disk. Old rows are pruned by age and count, and the
+database is compacted after large deletions.
+"""
+import logging
+import queue
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS history ("
+    " id INTEGER PRIMARY KEY, ts REAL NOT NULL, region TEXT NOT NULL, text TEXT NOT NULL,"
+    " confidence REAL, ms REAL, source TEXT)",
+    "CREATE INDEX IF NOT EXISTS history_ts ON history (ts)",
+    "CREATE INDEX IF NOT EXISTS history_region_ts ON history (region, ts)",
+)
+
+# External-content FTS5 index kept in step with the history table by triggers
+_FTS_SCHEMA = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS history_fts USING fts5("
+    " text, content='history', content_rowid='id')",
+    "CREATE TRIGGER IF NOT EXISTS history_ai AFTER INSERT ON history BEGIN"
+    " INSERT INTO history_fts (rowid, text) VALUES (new.id, new.text); END",
+    "CREATE TRIGGER IF NOT EXISTS history_ad AFTER DELETE ON history BEGIN"
+    " INSERT INTO history_fts (history_fts, rowid, text) VALUES ('delete', old.id, old.text); END",
+)
+
+_INSERT = ("INSERT INTO history (ts, region, text, confidence, ms, source)"
+           " VALUES (?, ?, ?, ?, ?, ?)")
+
+_DURATION = re.compile(r'^(\d+(?:\.\d+)?)\s*([smhd])$')
+_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+def parse_time(value, now=None):
+    """
+    Parse a point in time for searching.
+
+    Args:
+        value (str): A duration ago such as "90s", "30m", "2h" or "7d", an
+            ISO date/time such as "2024-05-01T20:00", or a Unix timestamp
+        now (float): The current time, for durations
+
+    Returns:
+        float: Unix timestamp
+
+    Raises:
+        ValueError: If the value is none of those
+    """
+    value = value.strip()
+    match = _DURATION.match(value)
+    if match:
+        return (time.time() if now is None else now) - float(match.group(1)) * _UNITS[match.group(2)]
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.fromisoformat(value).timestamp()
+
+
+def fts_query(text):
+    """
+    Turn free text into an FTS5 query matching rows with all of its words.
+
+    Each word is quoted, so punctuation such as "HP:" or "-" is not read as
+    query syntax, and matched as a prefix ("quest" finds "quests").
+    """
+    words = re.findall(r'\w+', text)
+    return ' '.join(f'"{word}"*' for word in words)
+
+
+class HistoryStore:
+    """SQLite store of OCR results with write-behind inserts and FTS5 search.
+
+    The database is opened by the writer thread, so creating a store costs
+    nothing on the caller's thread. Searches use their own connection and
+    see everything written so far (WAL mode lets them run while the writer
+    inserts).
+    """
+
+    def __init__(self, path, batch_size=100, flush_ms=1000, max_age_days=30,
+                 max_rows=200000, max_queue=10000):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_ms / 1000
+        self.max_age = max_age_days * 86400 if max_age_days else None
+        self.max_rows = max_rows
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.written = 0
+        self.dropped = 0
+        self.fts = True             # False if this SQLite lacks FTS5
+        self._ready = threading.Event()
+        self._error = None
+        self._read_db = None
+        self._read_lock = threading.Lock()
+        self._since_prune = 0
+        self._thread = threading.Thread(target=self._run, name='history', daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def from_config(cls, config):
+        """Build a store from the 'history' config section."""
+        return cls(config['path'], flush_ms=config['flush_ms'],
+                   max_age_days=config['max_age_days'], max_rows=config['max_rows'])
+
+    def record(self, region, text, confidence=None, ms=None, source='', ts=None):
+        """
+        Queue an OCR result for writing; never blocks.
+
+        Returns:
+            bool: False if the queue was full and the result was dropped
+        """
+        row = (time.time() if ts is None else ts, region, text, confidence, ms, source)
+        try:
+            self.queue.put_nowait(row)
+        except queue.Full:
+            self.dropped += 1
+            return False
+        return True
+
+    def flush(self, timeout=5.0):
+        """Wait until everything queued so far has been written."""
+        done = threading.Event()
+        self.queue.put(done, timeout=timeout)
+        return done.wait(timeout)
+
+    def close(self, timeout=5.0):
+        """Write what is still queued and stop the writer thread."""
+        if self._thread.is_alive():
+            self.queue.put(_STOP)
+            self._thread.join(timeout)
+        with self._read_lock:
+            if self._read_db is not None:
+                self._read_db.close()
+                self._read_db = None
+
+    def _connect(self):
+        db = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        return db
+
+    def _open(self):
+        db = sqlite3.connect(self.path, timeout=10)
+        # Must be set before the first table is created to take effect
+        db.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        for statement in _SCHEMA:
+            db.execute(statement)
+        try:
+            for statement in _FTS_SCHEMA:
+                db.execute(statement)
+        except sqlite3.OperationalError as e:
+            logger.warning("SQLite has no FTS5, history search will be slow: %s", e)
+            self.fts = False
+        db.commit()
+        return db
+
+    def _run(self):
+        """Writer thread: insert queued rows in batches, prune now and then."""
+        try:
+            db = self._open()
+        except Exception as e:
+            logger.error("Could not open history database %s: %s", self.path, e)
+            self._error = e
+            self._ready.set()
+            self._discard()
+            return
+        try:
+            try:
+                self._prune(db)
+            finally:
+                # Searches wait for old rows to be gone
+                self._ready.set()
+            stopping = False
+            while not stopping:
+                rows, waiters = [], []
+                item = self.queue.get()
+                # Gather rows for up to flush_ms into one transaction; a flush
+                # or close writes right away
+                deadline = time.monotonic() + self.flush_interval
+                while True:
+                    if item is _STOP:
+                        stopping = True
+                    elif isinstance(item, threading.Event):
+                        waiters.append(item)
+                    else:
+                        rows.append(item)
+                    if stopping or waiters or len(rows) >= self.batch_size:
+                        break
+                    try:
+                        item = self.queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                    except queue.Empty:
+                        break
+                if rows:
+                    self._write(db, rows)
+                for waiter in waiters:
+                    waiter.set()
+        finally:
+            db.close()
+
+    def _write(self, db, rows):
+        try:
+            with db:
+                db.executemany(_INSERT, rows)
+        except sqlite3.Error as e:
+            logger.error("Could not write %d history rows: %s", len(rows), e)
+            return
+        self.written += len(rows)
+        self._since_prune += len(rows)
+        if self._since_prune >= max(1000, self.max_rows // 100 if self.max_rows else 0):
+            self._prune(db)
+
+    def _discard(self):
+        """Keep draining the queue so record and flush never hang."""
+        while True:
+            item = self.queue.get()
+            if item is _STOP:
+                return
+            if isinstance(item, threading.Event):
+                item.set()
+
+    def _prune(self, db, now=None):
+        """
+        Delete rows older than ``max_age_days`` and beyond the newest
+        ``max_rows``, then compact the index and file if much was deleted.
+
+        Returns:
+            int: Rows deleted
+        """
+        self._since_prune = 0
+        now = time.time() if now is None else now
+        deleted = 0
+        with db:
+            if self.max_age:
+                deleted += db.execute("DELETE FROM history WHERE ts < ?",
+                                      (now - self.max_age,)).rowcount
+            if self.max_rows:
+                deleted += db.execute(
+                    "DELETE FROM history WHERE id <= (SELECT id FROM history"
+                    " ORDER BY id DESC LIMIT 1 OFFSET ?)", (self.max_rows,)
+                ).rowcount
+        if deleted:
+            logger.info("Pruned %d history rows", deleted)
+        if deleted >= 1000 or (self.max_rows and deleted >= self.max_rows // 10):
+            self._compact(db)
+        return deleted
+
+    def _compact(self, db):
+        """Merge the FTS index segments and return free pages to the OS."""
+        if self.fts:
+            with db:
+                db.execute("INSERT INTO history_fts (history_fts) VALUES ('optimize')")
+        db.execute("PRAGMA incremental_vacuum")
+        db.commit()
+
+    def search(self, query='', region=None, since=None, until=None, limit=50):
+        """
+        Find recorded results, newest first.
+
+        Args:
+            query (str): Words that must all appear (as prefixes); empty for any text
+            region (str): Only this region, by its regions.json name
+            since (float): Only results at or after this Unix time
+            until (float): Only results before this Unix time
+            limit (int): At most this many results
+
+        Returns:
+            list: dicts with 'ts', 'region', 'text', 'confidence', 'ms' and 'source'
+        """
+        self._ready.wait(10)
+        if self._error is not None:
+            return []
+        where, params = [], []
+        match = fts_query(query) if query else ''
+        if match and self.fts:
+            where.append("h.id IN (SELECT rowid FROM history_fts WHERE history_fts MATCH ?)")
+            params.append(match)
+        elif query:
+            for word in re.findall(r'\w+', query):
+                where.append("h.text LIKE ?")
+                params.append(f'%{word}%')
+        if region is not None:
+            where.append("h.region = ?")
+            params.append(region)
+        if since is not None:
+            where.append("h.ts >= ?")
+            params.append(since)
+        if until is not None:
+            where.append("h.ts < ?")
+            params.append(until)
+        sql = "SELECT h.ts, h.region, h.text, h.confidence, h.ms, h.source FROM history h"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY h.ts DESC, h.id DESC LIMIT ?"
+        params.append(limit)
+
+        with self._read_lock:
+            if self._read_db is None:
+                self._read_db = self._connect()
+            rows = self._read_db.execute(sql, params).fetchall()
+        keys = ('ts', 'region', 'text', 'confidence', 'ms', 'source')
+        return [dict(zip(keys, row)) for row in rows]
+
+    def frequent(self, limit=50, min_count=2, since=None):
+        """
+        The texts recorded most often, most frequent first.
+
+        Args:
+            limit (int): At most this many texts
+            min_count (int): Only texts recorded at least this many times
+            since (float): Only count results at or after this Unix time
+
+        Returns:
+            list: (text, count) tuples
+        """
+        self._ready.wait(10)
+        if self._error is not None:
+            return []
+        sql = "SELECT text, COUNT(*) AS n FROM history"
+        params = []
+        if since is not None:
+            sql += " WHERE ts >= ?"
+            params.append(since)
+        sql += " GROUP BY text HAVING n >= ? ORDER BY n DESC, MAX(ts) DESC LIMIT ?"
+        params += [min_count, limit]
+        with self._read_lock:
+            if self._read_db is None:
+                self._read_db = self._connect()
+            return self._read_db.execute(sql, params).fetchall()
+
+    def stats(self):
+        """Counters for display and metrics export."""
+        return {'written': self.written, 'dropped': self.dropped, 'queued': self.queue.qsize()}
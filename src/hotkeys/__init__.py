@@ -0,0 +1,3 @@
+"""
+Global hotkey handling for StreamerOCR.
+"""
@@ -0,0 +1,89 @@
+import logging
+
+import keyboard
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_combo(combo):
+    """Canonical form of a key combination, e.g. 'Alt + Shift + Space' -> 'alt+shift+space'."""
+    return '+'.join(part.strip().lower() for part in combo.split('+') if part.strip())
+
+
+def format_combo(combo):
+    """Display form of a key combination, e.g. 'alt+shift+space' -> 'Alt+Shift+Space'."""
+    return '+'.join(part.capitalize() for part in normalize_combo(combo).split('+'))
+
+
+class HotkeyBackend:
+    """Source of global key combination events.
+
+    Backends call ``on_event(combo, pressed)`` from whatever thread their
+    hooks run on: ``pressed`` is True when the combination goes down (and
+    again on every auto-repeat while held) and False when it is released.
+    """
+
+    def __init__(self):
+        self.on_event = None
+        self.combos = []
+
+    def register(self, combo):
+        """Start reporting events for a key combination."""
+        self.combos.append(normalize_combo(combo))
+
+    def start(self, on_event):
+        """Begin delivering events to ``on_event(combo, pressed)``."""
+        self.on_event = on_event
+
+    def stop(self):
+        """Stop delivering events and release any hooks."""
+        self.on_event = None
+
+    def _emit(self, combo, pressed):
+        on_event = self.on_event
+        if on_event is not None:
+            on_event(combo, pressed)
+
+
+class KeyboardBackend(HotkeyBackend):
+    """Callback hooks from the ``keyboard`` package; no polling involved."""
+
+    def __init__(self):
+        super().__init__()
+        self.handles = []
+
+    def start(self, on_event):
+        super().start(on_event)
+        for combo in self.combos:
+            try:
+                self.handles.append(keyboard.add_hotkey(combo, self._emit, args=(combo, True)))
+                self.handles.append(keyboard.add_hotkey(
+                    combo, self._emit, args=(combo, False), trigger_on_release=True
+                ))
+            except Exception as e:
+                logger.error("Error registering hotkey %s: %r", combo, e)
+
+    def stop(self):
+        super().stop()
+        for handle in self.handles:
+            try:
+                keyboard.remove_hotkey(handle)
+            except (KeyError, ValueError):
+                pass
+        self.handles = []
+
+
+class SyntheticBackend(HotkeyBackend):
+    """Backend driven by explicit press()/release() calls, for tests and scripting."""
+
+    def press(self, combo):
+        """Report a key-down (or an auto-repeat) of a registered combination."""
+        combo = normalize_combo(combo)
+        if combo in self.combos:
+            self._emit(combo, True)
+
+    def release(self, combo):
+        """Report that a registered combination was released."""
+        combo = normalize_combo(combo)
+        if combo in self.combos:
+            self._emit(combo, False)
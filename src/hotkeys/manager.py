@@ -0,0 +1,85 @@
+import logging
+import threading
+import time
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from src.hotkeys.backend import KeyboardBackend, normalize_combo
+
+logger = logging.getLogger(__name__)
+
+
+class HotkeyManager(QObject):
+    """Maps global key combinations to named actions.
+
+    Backend events arrive on the backend's own thread; accepted presses are
+    re-emitted through the ``triggered`` signal, which Qt queues onto the
+    GUI thread. A combination fires once per physical press: auto-repeat
+    while it is held is ignored until it is released (or has been silent for
+    ``hold_timeout_ms``, in case a release was missed), and presses closer
+    together than ``debounce_ms`` are treated as one.
+    """
+
+    triggered = pyqtSignal(str)   # action name
+
+    def __init__(self, bindings, backend=None, debounce_ms=50, hold_timeout_ms=1000, parent=None):
+        """
+        Args:
+            bindings (dict): Action name -> key combination, e.g. {'process': 'alt+shift+space'}
+            backend (HotkeyBackend): Event source; defaults to KeyboardBackend
+            debounce_ms (int): Minimum time between two accepted presses of one combination
+            hold_timeout_ms (int): Treat a held combination as released after this much silence
+        """
+        super().__init__(parent)
+        self.backend = backend or KeyboardBackend()
+        self.debounce = debounce_ms / 1000.0
+        self.hold_timeout = hold_timeout_ms / 1000.0
+        self.actions = {}      # combo -> action name
+        self._held = {}        # combo -> time of the last key-down while held
+        self._accepted = {}    # combo -> time of the last accepted press
+        self._lock = threading.Lock()
+        for action, combo in bindings.items():
+            if not combo:
+                continue  # Unbound in config
+            combo = normalize_combo(combo)
+            if combo in self.actions:
+                logger.warning("Hotkey %s is bound to both '%s' and '%s'; keeping '%s'",
+                               combo, self.actions[combo], action, self.actions[combo])
+                continue
+            self.actions[combo] = action
+            self.backend.register(combo)
+
+    def binding(self, action):
+        """Key combination bound to an action, or None."""
+        for combo, name in self.actions.items():
+            if name == action:
+                return combo
+        return None
+
+    def start(self):
+        """Install the backend hooks."""
+        self.backend.start(self._on_event)
+
+    def stop(self):
+        """Remove the backend hooks."""
+        self.backend.stop()
+
+    def _on_event(self, combo, pressed):
+        """Backend thread: filter repeats and bounces, then signal the GUI thread."""
+        action = self.actions.get(combo)
+        if action is None:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if not pressed:
+                self._held.pop(combo, None)
+                return
+            last_down = self._held.get(combo)
+            self._held[combo] = now
+            if last_down is not None and now - last_down < self.hold_timeout:
+                return  # Auto-repeat while held
+            last_accepted = self._accepted.get(combo)
+            if last_accepted is not None and now - last_accepted < self.debounce:
+                return  # Contact bounce / duplicate hook delivery
+            self._accepted[combo] = now
+        self.triggered.emit(action)
@@ -0,0 +1,109 @@
+"""
+Asynchronous, leveled logging for StreamerOCR.
+
+Modules log through ``logging.getLogger(__name__)``. Records are handed to a
+queue and written by a background listener thread, so logging never blocks
+the capture/OCR/TTS threads on console or file I/O. The most recent records
+are also kept in memory for the log panel in the main window.
+"""
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+from collections import deque
+
+# Every module logger lives under the 'src' package logger
+ROOT_LOGGER = 'src'
+FORMAT = '%(asctime)s %(levelname)-7s %(name)s: %(message)s'
+
+_listener = None
+
+
+class RingBufferHandler(logging.Handler):
+    """Keeps the last ``capacity`` formatted records in memory.
+
+    Each record gets a sequence number so readers can fetch just the lines
+    added since they last looked.
+    """
+
+    def __init__(self, capacity=500):
+        super().__init__()
+        self.lines = deque(maxlen=capacity)
+        self.sequence = 0
+        self._lock = threading.Lock()
+
+    def emit(self, record):
+        try:
+            line = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+        with self._lock:
+            self.sequence += 1
+            self.lines.append((self.sequence, line))
+
+    def since(self, sequence=0):
+        """
+        Lines logged after a sequence number.
+
+        Returns:
+            tuple: (newest sequence number, list of formatted lines)
+        """
+        with self._lock:
+            return self.sequence, [line for seq, line in self.lines if seq > sequence]
+
+
+ring_buffer = RingBufferHandler()
+
+
+def setup_logging(config=None):
+    """
+    Route all StreamerOCR loggers through a queue to a background listener.
+
+    Args:
+        config (dict): The 'logging' config section; keys 'level', 'console',
+            'file' and 'ring_size'. Missing keys use the defaults.
+
+    Returns:
+        logging.Logger: The package root logger
+    """
+    global _listener
+    config = config or {}
+    shutdown_logging()
+
+    formatter = logging.Formatter(FORMAT, datefmt='%H:%M:%S')
+    ring_buffer.lines = deque(ring_buffer.lines, maxlen=config.get('ring_size', 500))
+    ring_buffer.setFormatter(formatter)
+    handlers = [ring_buffer]
+    # Windowed (e.g. PyInstaller) builds have no console to write to
+    if config.get('console', True) and sys.stderr is not None:
+        console = logging.StreamHandler(sys.stderr)
+        console.setFormatter(formatter)
+        handlers.append(console)
+    if config.get('file'):
+        file_handler = logging.handlers.RotatingFileHandler(
+            config['file'], maxBytes=1024 * 1024, backupCount=3, encoding='utf-8'
+        )
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+
+    records = queue.SimpleQueue()
+    root = logging.getLogger(ROOT_LOGGER)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(records))
+    root.setLevel(config.get('level', 'INFO').upper())
+    root.propagate = False
+
+    _listener = logging.handlers.QueueListener(records, *handlers, respect_handler_level=True)
+    _listener.start()
+    return root
+
+
+def shutdown_logging():
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -1,123 +1,243 @@
+import time
+
+# Start of the import phase for --profile-startup
+_IMPORT_START = time.perf_counter()
+
 import sys
 import os
 import json
-import keyboard
+import logging
 import warnings
+import argparse
 
 # Add the project root directory to Python path
 sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
 
 from PyQt5.QtWidgets import (QApplication, QWidget, QVBoxLayout, QPushButton, 
                            QLabel, QStyle, QMessageBox, QListWidget, QInputDialog,
-                           QHBoxLayout, QListWidgetItem, QComboBox)
-from PyQt5.QtGui import QIcon, QPainter, QColor, QFont
-from PyQt5.QtCore import Qt, QTimer, QRect
+                           QHBoxLayout, QListWidgetItem, QComboBox,
+                           QPlainTextEdit)
+from PyQt5.QtGui import QIcon, QFont
+from PyQt5.QtCore import QTimer
 
 # Filter out the deprecation warning
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 
+from src.config import load_config
+from src.gui.geometry import ScreenGeometry
+from src.gui.overlay import OverlayWindow
 from src.gui.region_selector import RegionSelector
-from src.ocr.processor import OCRProcessor
-from src.tts.speaker import TTSSpeaker
+from src.history import HistoryStore
+from src.hotkeys.backend import format_combo
+from src.hotkeys.manager import HotkeyManager
+from src.log import ring_buffer, setup_logging, shutdown_logging
+from src.metrics import metrics
+from src.ocr.profile import PROFILE_PRESETS, OCRProfile, preset_name
+from src.pipeline.scheduler import WatchScheduler
+from src.pipeline.text_diff import TextDiffer
+from src.pipeline.worker import JobState, OCRPipeline
+from src.startup import BackgroundInit, Readiness, StartupProfile
 
-class OverlayWindow(QWidget):
-    def __init__(self):
-        super().__init__()
-        self.setWindowFlags(
-            Qt.FramelessWindowHint | 
-            Qt.WindowStaysOnTopHint | 
-            Qt.Tool
-        )
-        self.setAttribute(Qt.WA_TranslucentBackground)
-        self.setAttribute(Qt.WA_TransparentForMouseEvents)
-        self.text = ""
-        self.font_size = 20
-        self.text_color = QColor(255, 255, 255)  # White text
-        self.bg_color = QColor(0, 0, 0, 180)  # Semi-transparent black background
-        self.padding = 10
-        self.show()
-
-    def set_text(self, text):
-        self.text = text
-        self.update_geometry()
-        self.update()
-
-    def update_geometry(self):
-        if not self.text:
-            return
-            
-        # Create a temporary painter to measure text
-        painter = QPainter()
-        font = QFont()
-        font.setPointSize(self.font_size)
-        painter.setFont(font)
-        
-        # Calculate text dimensions
-        text_rect = painter.boundingRect(
-            QRect(0, 0, 1000, 1000),
-            Qt.TextWordWrap,
-            self.text
-        )
-        
-        # Set window size with padding
-        width = text_rect.width() + (2 * self.padding)
-        height = text_rect.height() + (2 * self.padding)
-        
-        # Position in top-right corner of primary screen
-        screen_geometry = QApplication.primaryScreen().geometry()
-        x = screen_geometry.width() - width - 20  # 20px from right edge
-        y = 20  # 20px from top
-        
-        self.setGeometry(x, y, width, height)
+# numpy, PIL, mss, pytesseract and pyttsx3 are imported by the start-up
+# threads (see StreamerOCR._init_ocr/_init_tts), not here
 
-    def paintEvent(self, event):
-        if not self.text:
-            return
-            
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Draw background
-        painter.fillRect(self.rect(), self.bg_color)
-        
-        # Draw text
-        painter.setPen(self.text_color)
-        font = QFont()
-        font.setPointSize(self.font_size)
-        painter.setFont(font)
-        
-        painter.drawText(
-            self.rect().adjusted(self.padding, self.padding, -self.padding, -self.padding),
-            Qt.TextWordWrap,
-            self.text
-        )
+_IMPORT_END = time.perf_counter()
+
+# This file runs as __main__, so name its logger after the module explicitly
+logger = logging.getLogger('src.main')
+
+# Hotkey actions in the order they are listed, with their descriptions
+HOTKEY_ACTIONS = {
+    'process': 'Process selected region',
+    'process_all': 'Process all regions',
+    'select': 'Select new region',
+    'watch': 'Toggle watch mode',
+    'cancel': 'Cancel current job',
+    'quit': 'Exit application',
+}
 
 class StreamerOCR(QWidget):
-    def __init__(self):
+    def __init__(self, config=None, profile=None):
         super().__init__()
-        print("Initializing StreamerOCR...")
+        logger.info("Initializing StreamerOCR...")
         
-        self.ocr = OCRProcessor()
-        self.tts = TTSSpeaker()
+        self.config = config or load_config()
+        self.profile = profile or StartupProfile()
+        # Built in the background by self.startup; see on_subsystem_state
+        self.ocr = None
+        self.tts = None
+        self.pipeline = None
+        self.make_detector = None
+        self.ready = False
+        self.deferred = []  # Actions requested before start-up finished
         self.regions = {}  # Dictionary to store named regions
         self.current_region_name = None
         self.selector = None
-        self.processing = False
-        self.overlay = OverlayWindow()
+        self.batch_names = set()  # Pipeline names of batches submitted so far
+        self.frames_skipped = 0
+        self.text_differs = {}  # Watched region name -> TextDiffer
+        watch_config = self.config['watch']
+        # Captures watched regions, each at its own adaptive rate
+        self.scheduler = WatchScheduler(
+            self.watch_region,
+            min_interval_ms=watch_config['interval_ms'],
+            max_interval_ms=watch_config['max_interval_ms'],
+            backoff=watch_config['backoff'],
+            max_fps=watch_config['max_fps'],
+            cpu_budget=watch_config['cpu_budget'],
+            parent=self
+        )
+        overlay_config = self.config['overlay']
+        self.overlay = OverlayWindow(
+            font_size=overlay_config['font_size'],
+            max_width=overlay_config['max_width'],
+            max_lines=overlay_config['max_lines']
+        )
+        hotkey_config = self.config['hotkeys']
+        self.hotkeys = HotkeyManager(
+            hotkey_config['bindings'],
+            debounce_ms=hotkey_config['debounce_ms'],
+            parent=self
+        )
+        self.hotkeys.triggered.connect(self.on_hotkey)
+        # Every OCR result goes to the searchable history, written in the background
+        self.history = None
+        if self.config['history']['enabled']:
+            self.history = HistoryStore.from_config(self.config['history'])
+        # Monitor layout and scaling, re-read when displays change
+        self.screen_geometry = ScreenGeometry(parent=self)
+        self.screen_geometry.changed.connect(self.on_screens_changed)
         self.init_ui()
         self.setup_hotkeys()
         self.load_regions()
         
-        # Setup processing timer
-        self.process_timer = QTimer()
-        self.process_timer.timeout.connect(self.check_hotkeys)
-        self.process_timer.start(100)  # Check every 100ms
+        # Tesseract, screen capture and speech start in parallel while the
+        # window is already usable
+        self.startup = BackgroundInit(self.profile, parent=self)
+        self.startup.add('ocr', self._init_ocr)
+        self.startup.add('tts', self._init_tts)
+        self.startup.state_changed.connect(self.on_subsystem_state)
+        self.status_label.setText("Starting OCR and speech...")
+        self.startup.start()
+        
+        # Refresh the stats panel and the metrics export file
+        self.stats_timer = QTimer()
+        self.stats_timer.timeout.connect(self.update_stats)
+        self.stats_timer.start(1000)
+        self.last_metrics_export = 0.0
+        self.log_sequence = 0
         
-        print("StreamerOCR initialized successfully")
-        print("Hotkeys:")
-        print("- Alt+Shift+Space: Process selected region")
-        print("- Alt+Shift+M: Select new region")
-        print("- Alt+Shift+N: Exit application")
+        logger.info("StreamerOCR initialized successfully")
+
+    def _init_ocr(self):
+        """Start-up thread: import and initialize OCR engines and screen capture."""
+        with self.profile.phase('ocr', 'import'):
+            from src.ocr.change_detector import ChangeDetector
+            from src.ocr.preprocess import PRESETS
+            from src.ocr.processor import OCRProcessor
+        with self.profile.phase('ocr', 'init'):
+            watch_config = self.config['watch']
+
+            def make_detector():
+                return ChangeDetector(
+                    threshold=watch_config['threshold'],
+                    downsample=watch_config['downsample'],
+                    block_size=watch_config['block_size'],
+                    pixel_delta=watch_config['pixel_delta']
+                )
+
+            return OCRProcessor(self.config), make_detector, list(PRESETS)
+
+    def _init_tts(self):
+        """Start-up thread: import and initialize the speech engine."""
+        tts_config = self.config['tts']
+        with self.profile.phase('tts', 'import'):
+            from src.tts.cache import SpeechCache, find_player
+            from src.tts.speaker import TTSSpeaker
+        with self.profile.phase('tts', 'init'):
+            cache = player = None
+            if tts_config['cache_dir']:
+                player = find_player()
+                if player is None:
+                    logger.warning("No way to play audio files found; speech cache disabled")
+                else:
+                    cache = SpeechCache(tts_config['cache_dir'],
+                                        max_bytes=tts_config['cache_mb'] * 1024 * 1024)
+            speaker = TTSSpeaker(
+                max_queue=tts_config['max_queue'],
+                barge_in=tts_config['barge_in'],
+                cache=cache,
+                player=player,
+                cache_after=tts_config['cache_after'],
+                chunk_chars=tts_config['chunk_chars']
+            )
+        if cache is not None and self.history is not None and tts_config['prewarm']:
+            # Queried and rendered on the speech thread while it is idle, so
+            # neither the history query nor rendering delays start-up
+            history, limit = self.history, tts_config['prewarm']
+            speaker.prewarm(lambda: [text for text, count in history.frequent(limit)])
+        return speaker
+
+    def on_subsystem_state(self, name, state):
+        """Wire up the pipeline once OCR and speech are both ready."""
+        logger.debug("Subsystem %s: %s", name, state)
+        if state == Readiness.FAILED:
+            self.deferred.clear()
+            self.status_label.setText(f"Failed to start {name}")
+            QMessageBox.critical(
+                self,
+                "StreamerOCR",
+                f"Failed to start {name}: {self.startup.errors.get(name)}",
+                QMessageBox.Ok
+            )
+            return
+        if state != Readiness.READY or self.ready or not self.startup.all_ready():
+            return
+
+        self.ocr, self.make_detector, preprocess_presets = self.startup.result('ocr')
+        self.tts = self.startup.result('tts')
+        self.pipeline = OCRPipeline(self.ocr, self.tts, parent=self)
+        self.pipeline.text_ready.connect(self.on_text_ready)
+        self.pipeline.job_finished.connect(self.on_job_finished)
+        self.pipeline.state_changed.connect(self.on_job_state_changed)
+        self.preprocess_combo.blockSignals(True)
+        for preset in preprocess_presets:
+            self.preprocess_combo.addItem(preset, preset)
+        self.preprocess_combo.blockSignals(False)
+        self.update_preprocess_combo()
+        self.ready = True
+        self.profile.mark('ready')
+        logger.info("OCR and speech ready")
+        if self.current_region_name:
+            self.status_label.setText(f"Region selected: {self.current_region_name}")
+        else:
+            self.status_label.setText("No region selected")
+
+        # Run what was asked for while starting, in order
+        deferred, self.deferred = self.deferred, []
+        for action, args in deferred:
+            action(*args)
+
+        if self.profile.enabled:
+            print("=== Startup profile ===")
+            for line in self.profile.report():
+                print(line)
+
+    def when_ready(self, action, *args):
+        """Run an action now, or queue it until start-up has finished."""
+        if self.ready:
+            action(*args)
+            return
+        failed = self.startup.failed()
+        if failed:
+            # Start-up will never finish, so the action could never run
+            reason = "; ".join(f"failed to start {name}: {self.startup.errors.get(name)}"
+                               for name in failed)
+            logger.warning("Cannot run %s, %s", action.__name__, reason)
+            self.status_label.setText(f"Failed to start {', '.join(failed)}")
+            return
+        logger.info("Still starting up; %s will run when ready", action.__name__)
+        self.deferred.append((action, args))
 
     def init_ui(self):
         """Initialize the user interface."""
@@ -127,12 +247,7 @@ class StreamerOCR(QWidget):
         layout = QVBoxLayout()
         
         # Add hotkey information
-        hotkey_label = QLabel(
-            "Hotkeys:\n"
-            "Alt+Shift+Space: Process region\n"
-            "Alt+Shift+M: Select region\n"
-            "Alt+Shift+N: Exit"
-        )
+        hotkey_label = QLabel("Hotkeys:\n" + "\n".join(self.hotkey_help()))
         layout.addWidget(hotkey_label)
         
         # Monitor selection
@@ -164,27 +279,149 @@ class StreamerOCR(QWidget):
         delete_btn.clicked.connect(self.delete_region)
         buttons_layout.addWidget(delete_btn)
         
+        group_btn = QPushButton("Group")
+        group_btn.clicked.connect(self.set_region_group)
+        buttons_layout.addWidget(group_btn)
+        
         layout.addLayout(buttons_layout)
         
+        # Process many regions from one screen grab
+        batch_layout = QHBoxLayout()
+        
+        process_all_btn = QPushButton("Process All")
+        process_all_btn.clicked.connect(lambda: self.when_ready(self.process_all_regions))
+        batch_layout.addWidget(process_all_btn)
+        
+        process_group_btn = QPushButton("Process Group")
+        process_group_btn.clicked.connect(lambda: self.when_ready(self.process_current_group))
+        batch_layout.addWidget(process_group_btn)
+        
+        layout.addLayout(batch_layout)
+        
+        # Preprocessing preset for the current region (filled in once OCR is ready)
+        preprocess_layout = QHBoxLayout()
+        preprocess_layout.addWidget(QLabel("Preprocess:"))
+        self.preprocess_combo = QComboBox()
+        self.preprocess_combo.currentIndexChanged.connect(self.on_preprocess_changed)
+        preprocess_layout.addWidget(self.preprocess_combo)
+        layout.addLayout(preprocess_layout)
+        
+        # Tesseract settings (page layout, character whitelist...) for the current region
+        profile_layout = QHBoxLayout()
+        profile_layout.addWidget(QLabel("OCR profile:"))
+        self.profile_combo = QComboBox()
+        for preset in PROFILE_PRESETS:
+            self.profile_combo.addItem(preset, preset)
+        self.profile_combo.currentIndexChanged.connect(self.on_profile_changed)
+        profile_layout.addWidget(self.profile_combo)
+        layout.addLayout(profile_layout)
+        
+        job_layout = QHBoxLayout()
+        
+        self.watch_btn = QPushButton("Start Watching")
+        self.watch_btn.clicked.connect(lambda: self.when_ready(self.toggle_watch))
+        job_layout.addWidget(self.watch_btn)
+        
+        cancel_btn = QPushButton("Cancel")
+        cancel_btn.clicked.connect(self.cancel_current_job)
+        job_layout.addWidget(cancel_btn)
+        
+        layout.addLayout(job_layout)
+        
         self.status_label = QLabel("No region selected")
         layout.addWidget(self.status_label)
         
+        # Live latency percentiles and counters
+        self.stats_label = QLabel("")
+        self.stats_label.setFont(QFont("Consolas", 8))
+        self.stats_label.setVisible(self.config['metrics']['show_panel'])
+        layout.addWidget(self.stats_label)
+        
+        # Recent log records, kept in memory by the logging subsystem
+        self.log_view = QPlainTextEdit()
+        self.log_view.setReadOnly(True)
+        self.log_view.setMaximumBlockCount(self.config['logging']['ring_size'])
+        self.log_view.setFont(QFont("Consolas", 8))
+        self.log_view.setFixedHeight(90)
+        self.log_view.setVisible(self.config['logging']['show_panel'])
+        layout.addWidget(self.log_view)
+        
         self.setLayout(layout)
         self.update_region_list()
+        self.update_preprocess_combo()
+        self.update_profile_combo()
 
     def update_monitor_list(self):
         """Update the monitor selection combo box."""
+        selected = self.monitor_combo.currentData()
         self.monitor_combo.clear()
-        screens = QApplication.screens()
-        for i, screen in enumerate(screens, 1):
-            self.monitor_combo.addItem(f"Monitor {i} ({screen.size().width()}x{screen.size().height()})", i-1)
+        for monitor in self.screen_geometry.monitors:
+            x, y, width, height = monitor.physical
+            self.monitor_combo.addItem(f"Monitor {monitor.index + 1} ({width}x{height})", monitor.index)
+        if selected is not None and selected < self.monitor_combo.count():
+            self.monitor_combo.setCurrentIndex(selected)
+
+    def on_screens_changed(self):
+        """A display was added, removed, moved or rescaled."""
+        logger.info("Screen layout changed: %s", self.screen_geometry.monitors)
+        self.update_monitor_list()
+        if self.ocr is not None:
+            self.ocr.refresh_monitors()
+
+    def update_preprocess_combo(self):
+        """Show the preprocessing preset of the current region."""
+        region_data = self.regions.get(self.current_region_name, {})
+        preset = region_data.get('preprocess')
+        if not isinstance(preset, str):
+            preset = 'none'  # Custom step lists are edited in regions.json
+        index = self.preprocess_combo.findData(preset)
+        self.preprocess_combo.blockSignals(True)
+        self.preprocess_combo.setCurrentIndex(max(index, 0))
+        self.preprocess_combo.blockSignals(False)
+
+    def on_preprocess_changed(self, index):
+        """Store the chosen preprocessing preset on the current region."""
+        if self.current_region_name not in self.regions or index < 0:
+            return
+        preset = self.preprocess_combo.itemData(index)
+        self.regions[self.current_region_name]['preprocess'] = None if preset == 'none' else preset
+        self.save_regions()
+
+    def update_profile_combo(self):
+        """Show the OCR profile preset of the current region."""
+        region_data = self.regions.get(self.current_region_name, {})
+        profile = OCRProfile.from_dict(region_data.get('profile'))
+        index = self.profile_combo.findData(preset_name(profile))
+        if index < 0:
+            # Custom profiles are edited in regions.json; show them as such
+            index = self.profile_combo.findData('custom')
+            if index < 0:
+                self.profile_combo.addItem('custom', 'custom')
+                index = self.profile_combo.count() - 1
+        self.profile_combo.blockSignals(True)
+        self.profile_combo.setCurrentIndex(index)
+        self.profile_combo.blockSignals(False)
+
+    def on_profile_changed(self, index):
+        """Store the chosen OCR profile preset on the current region."""
+        if self.current_region_name not in self.regions:
+            return
+        preset = self.profile_combo.itemData(index)
+        if preset not in PROFILE_PRESETS:
+            return
+        self.regions[self.current_region_name]['profile'] = PROFILE_PRESETS[preset].to_dict()
+        self.save_regions()
 
     def update_region_list(self):
         """Update the region list widget with current regions."""
         self.region_list.clear()
         for name in self.regions:
             monitor_index = self.regions[name]['monitor']
-            item = QListWidgetItem(f"{name} (Monitor {monitor_index + 1})")
+            group = self.regions[name].get('group')
+            label = f"{name} (Monitor {monitor_index + 1})"
+            if group:
+                label += f" [{group}]"
+            item = QListWidgetItem(label)
             self.region_list.addItem(item)
             if name == self.current_region_name:
                 item.setSelected(True)
@@ -198,7 +435,8 @@ class StreamerOCR(QWidget):
         """Open the region selector."""
         if self.selector is None or not self.selector.isVisible():
             selected_screen = self.get_selected_screen()
-            self.selector = RegionSelector(selected_screen)
+            self.selector = RegionSelector(selected_screen,
+                                           freeze=self.config['selector']['freeze'])
             self.selector.region_selected.connect(self.on_region_selected)
             self.selector.show()
 
@@ -213,17 +451,27 @@ class StreamerOCR(QWidget):
             )
             
             if ok and name:
-                # Store region with monitor information
+                # Store region with monitor information, in physical pixels
                 screen_index = self.monitor_combo.currentData()
+                region = self.screen_geometry.to_physical(region, screen_index)
                 self.regions[name] = {
                     'region': region,
-                    'monitor': screen_index
+                    'monitor': screen_index,
+                    'physical': True,
+                    'profile': OCRProfile().to_dict()
                 }
                 self.current_region_name = name
+                if name in self.scheduler:
+                    # Same name, new rectangle: start over
+                    self.scheduler.reset(name)
+                    self.text_differs[name].reset()
+                self.update_watch_button()
                 self.status_label.setText(f"Region selected: {name} (Monitor {screen_index + 1})")
                 self.save_regions()
                 self.update_region_list()
-                print(f"Region '{name}' selected and saved: {region} on Monitor {screen_index + 1}")
+                self.update_preprocess_combo()
+                self.update_profile_combo()
+                logger.info("Region '%s' selected and saved: %s on Monitor %d", name, region, screen_index + 1)
                 
                 # Close the selector
                 if self.selector:
@@ -253,9 +501,27 @@ class StreamerOCR(QWidget):
                 self.regions[new_name] = self.regions.pop(old_name)
                 if self.current_region_name == old_name:
                     self.current_region_name = new_name
+                if old_name in self.scheduler:
+                    self.unwatch(old_name)
+                    self.watch(new_name)
                 self.save_regions()
                 self.update_region_list()
 
+    def set_region_group(self):
+        """Assign the current region to a named group for batch processing."""
+        if self.current_region_name not in self.regions:
+            return
+        region_data = self.regions[self.current_region_name]
+        group, ok = QInputDialog.getText(
+            self, 'Region Group',
+            'Enter a group name (empty for none):',
+            text=region_data.get('group') or ''
+        )
+        if ok:
+            region_data['group'] = group.strip() or None
+            self.save_regions()
+            self.update_region_list()
+
     def delete_region(self):
         """Delete the currently selected region."""
         current_item = self.region_list.currentItem()
@@ -273,6 +539,8 @@ class StreamerOCR(QWidget):
                     # Remove the region from the dictionary
                     if name in self.regions:
                         del self.regions[name]
+                        if name in self.scheduler:
+                            self.unwatch(name)
                         
                         # Update current region if needed
                         if self.current_region_name == name:
@@ -285,11 +553,11 @@ class StreamerOCR(QWidget):
                         # Update the UI
                         self.update_region_list()
                         
-                        print(f"Region '{name}' deleted successfully")
+                        logger.info("Region '%s' deleted successfully", name)
                     else:
-                        print(f"Region '{name}' not found in regions dictionary")
+                        logger.warning("Region '%s' not found in regions dictionary", name)
                 except Exception as e:
-                    print(f"Error deleting region: {e}")
+                    logger.error("Error deleting region: %s", e)
                     QMessageBox.critical(
                         self,
                         "Error",
@@ -309,9 +577,9 @@ class StreamerOCR(QWidget):
             # Save to file
             with open('regions.json', 'w') as f:
                 json.dump(save_data, f, indent=4)
-            print("Regions saved successfully")
+            logger.debug("Regions saved successfully")
         except Exception as e:
-            print(f"Error saving regions: {e}")
+            logger.error("Error saving regions: %s", e)
             QMessageBox.critical(
                 self,
                 "Error",
@@ -326,17 +594,26 @@ class StreamerOCR(QWidget):
                 with open('regions.json', 'r') as f:
                     data = json.load(f)
                     self.regions = data.get('regions', {})
+                    converted = False
+                    for region_data in self.regions.values():
+                        # Regions saved before profiles existed use the defaults
+                        region_data['profile'] = OCRProfile.from_dict(region_data.get('profile')).to_dict()
+                        converted |= self.upgrade_region(region_data)
                     self.current_region_name = data.get('current_region_name')
                     if self.current_region_name:
                         self.status_label.setText(f"Region loaded: {self.current_region_name}")
-                        print(f"Loaded saved region: {self.current_region_name}")
-                    print(f"Loaded {len(self.regions)} regions")
+                        logger.info("Loaded saved region: %s", self.current_region_name)
+                    logger.info("Loaded %d regions", len(self.regions))
+                    self.update_preprocess_combo()
+                    self.update_profile_combo()
+                if converted:
+                    self.save_regions()
             else:
-                print("No saved regions found")
+                logger.info("No saved regions found")
                 self.regions = {}
                 self.current_region_name = None
         except Exception as e:
-            print(f"Error loading regions: {e}")
+            logger.error("Error loading regions: %s", e)
             QMessageBox.critical(
                 self,
                 "Error",
@@ -346,14 +623,29 @@ class StreamerOCR(QWidget):
             self.regions = {}
             self.current_region_name = None
 
+    def upgrade_region(self, region_data):
+        """
+        Convert a region saved in logical pixels to physical pixels.
+
+        Returns:
+            bool: True if the region was converted
+        """
+        if region_data.get('physical'):
+            return False
+        monitors = self.screen_geometry.monitors
+        monitor_index = region_data.get('monitor', 0)
+        if monitor_index >= len(monitors):
+            # Converted once its monitor is connected again
+            return False
+        region_data['region'] = monitors[monitor_index].to_physical(region_data['region'])
+        region_data['physical'] = True
+        return True
+
     def process_current_region(self):
-        """Process the currently selected region with OCR and TTS."""
-        if self.processing:
-            return
-            
-        print("\nProcessing current region...")
+        """Queue the currently selected region for OCR and TTS."""
+        logger.debug("Processing current region...")
         if not self.current_region_name or self.current_region_name not in self.regions:
-            print("No region selected!")
+            logger.warning("No region selected!")
             QMessageBox.warning(
                 self,
                 "StreamerOCR",
@@ -362,58 +654,272 @@ class StreamerOCR(QWidget):
             )
             return
 
-        self.processing = True
         region_data = self.regions[self.current_region_name]
         region = region_data['region']
         monitor_index = region_data['monitor']
         
-        print(f"Capturing region: {region} from Monitor {monitor_index + 1}")
-        
-        try:
-            text = self.ocr.process_region(region, monitor_index)
-            print(f"OCR Result: {text}")
-            
-            if text and text.strip():
-                print("Text found, converting to speech...")
-                self.tts.speak(text)
-                # Update overlay with the text
-                self.overlay.set_text(text)
-            else:
-                print("No text found in the region")
-                self.overlay.set_text("")  # Clear overlay
-                QMessageBox.information(
-                    self,
-                    "StreamerOCR",
-                    "No text found in the selected region.",
-                    QMessageBox.Ok
-                )
-        except Exception as e:
-            print(f"Error processing region: {e}")
+        logger.debug("Capturing region: %s from Monitor %d", region, monitor_index + 1)
+        self.pipeline.submit(
+            self.current_region_name,
+            region,
+            monitor_index,
+            preprocess=region_data.get('preprocess'),
+            profile=region_data.get('profile')
+        )
+
+    def process_all_regions(self, group=None):
+        """
+        Queue every saved region (or every region of a group) as one batch.
+
+        Each monitor involved is grabbed once and the regions are OCR'd in
+        parallel; the results are read out prefixed with their region names.
+        """
+        regions = {
+            name: data for name, data in self.regions.items()
+            if group is None or data.get('group') == group
+        }
+        if not regions:
+            QMessageBox.warning(
+                self,
+                "StreamerOCR",
+                "No regions to process! Please select a region first.",
+                QMessageBox.Ok
+            )
+            return
+
+        batch_name = f"group:{group}" if group else "all regions"
+        logger.debug("Processing %d regions (%s)...", len(regions), batch_name)
+        self.batch_names.add(batch_name)
+        self.pipeline.submit_batch(batch_name, regions)
+
+    def process_current_group(self):
+        """Queue all regions sharing the current region's group as one batch."""
+        region_data = self.regions.get(self.current_region_name, {})
+        group = region_data.get('group')
+        if not group:
+            QMessageBox.warning(
+                self,
+                "StreamerOCR",
+                "The selected region is not in a group. Use 'Group' to assign one.",
+                QMessageBox.Ok
+            )
+            return
+        self.process_all_regions(group)
+
+    def on_text_ready(self, job):
+        """Show and speak OCR results delivered by the pipeline."""
+        text = job.text
+        logger.debug("OCR Result: %r", text)
+        self.record_history(job)
+
+        if job.source == 'watch':
+            differ = self.text_differs.get(job.region_name)
+            if differ is None:
+                return  # No longer watched
+            # Only pass on lines that were not already read out
+            if self.config['watch']['incremental']:
+                text = differ.diff(text)
+            if not text:
+                return
+
+        if text and text.strip():
+            logger.debug("Text found, converting to speech...")
+            # Update overlay with the text
+            self.overlay.set_text(text)
+            self.pipeline.speak(job, text)
+        else:
+            logger.debug("No text found in the region")
+            self.overlay.set_text("")  # Clear overlay
+            QMessageBox.information(
+                self,
+                "StreamerOCR",
+                "No text found in the selected region.",
+                QMessageBox.Ok
+            )
+
+    def record_history(self, job):
+        """Queue a job's results for the history database (never blocks)."""
+        if self.history is None:
+            return
+        ms = round((time.perf_counter() - job.created) * 1000, 1)
+        results = job.results if job.regions is not None else {job.region_name: job.text}
+        for name, text in results.items():
+            text = text.strip()
+            if text:
+                self.history.record(name, text, ms=ms, source=job.source)
+
+    def on_job_finished(self, job):
+        """Handle jobs that were skipped or failed in the pipeline."""
+        if job.region_name in self.scheduler:
+            # Any finished capture of a watched region (watch or hotkey) paces its polling
+            self.scheduler.on_result(job.region_name, job.state == JobState.DONE,
+                                     time.perf_counter() - job.created)
+        if job.state == JobState.SKIPPED:
+            self.frames_skipped += 1
+        elif job.state == JobState.FAILED:
+            logger.error("Error processing region: %s", job.error)
+            if job.source == 'watch':
+                return
             self.overlay.set_text("")  # Clear overlay
             QMessageBox.critical(
                 self,
                 "StreamerOCR",
-                f"Error processing region: {str(e)}",
+                f"Error processing region: {job.error}",
+                QMessageBox.Ok
+            )
+
+    def on_job_state_changed(self, region_name, state):
+        """Reflect the pipeline state of the current region in the status label."""
+        if region_name != self.current_region_name or region_name in self.scheduler:
+            return
+        if state in (JobState.RUNNING, JobState.QUEUED):
+            self.status_label.setText(f"Processing: {region_name}")
+        else:
+            self.status_label.setText(f"Region selected: {region_name}")
+
+    def cancel_current_job(self):
+        """Cancel the in-flight OCR/TTS job for the current region and any batches."""
+        if not self.ready:
+            # Nothing is running yet; drop what was queued during start-up
+            self.deferred.clear()
+            return
+        for batch_name in self.batch_names:
+            self.pipeline.cancel(batch_name)
+        if self.current_region_name:
+            self.pipeline.cancel(self.current_region_name)
+            logger.info("Cancelled job for region: %s", self.current_region_name)
+
+    def toggle_watch(self):
+        """Start or stop continuously watching the current region."""
+        name = self.current_region_name
+        if name in self.scheduler:
+            self.unwatch(name)
+            return
+
+        if not name or name not in self.regions:
+            QMessageBox.warning(
+                self,
+                "StreamerOCR",
+                "No region selected! Please select a region first.",
                 QMessageBox.Ok
             )
-        finally:
-            self.processing = False
+            return
+        self.watch(name)
+
+    def watch(self, name):
+        """Add a region to the watch scheduler."""
+        watch_config = self.config['watch']
+        self.text_differs[name] = TextDiffer(similarity=watch_config['similarity'])
+        # Regions can be given a 'priority' in regions.json; higher polls faster
+        priority = self.regions[name].get('priority', 1.0)
+        self.scheduler.add(name, priority, self.make_detector())
+        self.update_watch_button()
+        logger.info("Watching region: %s (priority %s)", name, priority)
+
+    def unwatch(self, name):
+        """Stop watching a region."""
+        schedule = self.scheduler.remove(name)
+        self.text_differs.pop(name, None)
+        self.update_watch_button()
+        logger.info("Stopped watching %s (%d of %d captures changed)",
+                    name, schedule.changes, schedule.polls)
+
+    def update_watch_button(self):
+        if self.current_region_name in self.scheduler:
+            self.watch_btn.setText("Stop Watching")
+        else:
+            self.watch_btn.setText("Start Watching")
+
+    def watch_region(self, name, detector):
+        """Scheduler callback: capture a watched region; OCR runs only if its pixels changed."""
+        region_data = self.regions.get(name)
+        if region_data is None:
+            self.scheduler.remove(name)
+            return
+        self.pipeline.submit(
+            name,
+            region_data['region'],
+            region_data['monitor'],
+            source='watch',
+            detector=detector,
+            preprocess=region_data.get('preprocess'),
+            profile=region_data.get('profile')
+        )
+
+    def hotkey_help(self):
+        """Lines describing the configured hotkeys, e.g. 'Alt+Shift+W: Toggle watch mode'."""
+        lines = []
+        for action, description in HOTKEY_ACTIONS.items():
+            combo = self.hotkeys.binding(action)
+            if combo:
+                lines.append(f"{format_combo(combo)}: {description}")
+        return lines
 
     def setup_hotkeys(self):
         """Setup the global hotkeys."""
-        print("Setting up hotkeys...")
-        print("- Alt+Shift+Space: Process selected region")
-        print("- Alt+Shift+M: Select new region")
-        print("- Alt+Shift+N: Exit application")
-
-    def check_hotkeys(self):
-        """Check if hotkeys are pressed."""
-        if not self.processing and keyboard.is_pressed('alt+shift+space'):
-            self.process_current_region()
-        elif keyboard.is_pressed('alt+shift+m'):
-            self.select_region()
-        elif keyboard.is_pressed('alt+shift+n'):
-            self.quit_application()
+        logger.info("Setting up hotkeys...")
+        for line in self.hotkey_help():
+            logger.info("- %s", line)
+        self.hotkeys.start()
+
+    def on_hotkey(self, action):
+        """Run the action bound to a global hotkey (delivered on the GUI thread)."""
+        handlers = {
+            'process': self.process_current_region,
+            'process_all': self.process_all_regions,
+            'select': self.select_region,
+            'watch': self.toggle_watch,
+            'cancel': self.cancel_current_job,
+            'quit': self.quit_application,
+        }
+        # These need OCR; presses during start-up are queued, not dropped
+        needs_ocr = {'process', 'process_all', 'watch'}
+        handler = handlers.get(action)
+        if handler is None:
+            return
+        if action in needs_ocr:
+            self.when_ready(handler)
+        else:
+            handler()
+
+    def update_stats(self):
+        """Refresh the stats and log panels and, when configured, the metrics export file."""
+        metrics_config = self.config['metrics']
+        export_path = metrics_config['export_path']
+        now = time.monotonic()
+        if export_path and now - self.last_metrics_export >= metrics_config['export_interval_s']:
+            self.last_metrics_export = now
+            try:
+                metrics.export(export_path)
+            except OSError as e:
+                logger.error("Error exporting metrics: %s", e)
+
+        if self.config['logging']['show_panel']:
+            self.log_sequence, lines = ring_buffer.since(self.log_sequence)
+            for line in lines:
+                self.log_view.appendPlainText(line)
+
+        if not metrics_config['show_panel']:
+            return
+        snapshot = metrics.snapshot()
+        latency = snapshot['latency_ms']
+        counters = snapshot['counters']
+        stages = []
+        for name, label in (('capture', 'capture'), ('preprocess', 'prep'), ('ocr', 'ocr'),
+                            ('tts_utterance', 'tts'), ('job', 'job')):
+            if name in latency:
+                stats = latency[name]
+                stages.append(f"{label} {stats['p50']:.1f}/{stats['p95']:.1f}")
+        hits = counters.get('cache_hits', 0)
+        lookups = hits + counters.get('cache_misses', 0)
+        hit_rate = f"{100 * hits / lookups:.0f}%" if lookups else "-"
+        self.stats_label.setText(
+            "p50/p95 ms: " + (" | ".join(stages) or "no data yet") + "\n"
+            f"frames {counters.get('frames', 0)} | cache hits {hit_rate} | "
+            f"skipped {counters.get('frames_skipped', 0)}"
+            + "".join(f"\nwatch {name}: every {self.scheduler.interval(name) * 1000:.0f} ms"
+                      for name in self.scheduler.names())
+        )
 
     def quit_application(self):
         """Quit the application with confirmation."""
@@ -425,32 +931,54 @@ class StreamerOCR(QWidget):
         )
         
         if reply == QMessageBox.Yes:
-            print("Exiting StreamerOCR...")
+            logger.info("Exiting StreamerOCR...")
+            self.hotkeys.stop()
+            self.scheduler.clear()
+            if self.config['metrics']['export_path']:
+                self.last_metrics_export = 0.0
+                self.update_stats()
+            if self.pipeline is not None:
+                self.pipeline.shutdown()
+            if self.tts is not None:
+                self.tts.shutdown()
+            if self.history is not None:
+                self.history.close()
             QApplication.quit()
 
 def main():
-    print("\n=== Starting StreamerOCR ===")
+    parser = argparse.ArgumentParser(description="Read screen regions aloud with OCR and TTS")
+    parser.add_argument('--profile-startup', action='store_true',
+                        help="Print how long imports and subsystem start-up took")
+    args, qt_args = parser.parse_known_args()
+    profile = StartupProfile(enabled=args.profile_startup, start=_IMPORT_START)
+    profile.record('main', 'imports', _IMPORT_START, _IMPORT_END)
+
+    config = load_config()
+    setup_logging(config['logging'])
+    logger.info("=== Starting StreamerOCR ===")
     
     # Create the QApplication instance
     if not QApplication.instance():
-        app = QApplication(sys.argv)
+        app = QApplication(sys.argv[:1] + qt_args)
     else:
         app = QApplication.instance()
     
-    print("QApplication instance created")
+    logger.debug("QApplication instance created")
     
     # Create and show the main window
-    window = StreamerOCR()
-    window.show()
+    with profile.phase('main', 'window'):
+        window = StreamerOCR(config, profile)
+        window.show()
+    profile.mark('window shown')
     
-    print("Application window displayed")
-    print("Press Alt+Shift+Space to process the selected region")
-    print("Press Alt+Shift+M to select a new region")
-    print("Press Alt+Shift+N to exit the application")
+    logger.info("Application window displayed")
+    for line in window.hotkey_help():
+        logger.info("Press %s", line)
     
     # Start the event loop
     return_code = app.exec_()
-    print("Application closed")
+    logger.info("Application closed")
+    shutdown_logging()
     sys.exit(return_code)
 
 if __name__ == '__main__':
@@ -0,0 +1,148 @@
+"""
+Lightweight timing spans, rolling latency histograms and counters.
+
+Hot paths record into the shared ``metrics`` registry; snapshots can be
+shown in the GUI or exported as JSON or Prometheus text.
+"""
+import json
+import os
+import threading
+import time
+from collections import deque
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+class Histogram:
+    """Rolling window of the most recent samples, plus running totals.
+
+    Recording is an append under a lock; sorting for percentiles only
+    happens when a snapshot is taken.
+    """
+
+    def __init__(self, window=1024):
+        self.samples = deque(maxlen=window)
+        self.count = 0
+        self.total = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, value):
+        with self._lock:
+            self.samples.append(value)
+            self.count += 1
+            self.total += value
+
+    def snapshot(self):
+        """Percentiles over the window and totals since start."""
+        with self._lock:
+            values = sorted(self.samples)
+            result = {'count': self.count, 'sum': self.total}
+        for q in QUANTILES:
+            key = f"p{round(q * 100)}"
+            result[key] = values[min(len(values) - 1, int(q * len(values)))] if values else 0.0
+        return result
+
+
+class Span:
+    """Times a block into a histogram, in milliseconds."""
+
+    __slots__ = ('histogram', 'start')
+
+    def __init__(self, histogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.histogram.record((time.perf_counter_ns() - self.start) / 1e6)
+        return False
+
+
+class Metrics:
+    """Registry of named latency histograms (milliseconds) and counters."""
+
+    def __init__(self, window=1024):
+        self.window = window
+        self.histograms = {}
+        self.counters = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, name):
+        """The histogram called ``name``, created on first use."""
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self.histograms.setdefault(name, Histogram(self.window))
+        return histogram
+
+    def span(self, name):
+        """Context manager timing a block into the ``name`` histogram."""
+        return Span(self.histograms.get(name) or self.histogram(name))
+
+    def observe(self, name, ms):
+        """Record a duration measured elsewhere, in milliseconds."""
+        (self.histograms.get(name) or self.histogram(name)).record(ms)
+
+    def incr(self, name, amount=1):
+        """Add to a counter."""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def snapshot(self):
+        """Current values of every histogram and counter."""
+        with self._lock:
+            histograms = list(self.histograms.items())
+            counters = dict(self.counters)
+        return {
+            'timestamp': time.time(),
+            'latency_ms': {name: h.snapshot() for name, h in histograms},
+            'counters': counters,
+        }
+
+    def reset(self):
+        """Forget all recorded values."""
+        with self._lock:
+            self.histograms = {}
+            self.counters = {}
+
+    def to_json(self):
+        return json.dumps(self.snapshot(), indent=4)
+
+    def to_prometheus(self, prefix='streamerocr'):
+        """Snapshot in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines = []
+        for name, stats in sorted(snapshot['latency_ms'].items()):
+            metric = f"{prefix}_{name}_seconds"
+            lines.append(f"# TYPE {metric} summary")
+            for q in QUANTILES:
+                lines.append(f'{metric}{{quantile="{q}"}} {stats[f"p{round(q * 100)}"] / 1000:.6f}')
+            lines.append(f"{metric}_sum {stats['sum'] / 1000:.6f}")
+            lines.append(f"{metric}_count {stats['count']}")
+        for name, value in sorted(snapshot['counters'].items()):
+            metric = f"{prefix}_{name}_total"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value}")
+        return '\n'.join(lines) + '\n'
+
+    def export(self, path, fmt=None):
+        """
+        Write a snapshot to a file, replacing it atomically.
+
+        Args:
+            path (str): Destination, e.g. a node_exporter textfile directory entry
+            fmt (str): 'prometheus' or 'json'; guessed from the extension if omitted
+        """
+        if fmt is None:
+            fmt = 'json' if path.endswith('.json') else 'prometheus'
+        content = self.to_json() if fmt == 'json' else self.to_prometheus()
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+
+
+# Shared registry used throughout the application
+metrics = Metrics()
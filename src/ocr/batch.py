@@ -0,0 +1,225 @@
+"""
+Batch OCR of image files (e.g. folders of VOD screenshots) on a process pool.
+
+File names are expanded lazily from paths, glob patterns and directories.
+Each worker process keeps its own initialized Tesseract engine and decodes,
+preprocesses and recognizes whole files, so only path names and text cross
+process boundaries.
+"""
+import csv
+import glob
+import json
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+from PIL import Image
+
+from src.ocr.engine import create_engine_pool, find_tesseract
+from src.ocr.preprocess import Preprocessor
+from src.ocr.profile import OCRProfile, PROFILE_PRESETS
+
+logger = logging.getLogger(__name__)
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.gif', '.tif', '.tiff', '.webp')
+CSV_FIELDS = ('path', 'text', 'ms', 'error')
+
+# Per-process state, set up by _init_worker
+_worker = None
+
+
+def iter_image_paths(inputs, recursive=True):
+    """
+    Yield the image files named by paths, glob patterns and directories.
+
+    Directories are walked in sorted order; a file reached twice is only
+    yielded once. Nothing is listed ahead of time, so huge folders start
+    processing immediately.
+
+    Args:
+        inputs (list): File paths, glob patterns (e.g. "vods/*.png") or directories
+        recursive (bool): Also look in subdirectories
+    """
+    seen = set()
+    for item in inputs:
+        if os.path.isdir(item):
+            candidates = _walk(item, recursive)
+        elif glob.has_magic(item):
+            candidates = (path for path in sorted(glob.iglob(item, recursive=recursive))
+                          if os.path.isfile(path))
+        else:
+            candidates = [item]
+        for path in candidates:
+            key = os.path.normcase(os.path.abspath(path))
+            if key not in seen:
+                seen.add(key)
+                yield path
+
+
+def _walk(directory, recursive):
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for name in sorted(files):
+            if name.lower().endswith(IMAGE_EXTENSIONS):
+                yield os.path.join(root, name)
+        if not recursive:
+            break
+
+
+class BatchWorker:
+    """Decodes, preprocesses and OCRs one file at a time with its own engine."""
+
+    def __init__(self, preprocess=None, profile=None):
+        self.preprocessor = Preprocessor.from_config(preprocess)
+        self.profile = _resolve_profile(profile)
+        find_tesseract()
+        self.engine = create_engine_pool(1, self.profile.lang, self.profile.oem)
+
+    def __call__(self, path):
+        started = time.perf_counter()
+        try:
+            with Image.open(path) as image:
+                gray = np.asarray(image.convert('L'))
+            text = self.engine.recognize(self.preprocessor(gray), self.profile).strip()
+            error = None
+        except Exception as e:
+            text, error = '', f"{type(e).__name__}: {e}"
+        ms = round((time.perf_counter() - started) * 1000, 1)
+        return {'path': path, 'text': text, 'ms': ms, 'error': error}
+
+    def close(self):
+        self.engine.close()
+
+
+def _resolve_profile(profile):
+    if isinstance(profile, str):
+        if profile not in PROFILE_PRESETS:
+            raise ValueError(f"Unknown OCR profile preset: {profile}")
+        return PROFILE_PRESETS[profile]
+    return OCRProfile.from_dict(profile)
+
+
+def _init_worker(preprocess, profile):
+    global _worker
+    _worker = BatchWorker(preprocess, profile)
+
+
+def _ocr_file(path):
+    return _worker(path)
+
+
+def ocr_files(paths, workers=None, preprocess=None, profile=None, ordered=True, skip=None):
+    """
+    OCR image files across a pool of worker processes.
+
+    At most a few files per worker are in flight at once, so ``paths`` can be
+    a lazy generator over any number of files.
+
+    Args:
+        paths (iterable): Image file paths, e.g. from iter_image_paths
+        workers (int): Worker processes; defaults to the CPU count. With 1,
+            files are processed in this process.
+        preprocess: Preset name or list of steps (see src.ocr.preprocess)
+        profile: OCR profile preset name or dict (see src.ocr.profile)
+        ordered (bool): Yield results in input order; otherwise as files finish
+        skip (set): Paths to leave out, e.g. those done by an interrupted run
+
+    Yields:
+        dict: {'path', 'text', 'ms', 'error'}; 'error' is None on success
+
+    Raises:
+        ValueError: If preprocess or profile names an unknown preset
+    """
+    # Fail here rather than in every worker's initializer
+    Preprocessor.from_config(preprocess)
+    _resolve_profile(profile)
+    workers = workers or os.cpu_count() or 1
+    skip = skip or set()
+    paths = (path for path in paths if path not in skip)
+
+    if workers == 1:
+        worker = BatchWorker(preprocess, profile)
+        try:
+            for path in paths:
+                yield worker(path)
+        finally:
+            worker.close()
+        return
+
+    max_pending = workers * 4
+    with ProcessPoolExecutor(workers, initializer=_init_worker,
+                             initargs=(preprocess, profile)) as executor:
+        pending = deque()
+        try:
+            for path in paths:
+                pending.append(executor.submit(_ocr_file, path))
+                if len(pending) >= max_pending:
+                    yield from _drain(pending, ordered, max_pending - workers)
+            yield from _drain(pending, ordered, 0)
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _drain(pending, ordered, keep):
+    """Yield finished results until at most ``keep`` futures are pending."""
+    while len(pending) > keep:
+        if ordered:
+            yield pending.popleft().result()
+            continue
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            pending.remove(future)
+            yield future.result()
+
+
+def completed_paths(output_path, fmt='jsonl'):
+    """
+    Paths already OCR'd without error in an existing output file.
+
+    Lets an interrupted run be resumed by skipping these files. A partly
+    written last line (from a killed run) is ignored.
+    """
+    done = set()
+    if not os.path.exists(output_path):
+        return done
+    with open(output_path, newline='', encoding='utf-8') as f:
+        lines = f.read().splitlines(keepends=True)
+    if lines and not lines[-1].endswith('\n'):
+        lines.pop()
+    if fmt == 'csv':
+        rows = csv.DictReader(lines)
+    else:
+        rows = []
+        for line in lines:
+            try:
+                rows.append(json.loads(line))
+            except ValueError:
+                continue
+    for row in rows:
+        if row.get('path') and not row.get('error'):
+            done.add(row['path'])
+    return done
+
+
+class ResultWriter:
+    """Writes batch results as JSON Lines or CSV, flushing every row."""
+
+    def __init__(self, stream, fmt='jsonl', header=True):
+        self.stream = stream
+        self.fmt = fmt
+        self.csv = None
+        if fmt == 'csv':
+            self.csv = csv.DictWriter(stream, fieldnames=CSV_FIELDS)
+            if header:
+                self.csv.writeheader()
+
+    def write(self, result):
+        if self.csv is not None:
+            self.csv.writerow({**result, 'error': result['error'] or ''})
+        else:
+            self.stream.write(json.dumps(result) + '\n')
+        self.stream.flush()
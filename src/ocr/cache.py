@@ -0,0 +1,223 @@
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+# Rough per-entry bookkeeping cost (dict slot, key string, tuple) in bytes
+_ENTRY_OVERHEAD = 200
+
+
+def content_key(image, config=''):
+    """
+    Hash the exact pixels of an image together with the OCR configuration.
+
+    Args:
+        image (numpy.ndarray): Preprocessed image handed to the OCR engine
+        config (str): Anything that changes the OCR output, e.g. language
+
+    Returns:
+        str: Hex digest identifying this image/config pair
+    """
+    # SHA-1 is roughly twice as fast as BLAKE2 on raw pixel buffers; this
+    # is a cache key, not a security boundary.
+    digest = hashlib.sha1(usedforsecurity=False)
+    digest.update(f"{image.shape}{image.dtype}|{config}".encode('utf-8'))
+    digest.update(np.ascontiguousarray(image).data)
+    return digest.hexdigest()
+
+
+def perceptual_hash(image, size=16):
+    """
+    Difference hash (dHash) of an image, robust to single-pixel noise.
+
+    The image is reduced to (size x size+1) block means and every bit records
+    whether a block is brighter than its right-hand neighbour.
+
+    Returns:
+        int or None: A size*size bit hash, or None if the image is smaller
+            than size x size+1 pixels and so cannot be hashed meaningfully
+    """
+    gray = image if image.ndim == 2 else image[:, :, :3].mean(axis=2)
+    h, w = gray.shape
+    if h < size or w < size + 1:
+        return None
+    rows = np.linspace(0, h, size + 1, dtype=int)
+    cols = np.linspace(0, w, size + 2, dtype=int)
+    sums = np.add.reduceat(np.add.reduceat(gray.astype(np.float32), rows[:-1], axis=0),
+                           cols[:-1], axis=1)
+    counts = np.outer(np.diff(rows), np.diff(cols))
+    means = sums / counts
+    bits = (means[:, 1:] > means[:, :-1]).ravel()
+    return int.from_bytes(np.packbits(bits).tobytes(), 'big')
+
+
+class OCRCache:
+    """Content-addressed cache of OCR results.
+
+    Entries live in an in-memory LRU bounded by ``max_bytes``. With
+    ``perceptual`` enabled, an exact miss falls back to the closest cached
+    image of the same shape and config whose dHash is within
+    ``max_distance`` bits. With ``disk_path`` set, results are also kept in
+    a SQLite file so they survive restarts.
+    """
+
+    def __init__(self, max_bytes=16 * 1024 * 1024, perceptual=False, max_distance=3,
+                 disk_path=None, max_disk_entries=50000):
+        self.max_bytes = max_bytes
+        self.perceptual = perceptual
+        self.max_distance = max_distance
+        self.max_disk_entries = max_disk_entries
+        self.hits = 0
+        self.misses = 0
+        self.perceptual_hits = 0
+        self.disk_hits = 0
+        self._entries = OrderedDict()   # key -> (text, size, bucket, phash)
+        self._buckets = {}              # (shape, config) -> {key: phash}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._db = None
+        if disk_path:
+            self._open_disk(disk_path)
+
+    def _open_disk(self, path):
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=OFF")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS ocr_cache ("
+            " key TEXT PRIMARY KEY, text TEXT NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._db.commit()
+        self._disk_puts = 0
+
+    def get(self, image, config=''):
+        """
+        Look up the OCR text for an image.
+
+        Returns:
+            str or None: The cached text, or None on a miss
+        """
+        image = np.asarray(image)
+        key = content_key(image, config)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+
+            if self._db is not None:
+                row = self._db.execute("SELECT text FROM ocr_cache WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    self._db.execute("UPDATE ocr_cache SET last_used = ? WHERE key = ?", (time.time(), key))
+                    self._store(key, row[0], image, config)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return row[0]
+
+            if self.perceptual:
+                text = self._nearest(image, config)
+                if text is not None:
+                    self.hits += 1
+                    self.perceptual_hits += 1
+                    return text
+
+            self.misses += 1
+            return None
+
+    def put(self, image, config, text):
+        """Remember the OCR text for an image."""
+        image = np.asarray(image)
+        key = content_key(image, config)
+        with self._lock:
+            self._store(key, text, image, config)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO ocr_cache (key, text, last_used) VALUES (?, ?, ?)",
+                    (key, text, time.time())
+                )
+                self._disk_puts += 1
+                if self._disk_puts % 500 == 0:
+                    self._trim_disk()
+                self._db.commit()
+
+    def stats(self):
+        """Counters for display and metrics export."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'perceptual_hits': self.perceptual_hits,
+                'disk_hits': self.disk_hits,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+            }
+
+    def clear(self):
+        """Drop every in-memory entry (the disk tier is left alone)."""
+        with self._lock:
+            self._entries.clear()
+            self._buckets.clear()
+            self._bytes = 0
+
+    def close(self):
+        """Close the disk tier, if any."""
+        with self._lock:
+            if self._db is not None:
+                self._db.commit()
+                self._db.close()
+                self._db = None
+
+    def _store(self, key, text, image, config):
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._forget(key, old)
+        bucket = (image.shape, config)
+        phash = perceptual_hash(image) if self.perceptual else None
+        size = len(text.encode('utf-8')) + _ENTRY_OVERHEAD
+        self._entries[key] = (text, size, bucket, phash)
+        self._bytes += size
+        if phash is not None:
+            self._buckets.setdefault(bucket, {})[key] = phash
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            old_key, old_entry = self._entries.popitem(last=False)
+            self._forget(old_key, old_entry)
+
+    def _forget(self, key, entry):
+        self._bytes -= entry[1]
+        bucket = self._buckets.get(entry[2])
+        if bucket is not None:
+            bucket.pop(key, None)
+            if not bucket:
+                del self._buckets[entry[2]]
+
+    def _nearest(self, image, config):
+        bucket = self._buckets.get((image.shape, config))
+        if not bucket:
+            return None
+        phash = perceptual_hash(image)
+        if phash is None:
+            return None
+        best_key, best_distance = None, self.max_distance + 1
+        for key, other in bucket.items():
+            distance = (phash ^ other).bit_count()
+            if distance < best_distance:
+                best_key, best_distance = key, distance
+        if best_key is None:
+            return None
+        self._entries.move_to_end(best_key)
+        return self._entries[best_key][0]
+
+    def _trim_disk(self):
+        count = self._db.execute("SELECT COUNT(*) FROM ocr_cache").fetchone()[0]
+        excess = count - self.max_disk_entries
+        if excess > 0:
+            self._db.execute(
+                "DELETE FROM ocr_cache WHERE key IN "
+                "(SELECT key FROM ocr_cache ORDER BY last_used LIMIT ?)", (excess,)
+            )
@@ -0,0 +1,92 @@
+"""
+Screen capture helpers that expose captured pixels as NumPy arrays without
+encoding, decoding or copying the frame.
+"""
+import numpy as np
+from PyQt5.QtGui import QImage
+
+# ITU-R 601 luma weights scaled to 8 bits, the same weights Pillow's
+# convert('L') uses; they sum to 256 so the result fits after a shift.
+_LUMA_B = 29
+_LUMA_G = 150
+_LUMA_R = 77
+
+
+class _BufferView:
+    """Exposes a foreign pixel buffer via __array_interface__.
+
+    The view keeps a reference to the object that owns the memory, so the
+    resulting array stays valid for as long as it is alive.
+    """
+
+    def __init__(self, owner, address, height, width, bytes_per_line):
+        self.owner = owner
+        self.__array_interface__ = {
+            'version': 3,
+            'shape': (height, width, 4),
+            'typestr': '|u1',
+            'data': (address, True),
+            'strides': (bytes_per_line, 4, 1),
+        }
+
+
+def mss_to_array(screenshot):
+    """
+    View an mss screenshot as a BGRA array.
+
+    Args:
+        screenshot (mss.screenshot.ScreenShot): Result of ``sct.grab``
+
+    Returns:
+        numpy.ndarray: (height, width, 4) uint8 view over ``screenshot.raw``
+    """
+    return np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(
+        screenshot.height, screenshot.width, 4
+    )
+
+
+def qimage_to_array(image):
+    """
+    View a QImage as a BGRA array.
+
+    32-bit RGB/ARGB QImages are stored as BGRA bytes on little-endian
+    machines, so they are used as-is; other formats are converted once.
+
+    Args:
+        image (QImage): Image to view, e.g. ``pixmap.toImage()``
+
+    Returns:
+        numpy.ndarray: (height, width, 4) uint8 view over the image bits
+    """
+    if image.format() not in (QImage.Format_RGB32, QImage.Format_ARGB32,
+                              QImage.Format_ARGB32_Premultiplied):
+        image = image.convertToFormat(QImage.Format_ARGB32)
+    bits = image.constBits()
+    view = _BufferView(image, int(bits), image.height(), image.width(), image.bytesPerLine())
+    return np.asarray(view)
+
+
+def to_grayscale(frame, out=None):
+    """
+    Convert a BGRA (or BGR) frame to 8-bit grayscale in one vectorized pass.
+
+    Args:
+        frame (numpy.ndarray): (height, width, 3 or 4) uint8 BGR(A) pixels;
+            2-D frames are assumed to be grayscale already
+        out (numpy.ndarray): Optional (height, width) uint8 output buffer
+
+    Returns:
+        numpy.ndarray: (height, width) uint8 grayscale image
+    """
+    if frame.ndim == 2:
+        return frame
+    acc = np.multiply(frame[:, :, 0], _LUMA_B, dtype=np.uint16)
+    tmp = np.multiply(frame[:, :, 1], _LUMA_G, dtype=np.uint16)
+    acc += tmp
+    np.multiply(frame[:, :, 2], _LUMA_R, out=tmp, dtype=np.uint16)
+    acc += tmp
+    acc >>= 8
+    if out is None:
+        return acc.astype(np.uint8)
+    np.copyto(out, acc, casting='unsafe')
+    return out
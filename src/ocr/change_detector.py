@@ -0,0 +1,73 @@
+import numpy as np
+
+
+class ChangeDetector:
+    """Decides whether a captured frame differs from the last OCR'd one.
+
+    Frames are reduced to a strided grayscale thumbnail and split into
+    ``block_size`` tiles. Each tile's pixel sum acts as a cheap block hash:
+    tiles whose hash matches the reference are skipped, the rest are checked
+    for a pixel that moved by more than ``pixel_delta``. The frame counts as
+    changed when the fraction of changed tiles exceeds ``threshold``.
+    """
+
+    def __init__(self, threshold=0.0, downsample=4, block_size=8, pixel_delta=24):
+        self.threshold = threshold
+        self.downsample = max(1, downsample)
+        self.block_size = max(1, block_size)
+        self.pixel_delta = pixel_delta
+        self.reference = None
+        self.reference_hash = None
+
+    def reset(self):
+        """Forget the reference frame so the next frame counts as changed."""
+        self.reference = None
+        self.reference_hash = None
+
+    def _tiles(self, frame):
+        """Downsample a BGRA/RGB/gray frame into (rows, b, cols, b) int16 tiles."""
+        small = frame[::self.downsample, ::self.downsample]
+        if small.ndim == 3:
+            small = small[:, :, :3].sum(axis=2, dtype=np.int16) // 3
+        else:
+            small = small.astype(np.int16)
+        b = self.block_size
+        pad_h = -small.shape[0] % b
+        pad_w = -small.shape[1] % b
+        if pad_h or pad_w:
+            small = np.pad(small, ((0, pad_h), (0, pad_w)))
+        return small.reshape(small.shape[0] // b, b, small.shape[1] // b, b)
+
+    def has_changed(self, frame):
+        """
+        Compare a frame against the reference frame.
+
+        When the frame counts as changed it becomes the new reference, so a
+        slow drift still triggers once it has moved far enough from what was
+        last read.
+
+        Args:
+            frame (numpy.ndarray): Captured frame, (H, W) or (H, W, C) uint8
+
+        Returns:
+            bool: True if the frame should be sent to OCR
+        """
+        tiles = self._tiles(frame)
+        block_hash = tiles.sum(axis=(1, 3), dtype=np.int32)
+
+        if self.reference is None or self.reference.shape != tiles.shape:
+            self.reference = tiles
+            self.reference_hash = block_hash
+            return True
+
+        dirty = block_hash != self.reference_hash
+        if not dirty.any():
+            return False
+
+        moved = np.abs(tiles - self.reference).max(axis=(1, 3)) > self.pixel_delta
+        if (dirty & moved).mean() <= self.threshold:
+            return False
+
+        self.reference = tiles
+        self.reference_hash = block_hash
+        return True
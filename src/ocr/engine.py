@@ -0,0 +1,303 @@
+import ctypes
+import ctypes.util
+import logging
+import os
+import queue
+import shutil
+import threading
+from contextlib import contextmanager
+
+import numpy as np
+import pytesseract
+
+from src.ocr.profile import OEM_DEFAULT, PSM_AUTO
+
+logger = logging.getLogger(__name__)
+
+
+def _find_tessdata(tesseract_cmd):
+    """Return the tessdata directory next to the tesseract executable, if any."""
+    if not tesseract_cmd or not os.path.isabs(tesseract_cmd):
+        return None
+    tessdata = os.path.join(os.path.dirname(tesseract_cmd), 'tessdata')
+    return tessdata if os.path.isdir(tessdata) else None
+
+
+def _load_library(tesseract_cmd=None):
+    """
+    Load the libtesseract shared library.
+
+    Looks next to the configured tesseract executable first (the layout used
+    by the Windows installer), then on the system library path.
+
+    Returns:
+        ctypes.CDLL or None: The loaded library, or None if it is not available
+    """
+    candidates = []
+    if tesseract_cmd and os.path.isabs(tesseract_cmd):
+        install_dir = os.path.dirname(tesseract_cmd)
+        if os.name == 'nt' and os.path.isdir(install_dir):
+            # Leptonica and friends live in the same folder as the DLL
+            os.add_dll_directory(install_dir)
+        for name in ('libtesseract-5.dll', 'libtesseract-4.dll', 'libtesseract.so.5', 'libtesseract.dylib'):
+            candidates.append(os.path.join(install_dir, name))
+    found = ctypes.util.find_library('tesseract')
+    if found:
+        candidates.append(found)
+    candidates.extend(['libtesseract.so.5', 'libtesseract.so.4', 'libtesseract-5.dll'])
+
+    for candidate in candidates:
+        try:
+            lib = ctypes.CDLL(candidate)
+        except OSError:
+            continue
+        _declare_api(lib)
+        return lib
+    return None
+
+
+def _declare_api(lib):
+    """Declare the argument and return types of the C API calls we use."""
+    handle = ctypes.c_void_p
+    lib.TessBaseAPICreate.restype = handle
+    lib.TessBaseAPICreate.argtypes = []
+    lib.TessBaseAPIInit2.restype = ctypes.c_int
+    lib.TessBaseAPIInit2.argtypes = [handle, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int]
+    lib.TessBaseAPISetPageSegMode.restype = None
+    lib.TessBaseAPISetPageSegMode.argtypes = [handle, ctypes.c_int]
+    lib.TessBaseAPISetVariable.restype = ctypes.c_int
+    lib.TessBaseAPISetVariable.argtypes = [handle, ctypes.c_char_p, ctypes.c_char_p]
+    lib.TessBaseAPISetSourceResolution.restype = None
+    lib.TessBaseAPISetSourceResolution.argtypes = [handle, ctypes.c_int]
+    lib.TessBaseAPISetImage.restype = None
+    lib.TessBaseAPISetImage.argtypes = [
+        handle, ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int
+    ]
+    lib.TessBaseAPIGetUTF8Text.restype = ctypes.c_void_p
+    lib.TessBaseAPIGetUTF8Text.argtypes = [handle]
+    lib.TessDeleteText.restype = None
+    lib.TessDeleteText.argtypes = [ctypes.c_void_p]
+    lib.TessBaseAPIClear.restype = None
+    lib.TessBaseAPIClear.argtypes = [handle]
+    lib.TessBaseAPIEnd.restype = None
+    lib.TessBaseAPIEnd.argtypes = [handle]
+    lib.TessBaseAPIDelete.restype = None
+    lib.TessBaseAPIDelete.argtypes = [handle]
+
+
+def _as_array(image):
+    """Return a C-contiguous uint8 array for a PIL image or NumPy array."""
+    arr = np.asarray(image)
+    if arr.dtype != np.uint8:
+        arr = arr.astype(np.uint8)
+    if arr.ndim == 3 and arr.shape[2] == 1:
+        arr = arr[:, :, 0]
+    return np.ascontiguousarray(arr)
+
+
+class TessAPIEngine:
+    """A Tesseract instance kept alive in-process through the C API.
+
+    The traineddata is loaded once in the constructor; each call to
+    ``recognize`` only hands the pixel buffer to the already initialized
+    engine. An instance must only be used by one thread at a time.
+    """
+
+    backend = 'capi'
+
+    def __init__(self, lib, lang='eng', datapath=None, oem=OEM_DEFAULT):
+        self.lib = lib
+        self.lang = lang
+        self.oem = oem
+        self.handle = lib.TessBaseAPICreate()
+        self._psm = None
+        self._whitelist = None
+        datapath_arg = datapath.encode('utf-8') if datapath else None
+        if lib.TessBaseAPIInit2(self.handle, datapath_arg, lang.encode('utf-8'), oem) != 0:
+            lib.TessBaseAPIDelete(self.handle)
+            self.handle = None
+            raise RuntimeError(f"Could not initialize Tesseract for language '{lang}'")
+
+    def _apply_profile(self, profile):
+        """Apply the per-call parts of an OCRProfile, skipping unchanged ones."""
+        psm = profile.psm if profile else PSM_AUTO
+        whitelist = profile.whitelist if profile else ''
+        if psm != self._psm:
+            self.lib.TessBaseAPISetPageSegMode(self.handle, psm)
+            self._psm = psm
+        if whitelist != self._whitelist:
+            self.lib.TessBaseAPISetVariable(
+                self.handle, b'tessedit_char_whitelist', whitelist.encode('utf-8')
+            )
+            self._whitelist = whitelist
+
+    def recognize(self, image, profile=None):
+        """Run OCR on a PIL image or NumPy array and return the text."""
+        arr = _as_array(image)
+        height, width = arr.shape[:2]
+        bytes_per_pixel = 1 if arr.ndim == 2 else arr.shape[2]
+        self._apply_profile(profile)
+        self.lib.TessBaseAPISetImage(
+            self.handle, arr.ctypes.data, width, height, bytes_per_pixel, arr.strides[0]
+        )
+        if profile is not None and profile.dpi:
+            self.lib.TessBaseAPISetSourceResolution(self.handle, profile.dpi)
+        text_ptr = self.lib.TessBaseAPIGetUTF8Text(self.handle)
+        try:
+            if not text_ptr:
+                return ""
+            return ctypes.string_at(text_ptr).decode('utf-8', errors='replace')
+        finally:
+            if text_ptr:
+                self.lib.TessDeleteText(text_ptr)
+            self.lib.TessBaseAPIClear(self.handle)
+
+    def close(self):
+        """Release the native Tesseract instance."""
+        if self.handle:
+            self.lib.TessBaseAPIEnd(self.handle)
+            self.lib.TessBaseAPIDelete(self.handle)
+            self.handle = None
+
+
+class PytesseractEngine:
+    """Fallback engine that runs the tesseract executable through pytesseract.
+
+    Every call writes a temporary image and starts a new process, so this is
+    only used when libtesseract cannot be loaded.
+    """
+
+    backend = 'pytesseract'
+
+    def __init__(self, lang='eng', oem=OEM_DEFAULT):
+        self.lang = lang
+        self.oem = oem
+
+    def recognize(self, image, profile=None):
+        """Run OCR on a PIL image or NumPy array and return the text."""
+        config = profile.tesseract_config() if profile else ''
+        return pytesseract.image_to_string(image, lang=self.lang, config=config)
+
+    def close(self):
+        """Nothing to release for the subprocess engine."""
+        pass
+
+
+class EnginePool:
+    """A bounded set of OCR engines shared between threads.
+
+    Engines are created lazily, up to ``size``, and handed out one caller at
+    a time. Callers that find every engine busy wait for one to be returned.
+    """
+
+    def __init__(self, factory, size=1, backend=None):
+        self.factory = factory
+        self.size = max(1, size)
+        self.backend = backend
+        self._idle = queue.LifoQueue()
+        self._engines = []
+        self._lock = threading.Lock()
+
+    def _get_engine(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._engines) < self.size:
+                engine = self.factory()
+                self._engines.append(engine)
+                self.backend = engine.backend
+                return engine
+        return self._idle.get()
+
+    def add(self, engine):
+        """Hand an already initialized engine to the pool."""
+        with self._lock:
+            self._engines.append(engine)
+            self.backend = engine.backend
+        self._idle.put(engine)
+
+    @contextmanager
+    def acquire(self):
+        """Borrow an engine for the duration of a ``with`` block."""
+        engine = self._get_engine()
+        try:
+            yield engine
+        finally:
+            self._idle.put(engine)
+
+    def recognize(self, image, profile=None):
+        """Run OCR on an image using the next free engine."""
+        with self.acquire() as engine:
+            return engine.recognize(image, profile)
+
+    def close(self):
+        """Release every engine owned by the pool."""
+        with self._lock:
+            for engine in self._engines:
+                engine.close()
+            self._engines = []
+        self._idle = queue.LifoQueue()
+
+
+# Default install locations of the Windows Tesseract installer
+COMMON_TESSERACT_PATHS = [
+    r"C:\Program Files\Tesseract-OCR\tesseract.exe",
+    r"C:\Program Files (x86)\Tesseract-OCR\tesseract.exe"
+]
+
+
+def find_tesseract():
+    """
+    Point pytesseract at the tesseract executable if it is not on PATH.
+
+    Only the file system is checked; running ``tesseract --version`` would
+    cost a subprocess on every start.
+
+    Returns:
+        str: The tesseract command in use, or None if it was not found
+    """
+    cmd = pytesseract.pytesseract.tesseract_cmd
+    if os.path.isfile(cmd) or shutil.which(cmd):
+        return cmd
+    for path in COMMON_TESSERACT_PATHS:
+        if os.path.exists(path):
+            logger.info("Found Tesseract at: %s", path)
+            pytesseract.pytesseract.tesseract_cmd = path
+            return path
+    return None
+
+
+def create_engine_pool(size=None, lang='eng', oem=OEM_DEFAULT):
+    """
+    Create an OCR engine pool, preferring persistent in-process engines.
+
+    Args:
+        size (int): Maximum number of engines; defaults to the CPU count
+        lang (str): Tesseract language code(s), e.g. 'eng' or 'eng+deu'
+        oem (int): Tesseract OCR engine mode
+
+    Returns:
+        EnginePool: A pool of TessAPIEngine instances, or of PytesseractEngine
+        instances when libtesseract is not available
+    """
+    if size is None:
+        size = os.cpu_count() or 1
+
+    tesseract_cmd = pytesseract.pytesseract.tesseract_cmd
+    lib = _load_library(tesseract_cmd)
+    if lib is not None:
+        datapath = _find_tessdata(tesseract_cmd)
+        try:
+            # Build one engine up front so a broken install falls back now
+            # instead of failing on the first hotkey press.
+            first = TessAPIEngine(lib, lang, datapath, oem)
+        except RuntimeError as e:
+            logger.warning("libtesseract found but could not be initialized: %s", e)
+        else:
+            pool = EnginePool(lambda: TessAPIEngine(lib, lang, datapath, oem), size)
+            pool.add(first)
+            return pool
+
+    return EnginePool(lambda: PytesseractEngine(lang, oem), size, PytesseractEngine.backend)
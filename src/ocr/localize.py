@@ -0,0 +1,141 @@
+"""
+Text localization: find the text lines inside a captured region.
+
+Regions are usually drawn generously, so most of a capture is background
+that Tesseract would still have to analyze. Text shows up as rows and
+columns dense in sharp horizontal intensity changes (the vertical strokes
+of glyphs), so projection profiles of an edge map are enough to find the
+lines without any OCR. What counts as an edge depends on the region's own
+contrast, so faint or small text is found as well as bold HUD text.
+"""
+import numpy as np
+
+
+# Text differs from its background by at least this many gray levels;
+# flatter regions hold nothing to read
+MIN_CONTRAST = 16
+
+
+def _binned(gray):
+    """Sums of 2x2 blocks (at most 4 * 255, so int16 is enough).
+
+    Binning quarters the work and suppresses pixel noise that would
+    otherwise look like glyph edges on busy backgrounds.
+    """
+    height, width = gray.shape[0] // 2 * 2, gray.shape[1] // 2 * 2
+    small = gray[0:height:2, 0:width].astype(np.int16)
+    small += gray[1:height:2, 0:width]
+    return small[:, 0::2] + small[:, 1::2]
+
+
+def _contrast(small):
+    """Gray-level range of a binned image; lone outlier pixels count a quarter."""
+    return float(small.max() - small.min()) / 4
+
+
+def contrast(gray):
+    """Gray-level range of an image, measured as find_text_boxes does."""
+    if gray.shape[0] < 2 or gray.shape[1] < 2:
+        return 0.0
+    return _contrast(_binned(gray))
+
+
+def _edge_map(small, edge_threshold, image_contrast):
+    """
+    Horizontal intensity changes of a binned image that look like glyph edges.
+
+    A step counts when it is at least a third of the image's contrast (so
+    faint text on a flat background is found) but no more than
+    ``edge_threshold`` is ever required; on a noisy background it must also
+    stand well clear of the typical step between neighbouring pixels.
+    """
+    steps = np.abs(np.diff(small, axis=1))
+    noise = float(np.median(steps))
+    threshold = max(min(4 * edge_threshold, 4 * image_contrast / 3), 4 * noise, 2 * MIN_CONTRAST)
+    return steps >= threshold
+
+
+def _runs(mask, join=0):
+    """(start, stop) of runs of True, joining runs separated by ``join`` or fewer False."""
+    padded = np.concatenate(([False], mask, [False]))
+    changes = np.flatnonzero(padded[1:] != padded[:-1])
+    runs = []
+    for start, stop in zip(changes[::2], changes[1::2]):
+        if runs and start - runs[-1][1] <= join:
+            runs[-1] = (runs[-1][0], stop)
+        else:
+            runs.append((start, stop))
+    return runs
+
+
+def find_text_boxes(gray, edge_threshold=40, min_density=0.01, min_height=6):
+    """
+    Find text lines in a grayscale image.
+
+    Rows with enough edges form line bands, and each band becomes one box
+    across the full width of the image: faint glyphs at either end of a line
+    can have too few edges to be found, and a box that stopped short of them
+    would cut words off.
+
+    Args:
+        gray (numpy.ndarray): 2-D uint8 grayscale image
+        edge_threshold (int): Gray-level step that always counts as a glyph
+            edge; lower-contrast images use a third of their own contrast
+        min_density (float): Fraction of a row's width that must be edges
+            for the row to hold text
+        min_height (int): Bands shorter than this many pixels are noise
+
+    Returns:
+        list: (x, y, width, height) boxes in full-resolution pixels, with a
+        margin above and below the text, top to bottom
+    """
+    if gray.shape[0] < 4 or gray.shape[1] < 4:
+        return []
+    small = _binned(gray)
+    image_contrast = _contrast(small)
+    if image_contrast < MIN_CONTRAST:
+        return []
+    edges = _edge_map(small, edge_threshold, image_contrast)
+    rows = edges.sum(axis=1)
+    active = rows >= max(2, min_density * edges.shape[1])
+
+    boxes = []
+    # Join bands split by a blank row, e.g. between the dot and stem of an 'i'
+    for top, bottom in _runs(active, join=1):
+        band_height = bottom - top
+        if band_height * 2 < min_height:
+            continue
+        # Even a single glyph has an edge or two per row; noise has a few
+        # scattered across the row. Gaps between words are narrower than
+        # about twice the line height.
+        band = edges[top:bottom]
+        if not any(band[:, left:right].sum() >= band_height + 4
+                   for left, right in _runs(band.any(axis=0), join=2 * band_height)):
+            continue
+        margin = max(4, band_height)  # Half a line, at full resolution
+        y0 = max(0, top * 2 - margin)
+        y1 = min(gray.shape[0], bottom * 2 + margin)
+        boxes.append((0, int(y0), int(gray.shape[1]), int(y1 - y0)))
+    return boxes
+
+
+def localize(gray, edge_threshold=40, max_coverage=0.6):
+    """
+    Text lines worth OCR'ing separately, or None to OCR the whole image.
+
+    Cropping only pays off when most of the image is background; when the
+    lines cover more than ``max_coverage`` of it the whole image is used.
+    If no lines are found in an image with any contrast, it is read whole
+    as well, so text too faint or small to be found is not skipped.
+
+    Returns:
+        list: Boxes as from find_text_boxes ([] when the image is flat and
+        holds no text), or None
+    """
+    boxes = find_text_boxes(gray, edge_threshold)
+    if not boxes:
+        return None if contrast(gray) >= MIN_CONTRAST else []
+    area = sum(w * h for x, y, w, h in boxes)
+    if area > max_coverage * gray.size:
+        return None
+    return boxes
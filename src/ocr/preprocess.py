@@ -0,0 +1,201 @@
+import json
+
+import numpy as np
+from PIL import Image
+
+# Every step takes a 2-D uint8 grayscale array and returns the result.
+# Steps that keep the image size work in place on the array they are given;
+# only scale, pad and the adaptive threshold need a new buffer.
+
+
+def scale(gray, factor=2.0):
+    """Resize by ``factor``; integer upscales repeat pixels, others use bilinear."""
+    if factor == 1:
+        return gray
+    if float(factor).is_integer() and factor > 1:
+        f = int(factor)
+        return np.repeat(np.repeat(gray, f, axis=0), f, axis=1)
+    height, width = gray.shape
+    size = (max(1, round(width * factor)), max(1, round(height * factor)))
+    return np.asarray(Image.fromarray(gray).resize(size, Image.BILINEAR)).copy()
+
+
+def invert(gray):
+    """Swap dark and light in place."""
+    np.subtract(255, gray, out=gray)
+    return gray
+
+
+def auto_invert(gray):
+    """Invert light-on-dark images so text ends up dark on light, as Tesseract prefers."""
+    if gray.mean() < 128:
+        invert(gray)
+    return gray
+
+
+def _otsu_level(gray):
+    hist = np.bincount(gray.ravel(), minlength=256).astype(np.float64)
+    levels = np.arange(256)
+    weight_bg = np.cumsum(hist)
+    weight_fg = weight_bg[-1] - weight_bg
+    sum_bg = np.cumsum(hist * levels)
+    mean_bg = sum_bg / np.maximum(weight_bg, 1)
+    mean_fg = (sum_bg[-1] - sum_bg) / np.maximum(weight_fg, 1)
+    between = weight_bg * weight_fg * (mean_bg - mean_fg) ** 2
+    return int(np.argmax(between))
+
+
+def otsu(gray):
+    """Binarize in place at the global Otsu threshold."""
+    level = _otsu_level(gray)
+    np.greater(gray, level, out=gray, casting='unsafe')
+    gray *= 255
+    return gray
+
+
+def _box_sum(gray, radius):
+    """Sum over a (2r+1)^2 window for every pixel, via an integral image."""
+    padded = np.pad(gray, radius, mode='edge')
+    integral = np.zeros((padded.shape[0] + 1, padded.shape[1] + 1), dtype=np.int32)
+    np.cumsum(padded, axis=0, dtype=np.int32, out=integral[1:, 1:])
+    np.cumsum(integral[1:, 1:], axis=1, out=integral[1:, 1:])
+    k = 2 * radius + 1
+    return integral[k:, k:] - integral[:-k, k:] - integral[k:, :-k] + integral[:-k, :-k]
+
+
+def adaptive(gray, block=15, offset=10):
+    """Binarize against the local mean of a block x block window (in place)."""
+    radius = block // 2
+    local_mean = _box_sum(gray, radius) // ((2 * radius + 1) ** 2)
+    np.greater(gray, local_mean - offset, out=gray, casting='unsafe')
+    gray *= 255
+    return gray
+
+
+def denoise(gray):
+    """3x3 box blur in place, smoothing speckle and compression noise."""
+    gray[...] = _box_sum(gray, 1) // 9
+    return gray
+
+
+def _morph(gray, reduce_fn):
+    """Apply a separable 3x3 min/max filter in place."""
+    padded = np.pad(gray, 1, mode='edge')
+    rows = reduce_fn(reduce_fn(padded[:-2], padded[1:-1]), padded[2:])
+    reduce_fn(reduce_fn(rows[:, :-2], rows[:, 1:-1]), rows[:, 2:], out=gray)
+    return gray
+
+
+def erode(gray):
+    """Grow dark (text) pixels by one, in place."""
+    return _morph(gray, np.minimum)
+
+
+def dilate(gray):
+    """Grow light (background) pixels by one, in place."""
+    return _morph(gray, np.maximum)
+
+
+def open_(gray):
+    """Remove isolated dark specks smaller than 3x3 (dilate, then erode)."""
+    return erode(dilate(gray))
+
+
+def close(gray):
+    """Fill small light holes inside dark strokes (erode, then dilate)."""
+    return dilate(erode(gray))
+
+
+def pad(gray, size=10, value=255):
+    """Add a uniform border; Tesseract reads text touching the edge poorly."""
+    return np.pad(gray, size, mode='constant', constant_values=value)
+
+
+STEPS = {
+    'scale': scale,
+    'invert': invert,
+    'auto_invert': auto_invert,
+    'otsu': otsu,
+    'adaptive': adaptive,
+    'denoise': denoise,
+    'erode': erode,
+    'dilate': dilate,
+    'open': open_,
+    'close': close,
+    'pad': pad,
+}
+
+PRESETS = {
+    'none': [],
+    'subtitle': [
+        {'op': 'scale', 'factor': 2},
+        {'op': 'auto_invert'},
+        {'op': 'otsu'},
+        {'op': 'pad', 'size': 10},
+    ],
+    'light_on_dark': [
+        {'op': 'invert'},
+        {'op': 'otsu'},
+        {'op': 'pad', 'size': 10},
+    ],
+    'hud': [
+        {'op': 'scale', 'factor': 3},
+        {'op': 'auto_invert'},
+        {'op': 'otsu'},
+        {'op': 'open'},
+        {'op': 'pad', 'size': 10},
+    ],
+    'busy_background': [
+        {'op': 'denoise'},
+        {'op': 'auto_invert'},
+        {'op': 'adaptive', 'block': 25, 'offset': 15},
+        {'op': 'open'},
+        {'op': 'pad', 'size': 10},
+    ],
+}
+
+
+class Preprocessor:
+    """A configured chain of preprocessing steps applied before OCR.
+
+    Built from a preset name or a list of ``{"op": name, **params}`` dicts,
+    as stored in a region's ``preprocess`` entry in regions.json.
+    """
+
+    def __init__(self, steps=None):
+        self.config = steps or []
+        self.steps = []
+        for step in self.config:
+            params = dict(step)
+            op = params.pop('op')
+            if op not in STEPS:
+                raise ValueError(f"Unknown preprocessing step: {op}")
+            self.steps.append((STEPS[op], params))
+        self.key = json.dumps(self.config, sort_keys=True)
+
+    @classmethod
+    def from_config(cls, config):
+        """Build a Preprocessor from a preset name, a list of steps, or None."""
+        if config is None:
+            return cls([])
+        if isinstance(config, str):
+            if config not in PRESETS:
+                raise ValueError(f"Unknown preprocessing preset: {config}")
+            return cls(PRESETS[config])
+        return cls(config)
+
+    def __call__(self, gray):
+        """
+        Run every step on a grayscale image.
+
+        The input is modified in place when possible; read-only arrays are
+        copied once first.
+
+        Returns:
+            numpy.ndarray: The preprocessed uint8 image
+        """
+        if self.steps and not gray.flags.writeable:
+            gray = gray.copy()
+        for fn, params in self.steps:
+            gray = fn(gray, **params)
+        return gray
@@ -1,130 +1,391 @@
 import pytesseract
-from PIL import Image
-import os
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtGui import QScreen
-from PyQt5.QtCore import QBuffer, QByteArray
-import io
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import mss
 import numpy as np
 
+from src.config import load_config
+from src.metrics import metrics
+from src.ocr.cache import OCRCache
+from src.ocr.capture import mss_to_array, qimage_to_array, to_grayscale
+from src.ocr.engine import PytesseractEngine, create_engine_pool, find_tesseract
+from src.ocr.localize import localize
+from src.ocr.preprocess import Preprocessor
+from src.ocr.profile import OCRProfile
+
+logger = logging.getLogger(__name__)
+
 class OCRProcessor:
     """Handles OCR processing of screen regions."""
 
-    def __init__(self):
-        print("Initializing OCR processor...")
+    def __init__(self, config=None):
+        logger.info("Initializing OCR processor...")
+        self.config = config or load_config()
         
-        # Check Tesseract installation
-        try:
-            tesseract_path = pytesseract.get_tesseract_version()
-            print(f"Tesseract version: {tesseract_path}")
-        except Exception as e:
-            print(f"Warning: Tesseract not found. Please ensure Tesseract is installed and in PATH. Error: {e}")
-            # Try to find Tesseract in common locations
-            common_paths = [
-                r"C:\Program Files\Tesseract-OCR\tesseract.exe",
-                r"C:\Program Files (x86)\Tesseract-OCR\tesseract.exe"
-            ]
-            for path in common_paths:
-                if os.path.exists(path):
-                    print(f"Found Tesseract at: {path}")
-                    pytesseract.pytesseract.tesseract_cmd = path
-                    break
-
-        # Initialize the screen capture tool
+        # Locate Tesseract on disk; libtesseract is looked for next to it
+        find_tesseract()
+
+        # Keep initialized Tesseract engines alive for the life of the process.
+        # Language and engine mode are fixed at init, so each (lang, oem) pair
+        # used by a region profile gets its own pool, created on first use.
+        self.engine = create_engine_pool()
+        self.engines = {OCRProfile().engine_key: self.engine}
+        self.engines_lock = threading.Lock()
+        logger.info("OCR engine backend: %s", self.engine.backend)
+
+        if self.engine.backend == PytesseractEngine.backend:
+            # Only the command-line fallback needs a working tesseract executable
+            try:
+                logger.info("Tesseract version: %s", pytesseract.get_tesseract_version())
+            except Exception as e:
+                logger.warning("Tesseract not found. Please ensure Tesseract is installed and in PATH. Error: %s", e)
+
+        # Cache results so repeated screens skip Tesseract entirely
+        cache_config = self.config['cache']
+        self.preprocessors = {}  # JSON of a region's preprocess config -> Preprocessor
+        self.cache = None
+        if cache_config['enabled']:
+            self.cache = OCRCache(
+                max_bytes=cache_config['max_mb'] * 1024 * 1024,
+                perceptual=cache_config['perceptual'],
+                max_distance=cache_config['max_distance'],
+                disk_path=cache_config['disk_path']
+            )
+
+        # Worker threads for OCR'ing several regions at once (see process_regions)
+        self.executor = None
+
+        # Initialize the screen capture tool; the monitor layout is read once
+        # and kept until refresh_monitors is called
         self.sct = mss.mss()
+        self.monitors = self.sct.monitors
+
+    def refresh_monitors(self):
+        """Read the monitor layout again, e.g. after a display was added."""
+        sct = mss.mss()
+        try:
+            self.monitors = list(sct.monitors)
+        finally:
+            sct.close()
+        logger.info("Monitors: %s", self.monitors[1:])
+
+    def capture_region(self, region, monitor_index=0):
+        """
+        Capture a specific region of the screen using PyQt5.
+
+        Args:
+            region (tuple): (x, y, width, height) in physical screen pixels
+            monitor_index (int): Index of the monitor the region is on (0-based)
+
+        Returns:
+            numpy.ndarray: BGRA pixels with shape (height, width, 4), or None
+        """
+        # Imported here so headless use (src.cli) never loads QtWidgets
+        from PyQt5.QtWidgets import QApplication
+        from src.gui.geometry import Monitor
 
-    def capture_region(self, region):
-        """Capture a specific region of the screen using PyQt5."""
-        print(f"Capturing region: {region}")
+        logger.debug("Capturing region: %s", region)
         try:
-            x, y, width, height = region
-            screen = QApplication.primaryScreen()
-            if not screen:
-                print("Error: Could not get primary screen")
+            screens = QApplication.screens()
+            if not screens:
+                logger.error("No screen to capture from")
                 return None
-                
-            # Capture the region
-            pixmap = screen.grabWindow(0, x, y, width, height)
+            if monitor_index >= len(screens):
+                monitor_index = 0
+            screen = screens[monitor_index]
+
+            # Qt grabs in logical pixels relative to the screen; on a scaled
+            # screen the pixmap still holds every physical pixel
+            monitor = Monitor.from_screen(monitor_index, screen)
+            x, y, width, height = monitor.to_logical(region)
+            with metrics.span('capture'):
+                pixmap = screen.grabWindow(0, x - monitor.left, y - monitor.top, width, height)
             if pixmap.isNull():
-                print("Error: Screen capture failed - null pixmap")
+                logger.error("Screen capture failed - null pixmap")
                 return None
                 
-            # Convert QPixmap to PIL Image using memory buffer
-            buffer = QBuffer()
-            buffer.open(QBuffer.ReadWrite)
-            pixmap.save(buffer, "PNG")
-            
-            # Convert QBuffer to PIL Image
-            pil_img = Image.open(io.BytesIO(buffer.data()))
-            buffer.close()
+            # View the pixels in place instead of round-tripping through PNG
+            frame = qimage_to_array(pixmap.toImage())
             
-            print("Screenshot captured successfully")
-            return pil_img
+            logger.debug("Screenshot captured successfully")
+            return frame
             
         except Exception as e:
-            print(f"Error capturing screenshot: {e}")
+            logger.error("Error capturing screenshot: %s", e)
             return None
 
     def process_image(self, image):
-        """Process an image with OCR and return the text."""
+        """
+        Process an image with OCR and return the text.
+
+        Args:
+            image: A PIL image, or a BGR(A) array as returned by capture_region
+        """
         if image is None:
             return ""
         try:
-            text = pytesseract.image_to_string(image)
-            print(f"OCR processed successfully, found text: {text}")
+            metrics.incr('frames')
+            if isinstance(image, np.ndarray):
+                image = to_grayscale(image)
+            text = self.recognize(image)
+            logger.debug("OCR processed successfully, found text: %r", text)
             return text
         except Exception as e:
-            print(f"Error during OCR processing: {e}")
+            logger.error("Error during OCR processing: %s", e)
             return ""
 
-    def process_region(self, region, monitor_index=0):
+    def get_engine(self, profile):
+        """Return the engine pool initialized for a profile's language and engine mode."""
+        key = profile.engine_key
+        with self.engines_lock:
+            engine = self.engines.get(key)
+            if engine is None:
+                lang, oem = key
+                engine = create_engine_pool(lang=lang, oem=oem)
+                self.engines[key] = engine
+        return engine
+
+    def recognize(self, image, profile=None):
+        """
+        Run OCR on a preprocessed image, answering from the cache when possible.
+
+        Args:
+            image: Grayscale NumPy array or PIL image handed to the engine
+            profile: OCRProfile or regions.json profile dict; None for defaults
+
+        Returns:
+            str: Raw OCR text
+        """
+        metrics.incr('crops')
+        profile = OCRProfile.from_dict(profile)
+        engine = self.get_engine(profile)
+        if self.cache is None:
+            with metrics.span('ocr'):
+                return engine.recognize(image, profile)
+        image = np.asarray(image)
+        config_key = f"{engine.backend}|{profile.key}"
+        text = self.cache.get(image, config_key)
+        if text is None:
+            metrics.incr('cache_misses')
+            with metrics.span('ocr'):
+                text = engine.recognize(image, profile)
+            self.cache.put(image, config_key, text)
+        else:
+            metrics.incr('cache_hits')
+        return text
+
+    def grab_region(self, region, monitor_index=0):
+        """
+        Capture a region of the screen with mss.
+
+        mss takes global coordinates in physical pixels, which is how regions
+        are stored, so no monitor lookup is needed.
+
+        Args:
+            region (tuple): (x, y, width, height) in physical screen pixels
+            monitor_index (int): Index of the monitor the region is on (0-based)
+
+        Returns:
+            numpy.ndarray: BGRA pixels with shape (height, width, 4)
+        """
+        x, y, width, height = region
+        with metrics.span('capture'):
+            screenshot = self.sct.grab({'left': x, 'top': y, 'width': width, 'height': height})
+        return mss_to_array(screenshot)
+
+    def grab_monitor(self, monitor_index=0):
+        """
+        Capture a whole monitor with mss.
+
+        Args:
+            monitor_index (int): Index of the monitor to capture from (0-based)
+
+        Returns:
+            tuple: (BGRA pixels with shape (height, width, 4), mss monitor dict)
+        """
+        monitor = self.monitors[monitor_index + 1]  # monitors[0] is all monitors
+        with metrics.span('capture_monitor'):
+            screenshot = self.sct.grab(monitor)
+        return mss_to_array(screenshot), monitor
+
+    def monitor_for(self, region):
+        """
+        Find the monitor a region is on from its position alone.
+
+        Regions are stored in global physical pixels, so this does not rely
+        on the saved monitor index, which may refer to a different screen
+        (or none) on another machine or after the layout changed.
+
+        Args:
+            region (tuple): (x, y, width, height) in physical screen pixels
+
+        Returns:
+            int or None: 0-based monitor index for grab_monitor, or None if
+                the region does not overlap any monitor
+        """
+        x, y, width, height = region
+        best_index, best_area = None, 0
+        for index, monitor in enumerate(self.monitors[1:]):
+            overlap_w = min(x + width, monitor['left'] + monitor['width']) - max(x, monitor['left'])
+            overlap_h = min(y + height, monitor['top'] + monitor['height']) - max(y, monitor['top'])
+            if overlap_w > 0 and overlap_h > 0 and overlap_w * overlap_h > best_area:
+                best_index, best_area = index, overlap_w * overlap_h
+        return best_index
+
+    @staticmethod
+    def crop(frame, monitor, region):
+        """
+        Cut a region out of a monitor frame as a view (no copy).
+
+        Args:
+            frame (numpy.ndarray): Pixels returned by grab_monitor
+            monitor (dict): mss monitor the frame was grabbed from
+            region (tuple): (x, y, width, height) in physical screen pixels
+
+        Returns:
+            numpy.ndarray: The part of the region that lies on the monitor
+        """
+        x = max(region[0] - monitor['left'], 0)
+        y = max(region[1] - monitor['top'], 0)
+        right = min(region[0] + region[2] - monitor['left'], frame.shape[1])
+        bottom = min(region[1] + region[3] - monitor['top'], frame.shape[0])
+        return frame[y:max(y, bottom), x:max(x, right)]
+
+    def process_regions(self, regions):
+        """
+        OCR several regions from one grab per monitor, in parallel.
+
+        Each monitor used by the regions is captured once; regions are cut out
+        of that frame as slices and recognized concurrently, one engine from
+        the pool per worker. A region's monitor is the one it lies on (see
+        monitor_for); a region on no monitor is logged and yields ''.
+
+        Args:
+            regions (dict): Region name -> regions.json entry with 'region',
+                'monitor' and optionally 'preprocess' and 'profile'
+
+        Returns:
+            dict: Region name -> extracted text ('' for empty or failed regions)
+        """
+        frames = {}
+        on_monitor = {}
+        for name, data in regions.items():
+            index = self.monitor_for(data['region'])
+            if index is None:
+                logger.warning("Region '%s' is not on any monitor", name)
+                continue
+            on_monitor[name] = index
+            if index not in frames:
+                frames[index] = self.grab_monitor(index)
+
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(
+                max_workers=self.engine.size, thread_name_prefix='ocr'
+            )
+
+        futures = {}
+        for name, index in on_monitor.items():
+            data = regions[name]
+            frame, monitor = frames[index]
+            crop = self.crop(frame, monitor, data['region'])
+            if crop.size == 0:
+                continue
+            futures[name] = self.executor.submit(
+                self.process_frame, crop, data.get('preprocess'), data.get('profile')
+            )
+
+        results = {}
+        for name in regions:
+            future = futures.get(name)
+            try:
+                results[name] = future.result() if future else ""
+            except Exception as e:
+                logger.error("Error in OCR processing of region '%s': %s", name, e)
+                results[name] = ""
+        return results
+
+    def get_preprocessor(self, preprocess):
+        """Return the (cached) Preprocessor for a region's preprocess setting."""
+        key = json.dumps(preprocess, sort_keys=True)
+        preprocessor = self.preprocessors.get(key)
+        if preprocessor is None:
+            preprocessor = Preprocessor.from_config(preprocess)
+            self.preprocessors[key] = preprocessor
+        return preprocessor
+
+    def process_frame(self, frame, preprocess=None, profile=None):
+        """
+        Run OCR on a frame returned by grab_region.
+
+        Args:
+            frame (numpy.ndarray): BGRA pixels with shape (height, width, 4)
+            preprocess: Preset name or list of steps (see src.ocr.preprocess)
+            profile: OCR profile for the region (see src.ocr.profile)
+
+        Returns:
+            str: Extracted text from the frame
+        """
+        metrics.incr('frames')
+        with metrics.span('preprocess'):
+            # Convert to grayscale for better OCR
+            gray = to_grayscale(frame)
+            
+            # Find the text lines so Tesseract skips the empty background
+            boxes = None
+            localize_config = self.config['localize']
+            if localize_config['enabled']:
+                with metrics.span('localize'):
+                    boxes = localize(gray, localize_config['edge_threshold'],
+                                     localize_config['max_coverage'])
+            if boxes is None:
+                crops = [gray]
+            else:
+                # Copies, since preprocessing works in place and boxes may overlap
+                crops = [gray[y:y + h, x:x + w].copy() for x, y, w, h in boxes]
+            
+            # Clean up the image (binarize, scale, pad...) as configured for the region
+            preprocessor = self.get_preprocessor(preprocess)
+            crops = [preprocessor(crop) for crop in crops]
+        
+        # Perform OCR
+        texts = [self.recognize(crop, profile).strip() for crop in crops]
+        
+        return '\n'.join(text for text in texts if text)
+
+    def process_region(self, region, monitor_index=0, preprocess=None, profile=None):
         """
         Process a region of the screen with OCR.
         
         Args:
             region (tuple): (x, y, width, height) of the region to capture
             monitor_index (int): Index of the monitor to capture from (0-based)
+            preprocess: Preset name or list of steps (see src.ocr.preprocess)
+            profile: OCR profile for the region (see src.ocr.profile)
             
         Returns:
             str: Extracted text from the region
         """
         try:
-            # Get the monitor geometry
-            monitor = self.sct.monitors[monitor_index + 1]  # monitors[0] is all monitors
-            
-            # Adjust region coordinates relative to the monitor
-            x = region[0] - monitor['left']
-            y = region[1] - monitor['top']
-            width = region[2]
-            height = region[3]
-            
-            # Capture the region
-            screenshot = self.sct.grab({
-                'left': x,
-                'top': y,
-                'width': width,
-                'height': height,
-                'mon': monitor_index + 1  # Specify which monitor to capture
-            })
-            
-            # Convert to PIL Image
-            img = Image.frombytes('RGB', screenshot.size, screenshot.rgb)
-            
-            # Convert to grayscale for better OCR
-            img = img.convert('L')
-            
-            # Perform OCR
-            text = pytesseract.image_to_string(img)
-            
-            return text.strip()
+            with metrics.span('process_region'):
+                frame = self.grab_region(region, monitor_index)
+                return self.process_frame(frame, preprocess, profile)
             
         except Exception as e:
-            print(f"Error in OCR processing: {str(e)}")
+            logger.error("Error in OCR processing: %s", e)
             return ""
 
     def __del__(self):
         """Clean up resources."""
         if hasattr(self, 'd3d'):
             self.d3d.stop()
-        self.sct.close() 
\ No newline at end of file
+        if getattr(self, 'executor', None) is not None:
+            self.executor.shutdown(wait=False)
+        for engine in getattr(self, 'engines', {}).values():
+            engine.close()
+        if getattr(self, 'cache', None) is not None:
+            self.cache.close()
+        sct = getattr(self, 'sct', None)
+        if sct is not None:
+            sct.close() 
\ No newline at end of file
@@ -0,0 +1,96 @@
+import json
+
+# Tesseract page segmentation modes that suit typical streaming regions
+PSM_AUTO = 3          # Full page layout analysis (Tesseract's default)
+PSM_SINGLE_BLOCK = 6  # One uniform block of text, e.g. a chat box
+PSM_SINGLE_LINE = 7   # One line, e.g. a subtitle
+PSM_SINGLE_WORD = 8   # One word or number, e.g. a HUD counter
+PSM_SPARSE = 11       # Scattered text in no particular order
+
+# Tesseract OCR engine modes
+OEM_LEGACY = 0
+OEM_LSTM = 1
+OEM_LEGACY_LSTM = 2
+OEM_DEFAULT = 3
+
+
+class OCRProfile:
+    """Tesseract settings applied when OCR'ing one region.
+
+    ``lang`` and ``oem`` are fixed when a Tesseract instance is initialized,
+    so regions that differ in them use separate engines. ``psm``,
+    ``whitelist`` and ``dpi`` are applied per call.
+    """
+
+    def __init__(self, psm=PSM_AUTO, oem=OEM_DEFAULT, lang='eng', whitelist='', dpi=None):
+        self.psm = int(psm)
+        self.oem = int(oem)
+        self.lang = lang
+        self.whitelist = whitelist or ''
+        self.dpi = int(dpi) if dpi else None
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a profile from a regions.json entry (missing keys use defaults)."""
+        if isinstance(data, OCRProfile):
+            return data
+        data = data or {}
+        return cls(
+            psm=data.get('psm', PSM_AUTO),
+            oem=data.get('oem', OEM_DEFAULT),
+            lang=data.get('lang', 'eng'),
+            whitelist=data.get('whitelist', ''),
+            dpi=data.get('dpi')
+        )
+
+    def to_dict(self):
+        """Serializable form stored with each region in regions.json."""
+        return {
+            'psm': self.psm,
+            'oem': self.oem,
+            'lang': self.lang,
+            'whitelist': self.whitelist,
+            'dpi': self.dpi,
+        }
+
+    @property
+    def engine_key(self):
+        """Settings that need their own initialized Tesseract instance."""
+        return (self.lang, self.oem)
+
+    @property
+    def key(self):
+        """Stable string identifying every setting, used in OCR cache keys."""
+        return json.dumps(self.to_dict(), sort_keys=True)
+
+    def tesseract_config(self):
+        """Command-line options for the pytesseract fallback engine."""
+        options = [f"--psm {self.psm}", f"--oem {self.oem}"]
+        if self.dpi:
+            options.append(f"--dpi {self.dpi}")
+        if self.whitelist:
+            options.append(f"-c tessedit_char_whitelist={self.whitelist}")
+        return ' '.join(options)
+
+    def __eq__(self, other):
+        return isinstance(other, OCRProfile) and self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return f"OCRProfile({self.to_dict()})"
+
+
+PROFILE_PRESETS = {
+    'default': OCRProfile(),
+    'subtitle': OCRProfile(psm=PSM_SINGLE_LINE),
+    'chat': OCRProfile(psm=PSM_SINGLE_BLOCK),
+    'digits': OCRProfile(psm=PSM_SINGLE_LINE, whitelist='0123456789'),
+    'counter': OCRProfile(psm=PSM_SINGLE_WORD, whitelist='0123456789/%.'),
+}
+
+
+def preset_name(profile):
+    """Name of the preset matching a profile, or None for custom profiles."""
+    for name, preset in PROFILE_PRESETS.items():
+        if preset == profile:
+            return name
+    return None
@@ -0,0 +1,3 @@
+"""
+Background processing pipeline for StreamerOCR.
+"""
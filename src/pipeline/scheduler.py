@@ -0,0 +1,160 @@
+"""
+Adaptive polling of watched regions.
+
+Every watched region has its own capture interval. While a region's pixels
+stay the same its interval backs off exponentially, up to a ceiling; as
+soon as it changes the interval snaps back to the fastest allowed rate. A
+global frames-per-second budget and a CPU budget are split across the
+watched regions by priority, which sets each region's fastest rate.
+"""
+import time
+
+from PyQt5.QtCore import QObject, QTimer
+
+
+class RegionSchedule:
+    """Polling state of one watched region."""
+
+    def __init__(self, name, priority=1.0, detector=None):
+        self.name = name
+        self.priority = max(float(priority), 0.01)
+        self.detector = detector
+        self.interval = 0.0      # Seconds; set by the scheduler when added
+        self.next_due = 0.0
+        self.busy = False        # A capture is in flight
+        self.job_s = 0.0         # Smoothed seconds of work per capture
+        self.polls = 0
+        self.changes = 0
+
+    def reset(self):
+        """Treat the next capture as new: fast rate, fresh change detector."""
+        self.interval = 0.0
+        if self.detector is not None:
+            self.detector.reset()
+
+
+class WatchScheduler(QObject):
+    """Decides when each watched region is captured next.
+
+    ``submit(name, detector)`` is called on the GUI thread whenever a region
+    is due. The owner reports the outcome with ``on_result``; the region is
+    not polled again until it has. One single-shot timer is re-armed for
+    the earliest due region, so idle regions cost nothing between polls.
+    """
+
+    def __init__(self, submit, min_interval_ms=250, max_interval_ms=4000, backoff=2.0,
+                 max_fps=20.0, cpu_budget=0.5, clock=time.monotonic, parent=None):
+        super().__init__(parent)
+        self.submit = submit
+        self.min_interval = min_interval_ms / 1000
+        self.max_interval = max_interval_ms / 1000
+        self.backoff = max(1.0, backoff)
+        self.max_fps = max_fps
+        self.cpu_budget = cpu_budget
+        self.clock = clock
+        self.regions = {}
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.tick)
+
+    def __contains__(self, name):
+        return name in self.regions
+
+    def names(self):
+        return list(self.regions)
+
+    def add(self, name, priority=1.0, detector=None):
+        """Start watching a region; it is captured right away."""
+        schedule = RegionSchedule(name, priority, detector)
+        self.regions[name] = schedule
+        schedule.interval = self.base_interval(schedule)
+        schedule.next_due = self.clock()
+        self._arm()
+        return schedule
+
+    def remove(self, name):
+        """Stop watching a region; returns its schedule, or None."""
+        schedule = self.regions.pop(name, None)
+        if not self.regions:
+            self.timer.stop()
+        return schedule
+
+    def clear(self):
+        self.regions.clear()
+        self.timer.stop()
+
+    def reset(self, name):
+        """Poll a region at the fast rate again, e.g. after it was redrawn."""
+        schedule = self.regions.get(name)
+        if schedule is not None:
+            schedule.reset()
+            schedule.interval = self.base_interval(schedule)
+            schedule.next_due = min(schedule.next_due, self.clock())
+            self._arm()
+
+    def interval(self, name):
+        """Current polling interval of a region, in seconds."""
+        return self.regions[name].interval
+
+    def base_interval(self, schedule):
+        """
+        The fastest a region may be polled, in seconds.
+
+        The region's share of the budgets is its priority over the total
+        priority of all watched regions. The frame budget limits how often
+        it is captured; the CPU budget limits capture + OCR time, as
+        measured on recent polls, to its share of ``cpu_budget`` cores.
+        """
+        total = sum(s.priority for s in self.regions.values()) or schedule.priority
+        share = schedule.priority / total
+        interval = self.min_interval
+        if self.max_fps:
+            interval = max(interval, 1.0 / (self.max_fps * share))
+        if self.cpu_budget and schedule.job_s:
+            interval = max(interval, schedule.job_s / (self.cpu_budget * share))
+        return interval
+
+    def on_result(self, name, changed, job_s=None):
+        """
+        Report how a capture of a region went and schedule the next one.
+
+        Args:
+            name (str): The region
+            changed (bool): Whether its pixels changed (OCR ran)
+            job_s (float): Seconds the capture (and OCR) took, if known
+        """
+        schedule = self.regions.get(name)
+        if schedule is None:
+            return
+        schedule.busy = False
+        schedule.polls += 1
+        if job_s is not None:
+            # Smooth over a few polls; OCR'd frames cost far more than skipped ones
+            schedule.job_s = job_s if not schedule.job_s else 0.7 * schedule.job_s + 0.3 * job_s
+        base = self.base_interval(schedule)
+        if changed:
+            schedule.changes += 1
+            schedule.interval = base
+        else:
+            schedule.interval = min(max(schedule.interval, base) * self.backoff,
+                                    max(self.max_interval, base))
+        schedule.next_due = self.clock() + schedule.interval
+        self._arm()
+
+    def tick(self):
+        """Submit every region that is due and re-arm the timer."""
+        now = self.clock()
+        due = [s for s in self.regions.values() if not s.busy and s.next_due <= now]
+        for schedule in due:
+            schedule.busy = True
+            self.submit(schedule.name, schedule.detector)
+        self._arm()
+        return [schedule.name for schedule in due]
+
+    def _arm(self):
+        waiting = [s.next_due for s in self.regions.values() if not s.busy]
+        if not waiting:
+            self.timer.stop()
+            return
+        delay_ms = max(0, int((min(waiting) - self.clock()) * 1000))
+        self.timer.start(delay_ms)
@@ -0,0 +1,140 @@
+import difflib
+import re
+from collections import deque
+
+# Characters Tesseract routinely swaps for one another, folded to a single
+# representative so the jitter does not look like new text.
+_CONFUSABLES = str.maketrans({
+    'l': '1', 'I': '1', 'i': '1', '|': '1', '!': '1',
+    'O': '0', 'o': '0', 'Q': '0', 'D': '0',
+    'S': '5', 's': '5',
+    'B': '8',
+    'Z': '2', 'z': '2',
+    'G': '6',
+})
+_NOISE = re.compile(r"[^\w ]+")
+
+
+def normalize_word(word):
+    """Fold OCR-confusable characters and drop punctuation from one word."""
+    word = word.replace('rn', 'm').replace('vv', 'w')
+    return _NOISE.sub('', word.translate(_CONFUSABLES)).casefold()
+
+
+def normalize_words(line):
+    """Normalized, non-empty words of a line."""
+    words = (normalize_word(w) for w in line.split())
+    return tuple(w for w in words if w)
+
+
+def _numbers(words):
+    """The words of a normalized line that are all digits, e.g. HUD values."""
+    return tuple(w for w in words if w.isdigit())
+
+
+def _labels(words):
+    """The other words of a normalized line, e.g. the "HP" of "HP 100"."""
+    return tuple(w for w in words if not w.isdigit())
+
+
+def _ratio(a, b):
+    """Similarity of two normalized word sequences, compared as text."""
+    a, b = ' '.join(a), ' '.join(b)
+    matcher = difflib.SequenceMatcher(None, a, b, autojunk=False)
+    if matcher.real_quick_ratio() < 0.5 or matcher.quick_ratio() < 0.5:
+        return 0.0
+    return matcher.ratio()
+
+
+class TextDiffer:
+    """Reports only the parts of successive OCR results that are new.
+
+    Lines already emitted are remembered (up to ``history`` of them) in
+    normalized form. A line is skipped when it is at least ``similarity``
+    alike to a remembered one and has the same numbers, so scrolling chat and
+    re-reads with OCR jitter produce nothing while a changed value ("HP 100"
+    to "HP 10") does not; the new value replaces the remembered one, so going
+    back to an earlier value is new again. A line that extends a remembered line, like a dialog box
+    typing out its text, yields only the appended words.
+    """
+
+    def __init__(self, similarity=0.85, history=50):
+        self.similarity = similarity
+        self.seen = deque(maxlen=history)
+
+    def reset(self):
+        """Forget everything emitted so far."""
+        self.seen.clear()
+
+    def new_lines(self, text):
+        """
+        Return the new lines (or new line endings) in an OCR result.
+
+        Args:
+            text (str): Full OCR output for the region
+
+        Returns:
+            list: Original-text lines, or trailing parts of lines, not seen before
+        """
+        result = []
+        current = set()  # Remembered lines matched or added for this text
+        for line in text.splitlines():
+            words = normalize_words(line)
+            if not words:
+                continue
+
+            numbers, labels = _numbers(words), _labels(words)
+            same = False
+            best_index, best_ratio = None, 0.0
+            old_index = None  # Same words with other numbers: an earlier value
+            for index, seen in enumerate(self.seen):
+                ratio = 1.0 if seen == words else _ratio(seen, words)
+                # One edit is a small part of a short line, so alike text
+                # with different numbers is a new value, not jitter
+                if ratio >= self.similarity and _numbers(seen) == numbers:
+                    same = True
+                    current.add(seen)
+                    break
+                # Lines with the same words shown together (one per party member) are
+                # separate lines, not values replacing each other
+                if numbers and _labels(seen) == labels and seen not in current:
+                    old_index = index
+                if ratio > best_ratio:
+                    best_index, best_ratio = index, ratio
+
+            if same:
+                continue
+            current.add(words)
+
+            if best_index is not None:
+                tail = self._appended_words(self.seen[best_index], words, line)
+                if tail:
+                    self.seen[best_index] = words
+                    result.append(tail)
+                    continue
+
+            if old_index is not None:
+                self.seen[old_index] = words
+            else:
+                self.seen.append(words)
+            result.append(line.strip())
+        return result
+
+    def diff(self, text):
+        """New lines of an OCR result joined back into text ('' if none)."""
+        return '\n'.join(self.new_lines(text))
+
+    def _appended_words(self, seen, words, line):
+        """Original words appended to a remembered line, or None."""
+        if len(words) <= len(seen) or _ratio(seen, words[:len(seen)]) < self.similarity:
+            return None
+        original = line.split()
+        # Map the normalized prefix length back onto the original words,
+        # skipping words that normalized away entirely (pure punctuation).
+        kept = 0
+        for position, word in enumerate(original):
+            if normalize_word(word):
+                kept += 1
+            if kept == len(seen):
+                return ' '.join(original[position + 1:]) or None
+        return None
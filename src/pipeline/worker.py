@@ -0,0 +1,244 @@
+import threading
+import time
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from src.metrics import metrics
+
+
+class JobState:
+    """Lifecycle states of an OCRJob."""
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    DONE = 'done'
+    SKIPPED = 'skipped'      # Frame unchanged, OCR not run
+    CANCELLED = 'cancelled'
+    FAILED = 'failed'
+
+    FINISHED = (DONE, SKIPPED, CANCELLED, FAILED)
+
+
+class OCRJob:
+    """A single capture -> OCR request for one region, or for a batch of regions.
+
+    Batch jobs have ``regions`` set instead of ``region``; their per-region
+    text ends up in ``results`` and the combined text in ``text``.
+    """
+
+    def __init__(self, region_name, region, monitor_index, source='hotkey', detector=None,
+                 preprocess=None, profile=None, regions=None):
+        self.region_name = region_name
+        self.region = region
+        self.monitor_index = monitor_index
+        self.source = source
+        self.detector = detector
+        self.preprocess = preprocess
+        self.profile = profile
+        self.regions = regions
+        self.results = {}
+        self.created = time.perf_counter()
+        self.state = JobState.QUEUED
+        self.text = ""
+        self.error = None
+        self.speech = None   # SpeechHandle once the text was handed to TTS
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """Ask the job to stop; results are discarded and speech is cut off."""
+        self._cancelled.set()
+        if self.speech is not None:
+            self.speech.cancel()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+
+class _Task(QRunnable):
+    """Adapts a plain callable to QThreadPool."""
+
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+
+    def run(self):
+        self.fn(*self.args)
+
+
+class OCRPipeline(QObject):
+    """Runs capture, OCR and speech off the Qt GUI thread.
+
+    Capture and OCR run on a thread pool; speech is handed to the TTS
+    speaker's own thread. Only one job per region is in flight
+    at a time; requests that arrive meanwhile are coalesced so that just the
+    newest one runs next. Results are delivered through Qt signals, which
+    Qt queues back onto the GUI thread.
+    """
+
+    text_ready = pyqtSignal(object)     # OCRJob with .text set
+    job_finished = pyqtSignal(object)   # OCRJob in one of JobState.FINISHED
+    state_changed = pyqtSignal(str, str)  # region name, JobState
+
+    def __init__(self, ocr, tts, max_threads=2, parent=None):
+        super().__init__(parent)
+        self.ocr = ocr
+        self.tts = tts
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads)
+        self._lock = threading.Lock()
+        self._running = {}   # region name -> OCRJob in flight
+        self._pending = {}   # region name -> newest OCRJob waiting to run
+        self._spoken = {}    # region name -> last OCRJob handed to TTS
+
+    def submit(self, region_name, region, monitor_index, source='hotkey', detector=None,
+               preprocess=None, profile=None):
+        """
+        Queue a capture -> OCR job for a region.
+
+        Args:
+            region_name (str): Key of the region in regions.json
+            region (tuple): (x, y, width, height) of the region to capture
+            monitor_index (int): Index of the monitor to capture from (0-based)
+            source (str): What triggered the job, e.g. 'hotkey' or 'watch'
+            detector (ChangeDetector): If given, skip OCR on unchanged frames
+            preprocess: The region's preprocessing preset or steps
+            profile: The region's OCR profile (PSM, OEM, language, whitelist)
+
+        Returns:
+            OCRJob: The job, which may be replaced by a newer one before it runs
+        """
+        job = OCRJob(region_name, region, monitor_index, source, detector, preprocess,
+                     profile)
+        return self._submit(job)
+
+    def submit_batch(self, batch_name, regions, source='hotkey'):
+        """
+        Queue one job that OCRs several regions from a single grab per monitor.
+
+        Args:
+            batch_name (str): Name the batch is tracked and coalesced under
+            regions (dict): Region name -> regions.json entry
+            source (str): What triggered the job
+
+        Returns:
+            OCRJob: The batch job; ``results`` maps region names to text
+        """
+        job = OCRJob(batch_name, None, None, source, regions=dict(regions))
+        return self._submit(job)
+
+    def _submit(self, job):
+        region_name = job.region_name
+        with self._lock:
+            if region_name in self._running:
+                dropped = self._pending.get(region_name)
+                self._pending[region_name] = job
+            else:
+                dropped = None
+                self._running[region_name] = job
+                job.state = JobState.RUNNING
+        if dropped is not None:
+            dropped.cancel()
+            dropped.state = JobState.CANCELLED
+        if job.state == JobState.RUNNING:
+            self._start(job)
+        else:
+            self.state_changed.emit(region_name, JobState.QUEUED)
+        return job
+
+    def speak(self, job, text=None):
+        """Hand a job's text (or the given part of it) to the TTS queue without waiting."""
+        if job.cancelled:
+            return None
+        with self._lock:
+            self._spoken[job.region_name] = job
+        # Newer text from the same region replaces whatever of the old is not yet heard
+        job.speech = self.tts.speak(job.text if text is None else text, group=job.region_name)
+        return job.speech
+
+    def cancel(self, region_name=None):
+        """Cancel the in-flight and queued jobs for a region, or for all regions."""
+        with self._lock:
+            names = [region_name] if region_name else list(set(self._running) | set(self._pending) | set(self._spoken))
+            jobs = [self._running.get(n) for n in names] + [self._pending.pop(n, None) for n in names]
+            jobs += [self._spoken.pop(n, None) for n in names]
+        for job in jobs:
+            if job is not None:
+                job.cancel()
+
+    def state(self, region_name):
+        """Return the JobState of the region's current job, or None if idle."""
+        with self._lock:
+            if region_name in self._pending:
+                return JobState.QUEUED
+            job = self._running.get(region_name)
+        return job.state if job else None
+
+    def is_busy(self, region_name=None):
+        """Whether a job is running for the region (or for any region)."""
+        with self._lock:
+            return bool(self._running) if region_name is None else region_name in self._running
+
+    def shutdown(self, timeout_ms=2000):
+        """Cancel everything and wait briefly for the workers to exit."""
+        self.cancel()
+        self.pool.waitForDone(timeout_ms)
+
+    def _start(self, job):
+        self.state_changed.emit(job.region_name, JobState.RUNNING)
+        self.pool.start(_Task(self._run, job))
+
+    def _run(self, job):
+        """Worker thread: capture, change check and OCR for one job."""
+        try:
+            if job.cancelled:
+                return
+            if job.regions is not None:
+                self._run_batch(job)
+                return
+            frame = self.ocr.grab_region(job.region, job.monitor_index)
+            if job.detector is not None and not job.detector.has_changed(frame):
+                metrics.incr('frames_skipped')
+                job.state = JobState.SKIPPED
+                return
+            if job.cancelled:
+                return
+            job.text = self.ocr.process_frame(frame, job.preprocess, job.profile)
+            if job.cancelled:
+                return
+            job.state = JobState.DONE
+            metrics.observe('job', (time.perf_counter() - job.created) * 1000)
+            self.text_ready.emit(job)
+        except Exception as e:
+            job.error = str(e)
+            job.state = JobState.FAILED
+        finally:
+            if job.cancelled and job.state not in (JobState.SKIPPED, JobState.FAILED):
+                job.state = JobState.CANCELLED
+            self._finish(job)
+
+    def _run_batch(self, job):
+        job.results = self.ocr.process_regions(job.regions)
+        if job.cancelled:
+            return
+        # Prefix each line with its region so several HUD values stay distinguishable
+        job.text = '\n'.join(
+            f"{name}: {text}" for name, text in job.results.items() if text
+        )
+        job.state = JobState.DONE
+        metrics.observe('batch_job', (time.perf_counter() - job.created) * 1000)
+        self.text_ready.emit(job)
+
+    def _finish(self, job):
+        with self._lock:
+            next_job = self._pending.pop(job.region_name, None)
+            if next_job is not None:
+                self._running[job.region_name] = next_job
+                next_job.state = JobState.RUNNING
+            else:
+                self._running.pop(job.region_name, None)
+        self.job_finished.emit(job)
+        if next_job is not None:
+            self._start(next_job)
+        else:
+            self.state_changed.emit(job.region_name, job.state)
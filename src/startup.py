@@ -0,0 +1,144 @@
+"""
+Background start-up of the slow subsystems (OCR engines and screen capture,
+speech), so the main window can appear immediately.
+"""
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+
+class Readiness:
+    """Start-up states of a subsystem."""
+    PENDING = 'pending'
+    LOADING = 'loading'
+    READY = 'ready'
+    FAILED = 'failed'
+
+
+class StartupProfile:
+    """Collects how long each start-up phase took, for --profile-startup."""
+
+    def __init__(self, enabled=False, start=None):
+        self.enabled = enabled
+        self.start = start if start is not None else time.perf_counter()
+        self.phases = []   # (subsystem, phase, started at ms, duration ms)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, subsystem, name):
+        """Time a block, e.g. ``with profile.phase('ocr', 'import'):``."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(subsystem, name, started, time.perf_counter())
+
+    def record(self, subsystem, name, started, finished):
+        """Add a phase measured elsewhere, from perf_counter() timestamps."""
+        with self._lock:
+            self.phases.append((subsystem, name, (started - self.start) * 1000,
+                                (finished - started) * 1000))
+
+    def mark(self, name):
+        """Record a milestone, such as the window being shown."""
+        now = time.perf_counter()
+        self.record('milestone', name, now, now)
+
+    def report(self):
+        """Phase breakdown as printable lines, in start order."""
+        with self._lock:
+            phases = sorted(self.phases, key=lambda phase: phase[2])
+        lines = [f"{'subsystem':<12}{'phase':<22}{'start ms':>10}{'took ms':>10}"]
+        for subsystem, name, started, took in phases:
+            lines.append(f"{subsystem:<12}{name:<22}{started:10.1f}{took:10.1f}")
+        return lines
+
+
+class BackgroundInit(QObject):
+    """Builds subsystems in parallel threads and reports their readiness.
+
+    Each subsystem is a name and a factory; factories run concurrently on
+    their own threads and their results are available from ``result()``
+    once ``state_changed`` reports them READY. Signals are emitted from the
+    worker threads, so Qt queues them onto the GUI thread.
+    """
+
+    state_changed = pyqtSignal(str, str)   # subsystem name, Readiness
+
+    def __init__(self, profile=None, parent=None):
+        super().__init__(parent)
+        self.profile = profile or StartupProfile()
+        self.factories = {}
+        self.states = {}
+        self.results = {}
+        self.errors = {}
+        self._lock = threading.Lock()
+        self._done = {}
+
+    def add(self, name, factory):
+        """Register a subsystem; ``factory()`` returns the built object."""
+        self.factories[name] = factory
+        self.states[name] = Readiness.PENDING
+        self._done[name] = threading.Event()
+
+    def start(self):
+        """Start building every registered subsystem."""
+        for name, factory in self.factories.items():
+            threading.Thread(
+                target=self._run, args=(name, factory), name=f'init-{name}', daemon=True
+            ).start()
+
+    def state(self, name):
+        with self._lock:
+            return self.states[name]
+
+    def result(self, name):
+        """The built subsystem, or None if it is not ready."""
+        with self._lock:
+            return self.results.get(name)
+
+    def all_ready(self):
+        with self._lock:
+            return all(state == Readiness.READY for state in self.states.values())
+
+    def failed(self):
+        """Names of subsystems that could not be started."""
+        with self._lock:
+            return [name for name, state in self.states.items() if state == Readiness.FAILED]
+
+    def wait(self, timeout=None):
+        """Block until every subsystem is ready or failed (for scripts and tests)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for done in self._done.values():
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not done.wait(remaining):
+                return False
+        return True
+
+    def _set_state(self, name, state):
+        with self._lock:
+            self.states[name] = state
+        self.state_changed.emit(name, state)
+
+    def _run(self, name, factory):
+        self._set_state(name, Readiness.LOADING)
+        started = time.perf_counter()
+        try:
+            result = factory()
+        except Exception as e:
+            logger.exception("Failed to start %s", name)
+            with self._lock:
+                self.errors[name] = e
+            self._set_state(name, Readiness.FAILED)
+        else:
+            with self._lock:
+                self.results[name] = result
+            self._set_state(name, Readiness.READY)
+        finally:
+            self.profile.record(name, 'total', started, time.perf_counter())
+            self._done[name].set()
@@ -0,0 +1,231 @@
+"""
+On-disk cache of synthesized speech.
+
+Phrases that come up again and again (menu labels, stock dialog lines) are
+rendered once to audio files with the engine's save-to-file support and
+afterwards played straight from disk, which starts almost instantly
+instead of waiting for the synthesizer. Clips are keyed by the text and
+the voice, rate and volume they were rendered with, and the least recently
+played clips are deleted to keep the cache under its size limit.
+"""
+import hashlib
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+import wave
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+EXTENSION = '.wav'
+
+
+def speech_key(text, voice, rate, volume):
+    """
+    Identify a clip by its text and the voice settings it is rendered with.
+
+    Whitespace is collapsed so re-read text maps to the same clip; case is
+    kept, since it can change pronunciation ("US" vs "us").
+
+    Returns:
+        str: Hex digest used as the clip's file name
+    """
+    text = ' '.join(text.split())
+    # Not a security boundary, just a compact file name
+    digest = hashlib.sha1(usedforsecurity=False)
+    digest.update(f"{voice}|{rate}|{volume:.3f}|{text}".encode('utf-8'))
+    return digest.hexdigest()
+
+
+class SpeechCache:
+    """Size-bounded LRU directory of rendered speech clips.
+
+    The index is rebuilt from the directory on start-up, oldest file first,
+    so the least recently played clips survive restarts in the right order.
+    """
+
+    def __init__(self, directory, max_bytes=64 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._clips = OrderedDict()   # key -> size in bytes, least recent first
+        self._bytes = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._load()
+
+    def _load(self):
+        clips = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.endswith('.tmp' + EXTENSION):
+                # Left behind by a render that never finished
+                os.remove(path)
+            elif name.endswith(EXTENSION):
+                stat = os.stat(path)
+                clips.append((stat.st_mtime, name[:-len(EXTENSION)], stat.st_size))
+        for _, key, size in sorted(clips):
+            self._clips[key] = size
+            self._bytes += size
+        self._evict()
+
+    def path(self, key):
+        return os.path.join(self.directory, key + EXTENSION)
+
+    def temp_path(self, key, tag=''):
+        """Where to render a clip before it is added; ``tag`` tells apart renders of one key."""
+        return os.path.join(self.directory, key + tag + '.tmp' + EXTENSION)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._clips
+
+    def get(self, key):
+        """
+        Look up a clip and mark it as recently played.
+
+        Returns:
+            str or None: Path of the clip, or None on a miss
+        """
+        with self._lock:
+            if key not in self._clips:
+                self.misses += 1
+                return None
+            self._clips.move_to_end(key)
+            self.hits += 1
+        path = self.path(key)
+        try:
+            os.utime(path)
+        except OSError:
+            # Deleted behind our back
+            self._forget(key)
+            return None
+        return path
+
+    def add(self, key, rendered_path):
+        """
+        Move a rendered clip into the cache.
+
+        Returns:
+            bool: False if the file is missing or holds no audio
+        """
+        try:
+            size = os.path.getsize(rendered_path)
+            if size <= 44:  # A WAV header and no samples
+                os.remove(rendered_path)
+                return False
+            os.replace(rendered_path, self.path(key))
+        except OSError as e:
+            logger.debug("Could not cache speech clip: %s", e)
+            return False
+        with self._lock:
+            self._bytes -= self._clips.pop(key, 0)
+            self._clips[key] = size
+            self._bytes += size
+            self._evict()
+        return True
+
+    def _evict(self):
+        while self._bytes > self.max_bytes and len(self._clips) > 1:
+            key, size = self._clips.popitem(last=False)
+            self._bytes -= size
+            try:
+                os.remove(self.path(key))
+            except OSError:
+                pass
+
+    def _forget(self, key):
+        with self._lock:
+            self._bytes -= self._clips.pop(key, 0)
+
+    def stats(self):
+        """Counters for display and metrics export."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'clips': len(self._clips), 'bytes': self._bytes}
+
+
+def clip_duration(path):
+    """Length of a WAV clip in seconds."""
+    with wave.open(path, 'rb') as clip:
+        return clip.getnframes() / float(clip.getframerate())
+
+
+class WinsoundPlayer:
+    """Plays clips with the Windows sound API, without a child process.
+
+    ``start`` returns as soon as the clip is playing, so the caller can
+    prepare the next clip meanwhile; ``play`` also waits for it to end.
+    """
+
+    def __init__(self):
+        import winsound
+        self.winsound = winsound
+
+    def start(self, path):
+        return _WinsoundPlayback(self.winsound, path)
+
+    def play(self, path, interrupt):
+        """Play a clip, stopping early if ``interrupt`` is set; True if it played to the end."""
+        return self.start(path).wait(interrupt)
+
+
+class _WinsoundPlayback:
+    def __init__(self, winsound, path):
+        self.winsound = winsound
+        self.ends = time.monotonic() + clip_duration(path)
+        winsound.PlaySound(path, winsound.SND_FILENAME | winsound.SND_ASYNC | winsound.SND_NODEFAULT)
+
+    def wait(self, interrupt):
+        if interrupt.wait(max(0.0, self.ends - time.monotonic())):
+            self.winsound.PlaySound(None, 0)
+            return False
+        return True
+
+
+class CommandPlayer:
+    """Plays clips with a command-line player such as afplay or aplay."""
+
+    def __init__(self, command):
+        self.command = command
+
+    def start(self, path):
+        return _ProcessPlayback(subprocess.Popen(self.command + [path], stdout=subprocess.DEVNULL,
+                                                 stderr=subprocess.DEVNULL))
+
+    def play(self, path, interrupt):
+        """Play a clip, stopping early if ``interrupt`` is set; True if it played to the end."""
+        return self.start(path).wait(interrupt)
+
+
+class _ProcessPlayback:
+    def __init__(self, process):
+        self.process = process
+
+    def wait(self, interrupt):
+        while self.process.poll() is None:
+            if interrupt.wait(0.02):
+                self.process.terminate()
+                self.process.wait()
+                return False
+        return self.process.returncode == 0
+
+
+def find_player():
+    """
+    A clip player for this platform.
+
+    Returns:
+        WinsoundPlayer, CommandPlayer or None if no way to play audio files was found
+    """
+    if sys.platform == 'win32':
+        return WinsoundPlayer()
+    for command in (['afplay'], ['paplay'], ['aplay', '-q']):
+        if shutil.which(command[0]):
+            return CommandPlayer(command)
+    return None
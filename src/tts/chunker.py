@@ -0,0 +1,62 @@
+"""
+Splitting text into chunks that can be synthesized and spoken one by one.
+
+Engines prepare a whole utterance before the first word is heard, so a
+paragraph is spoken as a series of sentences, and overlong sentences as
+clauses. The first chunk is kept as short as the text allows, since its
+synthesis time is the wait before anything is heard.
+"""
+import re
+
+# A sentence ends at . ! ? or … followed by whitespace, or at a line break
+_SENTENCE_END = re.compile(r'(?<=[.!?…])\s+|\s*\n\s*')
+# Clause boundaries, for sentences longer than a chunk
+_CLAUSE_END = re.compile(r'(?<=[,;:])\s+|\s+(?=[—–-]\s)')
+
+
+def _split_long(text, max_chars):
+    """Break a sentence longer than max_chars at clauses, then at spaces."""
+    pieces = []
+    for clause in _CLAUSE_END.split(text):
+        while len(clause) > max_chars:
+            cut = clause.rfind(' ', 0, max_chars + 1)
+            if cut <= 0:
+                cut = max_chars
+            pieces.append(clause[:cut].strip())
+            clause = clause[cut:].strip()
+        if clause:
+            pieces.append(clause)
+    return pieces
+
+
+def split_chunks(text, max_chars=120, min_chars=20):
+    """
+    Split text into sentence or clause sized chunks for streaming speech.
+
+    Args:
+        text (str): Text to speak
+        max_chars (int): Longer sentences are split at clauses, then words
+        min_chars (int): Shorter pieces are joined onto the chunk before
+            them (the first chunk is never grown, to keep the wait short)
+
+    Returns:
+        list: Non-empty chunks that together hold all of the words of text
+    """
+    pieces = []
+    for sentence in _SENTENCE_END.split(text.strip()):
+        sentence = ' '.join(sentence.split())
+        if not sentence:
+            continue
+        if len(sentence) > max_chars:
+            pieces.extend(_split_long(sentence, max_chars))
+        else:
+            pieces.append(sentence)
+
+    chunks = []
+    for piece in pieces:
+        if (len(chunks) > 1 and len(piece) < min_chars
+                and len(chunks[-1]) + 1 + len(piece) <= max_chars):
+            chunks[-1] += ' ' + piece
+        else:
+            chunks.append(piece)
+    return chunks
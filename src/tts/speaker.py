@@ -1,35 +1,523 @@
+import heapq
+import itertools
+import logging
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+
 import pyttsx3
 
+from src.metrics import metrics
+from src.tts.cache import speech_key
+from src.tts.chunker import split_chunks
+
+logger = logging.getLogger(__name__)
+
+
+class SpeechHandle:
+    """Returned by TTSSpeaker.speak to follow or cancel a single utterance.
+
+    The utterance is spoken as ``chunks`` (sentences or clauses). The
+    ``*_at`` attributes are time.perf_counter() readings, for measuring
+    latency: ``started_at`` when the speech thread took the utterance up,
+    ``first_audio_at`` when it was first heard and ``finished_at`` when it
+    ended; each is None until then.
+    """
+
+    QUEUED = 'queued'
+    SPEAKING = 'speaking'
+    DONE = 'done'
+    CANCELLED = 'cancelled'
+    DROPPED = 'dropped'      # Rejected as empty, duplicate or over the queue limit
+
+    def __init__(self, speaker, text, priority, group=None, chunks=None):
+        self._speaker = speaker
+        self.text = text
+        self.priority = priority
+        self.group = group
+        self.chunks = chunks or [text]
+        self.chunks_spoken = 0
+        self.superseded = False  # Newer text of the same group is waiting
+        self.state = self.QUEUED
+        self.queued_at = time.perf_counter()
+        self.started_at = None
+        self.first_audio_at = None
+        self.finished_at = None
+        self._done = threading.Event()
+
+    def cancel(self):
+        """Remove the utterance from the queue, or cut it off if it is playing."""
+        self._speaker._cancel(self)
+
+    def wait(self, timeout=None):
+        """Block until the utterance finished, was cancelled or dropped."""
+        return self._done.wait(timeout)
+
+    @property
+    def done(self):
+        return self._done.is_set()
+
+    @property
+    def first_audio_ms(self):
+        """Milliseconds from speak() until the utterance was first heard, or None."""
+        if self.first_audio_at is None:
+            return None
+        return (self.first_audio_at - self.queued_at) * 1000
+
+    def _heard(self):
+        if self.first_audio_at is None:
+            self.first_audio_at = time.perf_counter()
+            metrics.observe('tts_first_audio', self.first_audio_ms)
+
+    def _finish(self, state):
+        self.state = state
+        self.finished_at = time.perf_counter()
+        if state == self.DROPPED:
+            metrics.incr('tts_dropped')
+        self._done.set()
+
+
+def _normalize(text):
+    """Collapse whitespace and case so re-read text compares equal."""
+    return ' '.join(text.split()).casefold()
+
+
 class TTSSpeaker:
-    """Handles text-to-speech conversion."""
+    """Handles text-to-speech conversion on a dedicated speech thread.
 
-    def __init__(self):
-        print("Initializing TTS engine...")
-        self.engine = pyttsx3.init()
-        self.setup_voice()
-        print("TTS engine initialized successfully")
+    The pyttsx3 engine is created, configured and driven only by that
+    thread. speak() places text on a bounded priority queue and returns a
+    SpeechHandle immediately. With barge-in, new text flushes the queue and
+    interrupts the utterance being spoken.
+
+    Text is spoken a sentence or clause at a time (up to ``chunk_chars``
+    characters; 0 speaks it whole), so the first words are heard after only
+    the first chunk was synthesized. Text spoken with a ``group`` (e.g. the
+    region it was read from) supersedes earlier text of the same group:
+    queued utterances are cancelled and the one being spoken stops after
+    its current chunk.
+
+    With a SpeechCache and a clip player, chunks are rendered to clips and
+    played; the next chunk is rendered while the current one plays. A chunk
+    spoken ``cache_after`` times is kept in the cache and played from it
+    from then on; others are rendered while the speech thread is idle.
+    Rendering gives way as soon as something is queued to be spoken.
+    """
+
+    PRIORITY_HIGH = 0
+    PRIORITY_NORMAL = 1
+    PRIORITY_LOW = 2
+
+    def __init__(self, max_queue=8, barge_in=False, driver_name=None, cache=None, player=None,
+                 cache_after=2, chunk_chars=120):
+        logger.info("Initializing TTS engine...")
+        self.max_queue = max(1, max_queue)
+        self.barge_in = barge_in
+        self.driver_name = driver_name
+        self.rate = 150    # Speed of speech
+        self.volume = 0.9  # Volume (0.0 to 1.0)
+        self.voice = None  # Voice id, read from the engine when caching
+        self.engine = None
+        self.cache = cache if player is not None else None
+        self.player = player
+        self.cache_after = max(1, cache_after)
+        self.chunk_chars = chunk_chars
+        self._live = False              # The engine is speaking aloud, not to a file
+        self._seen = {}                 # clip key -> times spoken live
+        self._to_render = OrderedDict()  # clip key -> text, rendered when idle
+        self._prewarm = []              # Texts (or callables listing them) given to prewarm
+        self._rendering = False
+        self._queue = []   # heap of (priority, sequence, SpeechHandle)
+        self._sequence = itertools.count()
+        self._cond = threading.Condition()
+        self._current = None
+        self._last_text = None
+        self._interrupt = threading.Event()
+        self._running = True
+        self._init_error = None
+
+        ready = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(ready,), name='TTSSpeaker', daemon=True
+        )
+        self._thread.start()
+        ready.wait()
+        if self._init_error is not None:
+            raise self._init_error
+        logger.info("TTS engine initialized successfully")
 
     def setup_voice(self):
-        """Configure the TTS voice settings."""
-        print("Setting up TTS voice...")
-        self.engine.setProperty('rate', 150)    # Speed of speech
-        self.engine.setProperty('volume', 0.9)  # Volume (0.0 to 1.0)
-        print("TTS voice setup complete")
-
-    def speak(self, text):
-        """Convert text to speech."""
-        if text and text.strip():
-            print(f"TTS speaking: {text}")
+        """Configure the TTS voice settings (runs on the speech thread)."""
+        logger.debug("Setting up TTS voice...")
+        self.engine.setProperty('rate', self.rate)
+        self.engine.setProperty('volume', self.volume)
+        if self.cache is not None:
+            # Part of every clip's key, so a different voice never plays old clips
+            self.voice = self.engine.getProperty('voice')
+        logger.debug("TTS voice setup complete")
+
+    def clip_key(self, text):
+        """Speech cache key of text spoken with the current voice settings."""
+        return speech_key(text, self.voice, self.rate, self.volume)
+
+    def prewarm(self, texts):
+        """
+        Render clips for texts expected to come up, e.g. the most frequent
+        lines in the OCR history, while the speech thread has nothing to say.
+
+        Args:
+            texts: Iterable of texts, or a callable returning one; it is
+                called on the speech thread once it is idle, so a slow
+                query does not hold up the caller
+        """
+        if self.cache is None:
+            return
+        with self._cond:
+            self._prewarm.append(texts)
+            self._cond.notify()
+
+    def _add_prewarm(self, texts):
+        """Queue clips of texts given to prewarm for rendering (speech thread)."""
+        if callable(texts):
+            try:
+                texts = texts()
+            except Exception as e:
+                logger.warning("Could not list phrases to pre-render: %s", e)
+                return
+        clips = OrderedDict()
+        for text in texts:
+            for chunk in self.split(text or ''):
+                key = self.clip_key(chunk)
+                if key not in self.cache:
+                    clips[key] = chunk
+        with self._cond:
+            for key, chunk in clips.items():
+                self._to_render.setdefault(key, chunk)
+
+    def split(self, text):
+        """The chunks text is spoken in."""
+        if not self.chunk_chars:
+            return [text] if text.strip() else []
+        return split_chunks(text, self.chunk_chars)
+
+    def speak(self, text, priority=PRIORITY_NORMAL, interrupt=None, group=None):
+        """
+        Queue text to be spoken and return without waiting for it.
+
+        Args:
+            text (str): Text to speak
+            priority (int): Lower values are spoken first
+            interrupt (bool): Flush the queue and cut off the current
+                utterance; defaults to the speaker's barge_in setting
+            group: Text with the same group that has not been heard yet
+                is cancelled in favour of this text
+
+        Returns:
+            SpeechHandle: Handle for waiting on or cancelling the utterance
+        """
+        with metrics.span('tts_speak'):
+            return self._speak(text, priority, interrupt, group)
+
+    def _speak(self, text, priority, interrupt, group):
+        if not text or not text.strip():
+            handle = SpeechHandle(self, text, priority, group)
+            handle._finish(SpeechHandle.DROPPED)
+            return handle
+        handle = SpeechHandle(self, text, priority, group, self.split(text))
+
+        if interrupt is None:
+            interrupt = self.barge_in
+
+        normalized = _normalize(text)
+        with self._cond:
+            if normalized == self._last_text:
+                handle._finish(SpeechHandle.DROPPED)
+                return handle
+            self._last_text = normalized
+
+            if interrupt:
+                self._flush_locked()
+            else:
+                if group is not None:
+                    self._supersede_locked(group)
+                if len(self._queue) >= self.max_queue:
+                    # Drop the least important utterance, oldest first
+                    victim = max(self._queue + [(priority, next(self._sequence), handle)],
+                                 key=lambda item: (item[0], -item[1]))
+                    if victim[2] is handle:
+                        handle._finish(SpeechHandle.DROPPED)
+                        return handle
+                    self._queue.remove(victim)
+                    heapq.heapify(self._queue)
+                    victim[2]._finish(SpeechHandle.DROPPED)
+
+            logger.debug("TTS queued: %r", text)
+            heapq.heappush(self._queue, (priority, next(self._sequence), handle))
+            if self._rendering:
+                # Speak now, finish rendering later
+                self._interrupt.set()
+            self._cond.notify()
+        return handle
+
+    def flush(self):
+        """Drop every queued utterance and interrupt the one being spoken."""
+        with self._cond:
+            self._flush_locked()
+            self._last_text = None
+
+    def stop(self):
+        """Interrupt the utterance that is currently being spoken."""
+        with self._cond:
+            if self._current is not None:
+                self._interrupt.set()
+
+    def pending(self):
+        """Number of utterances waiting to be spoken."""
+        with self._cond:
+            return len(self._queue)
+
+    def shutdown(self, timeout=2.0):
+        """Stop the speech thread and release the engine."""
+        with self._cond:
+            self._running = False
+            self._flush_locked()
+            self._cond.notify()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    def _flush_locked(self):
+        for _, _, queued in self._queue:
+            queued._finish(SpeechHandle.CANCELLED)
+        self._queue = []
+        if self._current is not None:
+            self._interrupt.set()
+
+    def _supersede_locked(self, group):
+        """Cancel queued text of a group and stop its current text after this chunk."""
+        kept = []
+        for item in self._queue:
+            if item[2].group == group:
+                item[2]._finish(SpeechHandle.CANCELLED)
+            else:
+                kept.append(item)
+        if len(kept) != len(self._queue):
+            self._queue = kept
+            heapq.heapify(self._queue)
+        if self._current is not None and self._current.group == group:
+            self._current.superseded = True
+
+    def _cancel(self, handle):
+        with self._cond:
+            if handle is self._current:
+                self._interrupt.set()
+                return
+            for item in self._queue:
+                if item[2] is handle:
+                    self._queue.remove(item)
+                    heapq.heapify(self._queue)
+                    handle._finish(SpeechHandle.CANCELLED)
+                    return
+
+    def _on_word(self, name, location, length):
+        """Engine callback; the only safe place to stop the engine mid-utterance."""
+        current = self._current
+        if self._live and current is not None:
+            current._heard()
+        if self._interrupt.is_set() or (not self._live and current is not None and current.superseded):
+            # A superseded utterance needs no more clips rendered
+            self.engine.stop()
+
+    def _run(self, ready):
+        """Speech thread: owns the engine and speaks queued utterances in order."""
+        try:
+            if sys.platform == 'win32':
+                import pythoncom  # SAPI5 needs COM initialized on this thread
+                pythoncom.CoInitialize()
+            self.engine = pyttsx3.init(self.driver_name)
+            self.engine.connect('started-word', self._on_word)
+            self.setup_voice()
+        except Exception as e:
+            self._init_error = e
+            ready.set()
+            return
+        ready.set()
+
+        while True:
+            with self._cond:
+                while (self._running and not self._queue and not self._to_render
+                       and not self._prewarm):
+                    self._cond.wait()
+                if not self._running:
+                    break
+                self._interrupt.clear()
+                handle = prewarm = None
+                if self._queue:
+                    _, _, handle = heapq.heappop(self._queue)
+                    self._current = handle
+                    handle.state = SpeechHandle.SPEAKING
+                elif self._prewarm:
+                    prewarm = self._prewarm.pop(0)
+                else:
+                    key, text = self._to_render.popitem(last=False)
+                    self._rendering = True
+            if prewarm is not None:
+                self._add_prewarm(prewarm)
+                continue
+            if handle is None:
+                self._render(key, text)
+                continue
+            handle.started_at = time.perf_counter()
+            metrics.observe('tts_queue_wait', (handle.started_at - handle.queued_at) * 1000)
+
+            try:
+                with metrics.span('tts_utterance'):
+                    self._speak_chunks(handle)
+            except Exception as e:
+                logger.error("Error during speech: %s", e)
+
+            with self._cond:
+                self._current = None
+                interrupted = self._interrupt.is_set() or (
+                    handle.superseded and handle.chunks_spoken < len(handle.chunks))
+            handle._finish(SpeechHandle.CANCELLED if interrupted else SpeechHandle.DONE)
+
+        logger.debug("Cleaning up TTS resources...")
+        try:
+            self.engine.stop()
+        except Exception:
+            pass
+        logger.debug("TTS cleanup complete")
+
+    def _speak_chunks(self, handle):
+        """Speak a handle's chunks in order until done, interrupted or superseded."""
+        ahead = None  # Clip of the next chunk, rendered while the current one played
+        try:
+            for index, chunk in enumerate(handle.chunks):
+                if self._interrupt.is_set() or handle.superseded:
+                    return
+                clip, ahead = ahead or self._prepare(handle, index), None
+                if self._interrupt.is_set() or handle.superseded:
+                    ahead = clip  # Deleted below if it was rendered for nothing
+                    return
+                if clip is None:
+                    self._say(chunk)
+                else:
+                    key, path, rendered = clip
+                    playback = self.player.start(path)
+                    handle._heard()
+                    if index + 1 < len(handle.chunks) and not handle.superseded:
+                        # Synthesize the next chunk while this one plays
+                        ahead = self._prepare(handle, index + 1)
+                    finished = playback.wait(self._interrupt)
+                    self._played(key, chunk, path, rendered, finished)
+                if self._interrupt.is_set():
+                    return
+                handle.chunks_spoken += 1
+        finally:
+            if ahead is not None and ahead[2]:
+                _remove(ahead[1])
+
+    def _say(self, text):
+        """Speak text live through the engine."""
+        self._live = True
+        try:
             self.engine.say(text)
             self.engine.runAndWait()
-            print("TTS finished speaking")
+        finally:
+            self._live = False
+        if self.cache is not None and not self._interrupt.is_set():
+            with self._cond:
+                self._count_locked(self.clip_key(text), text)
+
+    def _prepare(self, handle, index):
+        """
+        A clip of a handle's chunk to play: from the cache, or freshly rendered.
+
+        Returns:
+            tuple: (key, path, rendered), or None to speak the chunk live
+        """
+        if self.cache is None:
+            return None
+        text = handle.chunks[index]
+        key = self.clip_key(text)
+        path = self.cache.get(key)
+        if path is not None:
+            return key, path, False
+        # Alternate file names so the next chunk never overwrites the playing one
+        path = self.cache.temp_path(key, f'.{index % 2}')
+        try:
+            with metrics.span('tts_render'):
+                self.engine.save_to_file(text, path)
+                self.engine.runAndWait()
+        except Exception as e:
+            logger.warning("Could not render speech clip: %s", e)
+        stopped = self._interrupt.is_set() or handle.superseded
+        if stopped or not os.path.exists(path) or os.path.getsize(path) <= 44:
+            _remove(path)
+            return None
+        return key, path, True
+
+    def _played(self, key, text, path, rendered, finished):
+        """Keep a freshly rendered clip if its text is common enough, else delete it."""
+        if not rendered:
+            metrics.incr('tts_clip_hits')
+            return
+        keep = False
+        if finished:
+            with self._cond:
+                keep = self._count_locked(key, text, rendered=True)
+        if not keep or not self.cache.add(key, path):
+            _remove(path)
+
+    def _count_locked(self, key, text, rendered=False):
+        """
+        Note that text was spoken; once it is common enough it belongs in the
+        cache, rendered now if it was not already.
+
+        Returns:
+            bool: True if a rendered clip of the text should be kept
+        """
+        if len(self._seen) > 10000:
+            self._seen.clear()
+        count = self._seen.get(key, 0) + 1
+        if count < self.cache_after:
+            self._seen[key] = count
+            return False
+        self._seen.pop(key, None)
+        if not rendered:
+            self._to_render[key] = text
+        return True
+
+    def _render(self, key, text):
+        """Synthesize text to a clip file (speech thread, while idle)."""
+        path = self.cache.temp_path(key)
+        try:
+            with metrics.span('tts_render'):
+                self.engine.save_to_file(text, path)
+                self.engine.runAndWait()
+        except Exception as e:
+            logger.warning("Could not render speech clip: %s", e)
+        with self._cond:
+            self._rendering = False
+            interrupted = self._interrupt.is_set()
+            if interrupted:
+                # Try again the next time there is nothing to say
+                self._to_render[key] = text
+        if interrupted:
+            _remove(path)
+        elif self.cache.add(key, path):
+            logger.debug("Cached speech clip for %r", text)
 
     def __del__(self):
         """Clean up TTS resources."""
-        print("Cleaning up TTS resources...")
-        self.engine.stop()
-        try:
-            self.engine.endLoop()
-        except:
-            pass
-        print("TTS cleanup complete") 
\ No newline at end of file
+        if getattr(self, '_thread', None) is not None:
+            self.shutdown()
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
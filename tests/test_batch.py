@@ -0,0 +1,180 @@
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import numpy as np
+from PIL import Image
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.ocr import batch
+
+
+class FakePool:
+    """Reads back the gray level of the image's first pixel."""
+
+    def __init__(self):
+        self.profiles = []
+
+    def recognize(self, image, profile=None):
+        self.profiles.append(profile)
+        return f" level {image[0, 0]} \n"
+
+    def close(self):
+        pass
+
+
+class TestIterImagePaths(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = self.tmp.name
+        os.makedirs(os.path.join(self.root, 'sub'))
+        for name in ('b.png', 'a.jpg', 'notes.txt', os.path.join('sub', 'c.png')):
+            with open(os.path.join(self.root, name), 'w') as f:
+                f.write('x')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def names(self, paths):
+        return [os.path.relpath(path, self.root) for path in paths]
+
+    def test_directory_is_walked_in_sorted_order(self):
+        self.assertEqual(self.names(batch.iter_image_paths([self.root])),
+                         ['a.jpg', 'b.png', os.path.join('sub', 'c.png')])
+
+    def test_not_recursive(self):
+        self.assertEqual(self.names(batch.iter_image_paths([self.root], recursive=False)),
+                         ['a.jpg', 'b.png'])
+
+    def test_glob_and_duplicates(self):
+        inputs = [os.path.join(self.root, '*.png'), os.path.join(self.root, 'b.png'), self.root]
+        self.assertEqual(self.names(batch.iter_image_paths(inputs)),
+                         ['b.png', 'a.jpg', os.path.join('sub', 'c.png')])
+
+    def test_is_lazy(self):
+        paths = batch.iter_image_paths([self.root])
+        self.assertEqual(self.names([next(paths)]), ['a.jpg'])
+
+
+class TestOcrFiles(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.paths = []
+        for level in (10, 200, 30):
+            path = os.path.join(self.tmp.name, f"{level}.png")
+            Image.fromarray(np.full((20, 40), level, dtype=np.uint8)).save(path)
+            self.paths.append(path)
+        self.pool = FakePool()
+        patcher = mock.patch.object(batch, 'create_engine_pool', return_value=self.pool)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_in_process(self):
+        results = list(batch.ocr_files(self.paths, workers=1, profile='subtitle'))
+        self.assertEqual([r['text'] for r in results], ['level 10', 'level 200', 'level 30'])
+        self.assertEqual([r['path'] for r in results], self.paths)
+        self.assertTrue(all(r['error'] is None for r in results))
+        self.assertEqual(self.pool.profiles[0].psm, 7)
+
+    def test_preprocess_and_skip(self):
+        results = list(batch.ocr_files(self.paths, workers=1, preprocess=[{'op': 'invert'}],
+                                       skip={self.paths[1]}))
+        self.assertEqual([r['text'] for r in results], ['level 245', 'level 225'])
+
+    def test_unknown_preset_fails_before_starting_workers(self):
+        with mock.patch.object(batch, 'ProcessPoolExecutor') as executor:
+            with self.assertRaises(ValueError):
+                list(batch.ocr_files(self.paths, workers=2, profile='nope'))
+            with self.assertRaises(ValueError):
+                list(batch.ocr_files(self.paths, workers=2, preprocess='nope'))
+        executor.assert_not_called()
+
+    def test_unreadable_file_is_reported(self):
+        broken = os.path.join(self.tmp.name, 'broken.png')
+        with open(broken, 'w') as f:
+            f.write('not an image')
+        result = list(batch.ocr_files([broken], workers=1))[0]
+        self.assertEqual(result['text'], '')
+        self.assertIn('UnidentifiedImageError', result['error'])
+
+
+class TestDrain(unittest.TestCase):
+    def test_ordered_waits_for_the_oldest(self):
+        release = threading.Event()
+        with ThreadPoolExecutor(2) as executor:
+            pending = deque([executor.submit(lambda: release.wait(2) and 'slow'),
+                             executor.submit(lambda: 'fast')])
+            release.set()
+            self.assertEqual(list(batch._drain(pending, True, 0)), ['slow', 'fast'])
+
+    def test_as_completed_yields_the_first_done(self):
+        release = threading.Event()
+        with ThreadPoolExecutor(2) as executor:
+            pending = deque([executor.submit(lambda: release.wait(2) and 'slow'),
+                             executor.submit(lambda: 'fast')])
+            drain = batch._drain(pending, False, 0)
+            self.assertEqual(next(drain), 'fast')
+            release.set()
+            self.assertEqual(list(drain), ['slow'])
+
+    def test_keeps_some_pending(self):
+        with ThreadPoolExecutor(2) as executor:
+            pending = deque(executor.submit(lambda i=i: i) for i in range(5))
+            self.assertEqual(list(batch._drain(pending, True, 3)), [0, 1])
+            self.assertEqual(len(pending), 3)
+
+
+class TestOutput(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.results = [
+            {'path': 'a.png', 'text': 'one, "two"\nthree', 'ms': 1.0, 'error': None},
+            {'path': 'b.png', 'text': '', 'ms': 2.0, 'error': 'OSError: broken'},
+            {'path': 'c.png', 'text': 'four', 'ms': 3.0, 'error': None},
+        ]
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, fmt):
+        path = os.path.join(self.tmp.name, f"out.{fmt}")
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = batch.ResultWriter(f, fmt)
+            for result in self.results:
+                writer.write(result)
+        return path
+
+    def test_jsonl_resume(self):
+        path = self.write('jsonl')
+        # A run killed halfway through a line
+        with open(path, 'a') as f:
+            f.write('{"path": "d.png", "te')
+        self.assertEqual(batch.completed_paths(path), {'a.png', 'c.png'})
+
+    def test_csv_round_trip(self):
+        path = self.write('csv')
+        self.assertEqual(batch.completed_paths(path, 'csv'), {'a.png', 'c.png'})
+
+    def test_missing_output(self):
+        self.assertEqual(batch.completed_paths(os.path.join(self.tmp.name, 'none.jsonl')), set())
+
+    def test_jsonl_lines(self):
+        out = io.StringIO()
+        batch.ResultWriter(out).write(self.results[0])
+        self.assertEqual(json.loads(out.getvalue()), self.results[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from mss.screenshot import ScreenShot
+from PIL import Image
+from PyQt5.QtGui import QColor, QImage
+
+from src.ocr.capture import mss_to_array, qimage_to_array, to_grayscale
+
+
+class TestCapture(unittest.TestCase):
+    def test_mss_array_is_a_view(self):
+        raw = bytearray(range(256)) * (8 * 6 * 4 // 256 + 1)
+        raw = raw[:8 * 6 * 4]
+        shot = ScreenShot(raw, {'left': 0, 'top': 0, 'width': 8, 'height': 6})
+        frame = mss_to_array(shot)
+        self.assertEqual(frame.shape, (6, 8, 4))
+        raw[0] = 123
+        self.assertEqual(frame[0, 0, 0], 123)
+
+    def test_qimage_array_is_bgra(self):
+        image = QImage(7, 5, QImage.Format_RGB32)
+        image.fill(QColor(10, 20, 30))
+        frame = qimage_to_array(image)
+        self.assertEqual(frame.shape, (5, 7, 4))
+        self.assertEqual(tuple(frame[2, 3, :3]), (30, 20, 10))
+
+    def test_qimage_array_outlives_image(self):
+        frame = qimage_to_array(QImage(4, 4, QImage.Format_Indexed8).convertToFormat(QImage.Format_RGB32))
+        self.assertEqual(frame.shape, (4, 4, 4))
+
+    def test_grayscale_matches_pillow(self):
+        frame = np.random.default_rng(1).integers(0, 256, (20, 30, 4), dtype=np.uint8)
+        expected = np.asarray(Image.fromarray(np.ascontiguousarray(frame[:, :, 2::-1])).convert('L'))
+        gray = to_grayscale(frame)
+        self.assertEqual(gray.dtype, np.uint8)
+        self.assertLessEqual(np.abs(gray.astype(int) - expected).max(), 1)
+
+    def test_grayscale_into_buffer(self):
+        frame = np.full((3, 3, 4), 200, dtype=np.uint8)
+        out = np.empty((3, 3), dtype=np.uint8)
+        self.assertIs(to_grayscale(frame, out), out)
+        self.assertTrue((out == 200).all())
+
+
+if __name__ == '__main__':
+    unittest.main()
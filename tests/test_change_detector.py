@@ -0,0 +1,59 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.ocr.change_detector import ChangeDetector
+
+
+def make_frame(value=255):
+    frame = np.full((120, 300, 4), value, dtype=np.uint8)
+    frame[:, :, 3] = 255
+    return frame
+
+
+class TestChangeDetector(unittest.TestCase):
+    def setUp(self):
+        self.detector = ChangeDetector()
+
+    def test_first_frame_is_changed(self):
+        self.assertTrue(self.detector.has_changed(make_frame()))
+
+    def test_identical_frame_is_skipped(self):
+        self.detector.has_changed(make_frame())
+        self.assertFalse(self.detector.has_changed(make_frame()))
+
+    def test_small_noise_is_skipped(self):
+        self.detector.has_changed(make_frame(200))
+        noisy = make_frame(200)
+        noisy[::7, ::5, :3] += 3
+        self.assertFalse(self.detector.has_changed(noisy))
+
+    def test_new_text_is_detected(self):
+        self.detector.has_changed(make_frame())
+        frame = make_frame()
+        frame[40:60, 100:140, :3] = 0  # a dark glyph-sized patch
+        self.assertTrue(self.detector.has_changed(frame))
+        # The changed frame became the reference
+        self.assertFalse(self.detector.has_changed(frame))
+
+    def test_threshold_ignores_small_changes(self):
+        detector = ChangeDetector(threshold=0.5)
+        detector.has_changed(make_frame())
+        frame = make_frame()
+        frame[40:60, 100:140, :3] = 0
+        self.assertFalse(detector.has_changed(frame))
+
+    def test_resize_and_reset(self):
+        self.detector.has_changed(make_frame())
+        self.assertTrue(self.detector.has_changed(np.full((50, 50), 255, dtype=np.uint8)))
+        self.detector.reset()
+        self.assertTrue(self.detector.has_changed(make_frame()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,190 @@
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+from PIL import Image
+
+from src import cli
+from src.ocr import batch
+
+REGIONS = {
+    'subtitle': {'region': [0, 600, 800, 60], 'monitor': 0},
+    'chat': {'region': [900, 100, 300, 400], 'monitor': 0, 'group': 'hud'},
+    'score': {'region': [0, 0, 100, 30], 'monitor': 1, 'group': 'hud'},
+}
+
+
+class FakeOCR:
+    """Returns the next scripted result for every region on each pass."""
+
+    def __init__(self, passes):
+        self.passes = list(passes)
+        self.calls = []
+
+    def process_regions(self, regions):
+        self.calls.append(list(regions))
+        text = self.passes.pop(0)
+        return {name: text for name in regions}
+
+
+class TestSelectRegions(unittest.TestCase):
+    def test_all_regions_by_default(self):
+        self.assertEqual(list(cli.select_regions(REGIONS)), ['subtitle', 'chat', 'score'])
+
+    def test_names_keep_their_order(self):
+        self.assertEqual(list(cli.select_regions(REGIONS, ['score', 'subtitle'])), ['score', 'subtitle'])
+
+    def test_group(self):
+        self.assertEqual(list(cli.select_regions(REGIONS, group='hud')), ['chat', 'score'])
+
+    def test_unknown_name(self):
+        with self.assertRaises(KeyError):
+            cli.select_regions(REGIONS, ['subtitle', 'minimap'])
+
+
+class TestRun(unittest.TestCase):
+    def lines(self, out):
+        return [json.loads(line) for line in out.getvalue().splitlines()]
+
+    def test_single_pass_writes_one_line_per_region(self):
+        ocr = FakeOCR(["Hello \n"])
+        out = io.StringIO()
+        self.assertEqual(cli.run(ocr, cli.select_regions(REGIONS, group='hud'), out=out), 1)
+        lines = self.lines(out)
+        self.assertEqual([line['region'] for line in lines], ['chat', 'score'])
+        self.assertEqual({line['text'] for line in lines}, {'Hello'})
+        self.assertEqual({line['seq'] for line in lines}, {0})
+        self.assertIn('ms', lines[0])
+
+    def test_interval_with_count(self):
+        ocr = FakeOCR(["a", "b", "c"])
+        out = io.StringIO()
+        self.assertEqual(cli.run(ocr, {'chat': REGIONS['chat']}, interval=0, count=3, out=out), 3)
+        self.assertEqual([line['text'] for line in self.lines(out)], ['a', 'b', 'c'])
+
+    def test_changes_only(self):
+        ocr = FakeOCR(["a", "a", "b"])
+        out = io.StringIO()
+        cli.run(ocr, {'chat': REGIONS['chat']}, interval=0, count=3, changes_only=True, out=out)
+        self.assertEqual([(line['seq'], line['text']) for line in self.lines(out)], [(0, 'a'), (2, 'b')])
+
+
+class TestMain(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.regions_path = os.path.join(self.tmp.name, 'regions.json')
+        with open(self.regions_path, 'w') as f:
+            json.dump({'regions': REGIONS, 'current_region_name': 'chat'}, f)
+        self.config_path = os.path.join(self.tmp.name, 'config.json')
+        with open(self.config_path, 'w') as f:
+            json.dump({'logging': {'console': False}}, f)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def main(self, *args):
+        return cli.main(['--regions', self.regions_path, '--config', self.config_path, *args])
+
+    def test_unknown_region_fails(self):
+        self.assertEqual(self.main('minimap'), 2)
+
+    def test_missing_regions_file_fails(self):
+        self.assertEqual(cli.main(['--regions', os.path.join(self.tmp.name, 'none.json'),
+                                   '--config', self.config_path]), 1)
+
+
+class TestHistoryCommand(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'history.sqlite3')
+        self.config_path = os.path.join(self.tmp.name, 'config.json')
+        with open(self.config_path, 'w') as f:
+            json.dump({'logging': {'console': False}, 'history': {'path': self.path}}, f)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_search(self):
+        from src.history import HistoryStore
+
+        store = HistoryStore(self.path)
+        store.record('chat', "gg well played")
+        store.record('hud', "HP 75")
+        store.close()
+        out = io.StringIO()
+        with mock.patch('sys.stdout', out):
+            self.assertEqual(cli.main(['history', 'well', '--since', '1h',
+                                       '--config', self.config_path]), 0)
+        rows = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual([(row['region'], row['text']) for row in rows], [('chat', "gg well played")])
+
+    def test_missing_database_fails(self):
+        self.assertEqual(cli.main(['history', '--config', self.config_path]), 1)
+        self.assertFalse(os.path.exists(self.path))
+
+
+class TestBatchCommand(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.images = os.path.join(self.tmp.name, 'shots')
+        os.makedirs(self.images)
+        for i in range(3):
+            Image.fromarray(np.full((10, 10), i, dtype=np.uint8)).save(
+                os.path.join(self.images, f"{i}.png"))
+        self.config_path = os.path.join(self.tmp.name, 'config.json')
+        with open(self.config_path, 'w') as f:
+            json.dump({'logging': {'console': False}}, f)
+        self.output = os.path.join(self.tmp.name, 'out.jsonl')
+        self.recognized = []
+        pool = mock.Mock()
+        pool.recognize.side_effect = lambda image, profile: self.recognized.append(image[0, 0]) or 'text'
+        patcher = mock.patch.object(batch, 'create_engine_pool', return_value=pool)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def batch(self, *args):
+        return cli.main(['batch', self.images, '--workers', '1', '--output', self.output,
+                         '--config', self.config_path, *args])
+
+    def test_resume_skips_finished_files(self):
+        self.assertEqual(self.batch(), 0)
+        with open(self.output) as f:
+            lines = f.readlines()
+        self.assertEqual(len(lines), 3)
+        # Pretend the run was killed while writing the last line
+        with open(self.output, 'w') as f:
+            f.writelines(lines[:1] + [lines[1][:10]])
+
+        self.recognized.clear()
+        self.assertEqual(self.batch('--resume'), 0)
+        self.assertEqual(self.recognized, [1, 2])
+        with open(self.output) as f:
+            paths = [json.loads(line)['path'] for line in f]
+        self.assertEqual([os.path.basename(path) for path in paths], ['0.png', '1.png', '2.png'])
+
+    def test_resume_needs_output(self):
+        with self.assertRaises(SystemExit):
+            cli.main(['batch', self.images, '--resume'])
+
+    def test_unknown_presets_are_rejected(self):
+        with mock.patch('sys.stderr'):
+            for option in ('--profile', '--preprocess'):
+                with self.assertRaises(SystemExit) as raised:
+                    self.batch(option, 'nope')
+                self.assertEqual(raised.exception.code, 2)
+        self.assertEqual(self.recognized, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import os
+import sys
+import unittest
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PyQt5.QtWidgets import QApplication
+
+from src.gui.geometry import Monitor, ScreenGeometry
+
+
+class TestMonitor(unittest.TestCase):
+    def test_unscaled_is_identity(self):
+        monitor = Monitor(0, 0, 0, 1920, 1080)
+        self.assertEqual(monitor.to_physical((10, 20, 300, 40)), (10, 20, 300, 40))
+        self.assertEqual(monitor.physical, (0, 0, 1920, 1080))
+
+    def test_scaled_secondary_monitor(self):
+        # 4K panel at 150% to the right of a 1080p one
+        monitor = Monitor(1, 1920, 0, 2560, 1440, scale=1.5)
+        self.assertEqual(monitor.physical, (1920, 0, 3840, 2160))
+        physical = monitor.to_physical((2020, 100, 200, 50))
+        self.assertEqual(physical, (2070, 150, 300, 75))
+        self.assertEqual(monitor.to_logical(physical), (2020, 100, 200, 50))
+
+
+class TestScreenGeometry(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_layout_is_cached_until_invalidated(self):
+        geometry = ScreenGeometry()
+        changes = []
+        geometry.changed.connect(lambda: changes.append(True))
+        monitors = geometry.monitors
+        self.assertEqual(len(monitors), len(self.app.screens()))
+        self.assertIs(geometry.monitors, monitors)
+
+        geometry.invalidate()
+        self.assertEqual(changes, [True])
+        self.assertIsNot(geometry.monitors, monitors)
+
+    def test_matches_qt_screens(self):
+        geometry = ScreenGeometry()
+        screen = self.app.screens()[0]
+        monitor = geometry.monitor(0)
+        self.assertEqual((monitor.left, monitor.top), (screen.geometry().x(), screen.geometry().y()))
+        self.assertEqual(monitor.scale, screen.devicePixelRatio())
+
+
+if __name__ == '__main__':
+    unittest.main()
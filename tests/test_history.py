@@ -0,0 +1,117 @@
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.history import HistoryStore, fts_query, parse_time
+
+
+class TestHistoryStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'history.sqlite3')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def open(self, **kwargs):
+        store = HistoryStore(self.path, **kwargs)
+        self.addCleanup(store.close)
+        return store
+
+    def test_search_words_and_prefixes(self):
+        store = self.open()
+        store.record('quest', "Quest updated: find the merchant", ms=40.0, source='watch')
+        store.record('chat', "gg well played")
+        store.record('quest', "Quests complete")
+        self.assertTrue(store.flush())
+
+        found = store.search("quest merchant")
+        self.assertEqual([row['text'] for row in found], ["Quest updated: find the merchant"])
+        self.assertEqual(found[0]['region'], 'quest')
+        self.assertEqual(found[0]['ms'], 40.0)
+        self.assertEqual(found[0]['source'], 'watch')
+        # Newest first; "quest" also matches "Quests"
+        self.assertEqual([row['text'] for row in store.search("quest")],
+                         ["Quests complete", "Quest updated: find the merchant"])
+        # Punctuation is not query syntax
+        self.assertEqual(len(store.search('find: "the-merchant')), 1)
+        self.assertEqual(len(store.search("-")), 3)
+
+    def test_filters(self):
+        store = self.open()
+        now = time.time()
+        store.record('chat', "old hello", ts=now - 3600)
+        store.record('chat', "new hello", ts=now)
+        store.record('hud', "hello hud", ts=now)
+        store.flush()
+        self.assertEqual([row['text'] for row in store.search("hello", region='chat')],
+                         ["new hello", "old hello"])
+        self.assertEqual([row['text'] for row in store.search("hello", since=now - 60, region='chat')],
+                         ["new hello"])
+        self.assertEqual([row['text'] for row in store.search("", until=now - 60)], ["old hello"])
+        self.assertEqual(len(store.search("", limit=2)), 2)
+
+    def test_rows_are_written_in_batches(self):
+        store = self.open(flush_ms=200)
+        for i in range(50):
+            store.record('chat', f"line {i}")
+        store.flush()
+        self.assertEqual(store.written, 50)
+        self.assertEqual(len(store.search("line", limit=100)), 50)
+
+    def test_full_queue_drops_instead_of_blocking(self):
+        store = self.open(max_queue=1)
+        # The writer is busy opening the database, so the queue can fill up
+        results = [store.record('chat', f"line {i}") for i in range(1000)]
+        self.assertIn(False, results)
+        self.assertEqual(store.dropped, results.count(False))
+
+    def test_retention_on_open(self):
+        store = self.open()
+        now = time.time()
+        store.record('chat', "ancient", ts=now - 40 * 86400)
+        for i in range(5):
+            store.record('chat', f"recent {i}", ts=now + i)
+        store.close()
+
+        store = self.open(max_age_days=30, max_rows=3)
+        self.assertEqual([row['text'] for row in store.search("")],
+                         ["recent 4", "recent 3", "recent 2"])
+        # The full-text index forgets deleted rows too
+        self.assertEqual(store.search("ancient"), [])
+
+    def test_frequent(self):
+        store = self.open()
+        for text in ["Inventory full"] * 3 + ["Quest complete"] * 2 + ["once"]:
+            store.record('hud', text)
+        store.flush()
+        self.assertEqual(store.frequent(), [("Inventory full", 3), ("Quest complete", 2)])
+        self.assertEqual(store.frequent(limit=1), [("Inventory full", 3)])
+
+    def test_data_survives_restart(self):
+        store = self.open()
+        store.record('chat', "persisted")
+        store.close()
+        self.assertEqual(len(self.open().search("persisted")), 1)
+
+
+class TestParsing(unittest.TestCase):
+    def test_parse_time(self):
+        self.assertEqual(parse_time("2h", now=10000), 10000 - 7200)
+        self.assertEqual(parse_time("90s", now=1000), 910)
+        self.assertEqual(parse_time("1700000000"), 1700000000)
+        self.assertGreater(parse_time("2024-05-01T20:00"), 1700000000)
+        with self.assertRaises(ValueError):
+            parse_time("yesterday")
+
+    def test_fts_query_quotes_words(self):
+        self.assertEqual(fts_query('HP: 75% "boss"'), '"HP"* "75"* "boss"*')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import os
+import sys
+import time
+import unittest
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PyQt5.QtWidgets import QApplication
+
+from src.hotkeys.backend import SyntheticBackend, format_combo, normalize_combo
+from src.hotkeys.manager import HotkeyManager
+
+
+class TestHotkeyManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.backend = SyntheticBackend()
+        self.manager = HotkeyManager(
+            {'process': 'alt+shift+space', 'watch': 'Alt + Shift + W', 'quit': None},
+            backend=self.backend, debounce_ms=0
+        )
+        self.actions = []
+        self.manager.triggered.connect(self.actions.append)
+        self.manager.start()
+
+    def tearDown(self):
+        self.manager.stop()
+
+    def test_press_triggers_action(self):
+        self.backend.press('alt+shift+space')
+        self.assertEqual(self.actions, ['process'])
+
+    def test_remapped_binding(self):
+        self.backend.press('alt+shift+w')
+        self.assertEqual(self.actions, ['watch'])
+        self.assertEqual(self.manager.binding('watch'), 'alt+shift+w')
+        self.assertIsNone(self.manager.binding('quit'))
+
+    def test_auto_repeat_is_suppressed_until_release(self):
+        for _ in range(5):
+            self.backend.press('alt+shift+space')
+        self.assertEqual(self.actions, ['process'])
+        self.backend.release('alt+shift+space')
+        self.backend.press('alt+shift+space')
+        self.assertEqual(self.actions, ['process', 'process'])
+
+    def test_missed_release_expires(self):
+        self.manager.hold_timeout = 0.01
+        self.backend.press('alt+shift+space')
+        time.sleep(0.02)
+        self.backend.press('alt+shift+space')
+        self.assertEqual(self.actions, ['process', 'process'])
+
+    def test_debounce(self):
+        self.manager.debounce = 10
+        self.backend.press('alt+shift+space')
+        self.backend.release('alt+shift+space')
+        self.backend.press('alt+shift+space')
+        self.assertEqual(self.actions, ['process'])
+
+    def test_unbound_combo_is_ignored(self):
+        self.backend.press('alt+shift+x')
+        self.assertEqual(self.actions, [])
+
+    def test_stop_detaches_backend(self):
+        self.manager.stop()
+        self.backend.press('alt+shift+space')
+        self.assertEqual(self.actions, [])
+
+
+class TestComboFormatting(unittest.TestCase):
+    def test_normalize(self):
+        self.assertEqual(normalize_combo(' Alt + Shift+Space '), 'alt+shift+space')
+
+    def test_format(self):
+        self.assertEqual(format_combo('alt+shift+space'), 'Alt+Shift+Space')
+
+
+if __name__ == '__main__':
+    unittest.main()
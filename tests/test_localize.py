@@ -0,0 +1,149 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.config import DEFAULT_CONFIG
+from src.ocr import processor as processor_module
+from src.ocr.localize import find_text_boxes, localize
+from src.ocr.processor import OCRProcessor
+
+
+def render(lines, size=(800, 400), background='plain', seed=0, fill=15, level=235, font_size=24):
+    """Dark text at the given (x, y) positions on a light background."""
+    width, height = size
+    if background == 'noisy':
+        rng = np.random.default_rng(seed)
+        pixels = np.clip(200 + rng.integers(-35, 36, (height, width)), 0, 255).astype(np.uint8)
+    else:
+        pixels = np.full((height, width), level, dtype=np.uint8)
+    img = Image.fromarray(pixels)
+    draw = ImageDraw.Draw(img)
+    font = ImageFont.load_default(size=font_size)
+    for (x, y), text in lines:
+        draw.text((x, y), text, fill=fill, font=font)
+    return np.asarray(img).copy()
+
+
+def contains(box, x, y):
+    bx, by, bw, bh = box
+    return bx <= x < bx + bw and by <= y < by + bh
+
+
+class TestFindTextBoxes(unittest.TestCase):
+    def test_blank_image_has_no_boxes(self):
+        self.assertEqual(find_text_boxes(render([])), [])
+        self.assertEqual(find_text_boxes(render([], background='noisy')), [])
+
+    def test_lines(self):
+        gray = render([((40, 300), "Press E to open the gate"),
+                       ((40, 340), "Quest updated"),
+                       ((600, 30), "Score 123")])
+        boxes = find_text_boxes(gray)
+        self.assertEqual(len(boxes), 3)
+        # Top to bottom: the score, then the two lines
+        self.assertTrue(contains(boxes[0], 650, 40))
+        self.assertTrue(contains(boxes[1], 45, 310))
+        self.assertTrue(contains(boxes[2], 45, 350))
+        # Each box spans its row, so no word is cut off at either end
+        for x, y, width, height in boxes:
+            self.assertEqual((x, width), (0, 800))
+            self.assertLess(height, 60)
+
+    def test_words_stay_on_one_line(self):
+        boxes = find_text_boxes(render([((40, 100), "one two   three")]))
+        self.assertEqual(len(boxes), 1)
+
+    def test_noisy_background(self):
+        boxes = find_text_boxes(render([((100, 200), "Hello World")], background='noisy'))
+        self.assertEqual(len(boxes), 1)
+        self.assertTrue(contains(boxes[0], 110, 210))
+
+    def test_low_contrast_small_text(self):
+        for fill, level, font_size in ((140, 200, 10), (140, 200, 12), (90, 160, 10), (90, 160, 12)):
+            gray = render([((20, 200), "Press E to open the gate")],
+                          fill=fill, level=level, font_size=font_size)
+            boxes = localize(gray)
+            self.assertEqual(len(boxes), 1, (fill, level, font_size))
+            self.assertTrue(contains(boxes[0], 20, 200 + font_size // 2))
+
+    def test_text_too_faint_to_find_is_read_whole(self):
+        gray = render([((20, 200), "Press E to open the gate")], fill=140, level=200, font_size=8)
+        self.assertEqual(find_text_boxes(gray), [])
+        self.assertIsNone(localize(gray))
+        # Only a flat image is known to hold no text
+        self.assertEqual(localize(render([])), [])
+        self.assertIsNone(localize(render([], background='noisy')))
+
+    def test_tiny_image(self):
+        self.assertEqual(find_text_boxes(np.zeros((3, 3), dtype=np.uint8)), [])
+
+    def test_text_filling_the_image_is_not_cropped(self):
+        lines = [((5, 2 + 30 * i), "The quick brown fox") for i in range(4)]
+        gray = render(lines, size=(240, 120))
+        self.assertIsNone(localize(gray))
+
+
+class FakePool:
+    """Records the images it was asked to read."""
+
+    backend = 'fake'
+    size = 1
+
+    def __init__(self):
+        self.shapes = []
+
+    def recognize(self, image, profile=None):
+        self.shapes.append(image.shape)
+        return f"line {len(self.shapes)}\n"
+
+    def close(self):
+        pass
+
+
+class FakeMSS:
+    monitors = [{'left': 0, 'top': 0, 'width': 800, 'height': 400}] * 2
+
+
+class TestProcessFrame(unittest.TestCase):
+    def make_processor(self, enabled):
+        config = dict(DEFAULT_CONFIG, cache=dict(DEFAULT_CONFIG['cache'], enabled=False),
+                      localize=dict(DEFAULT_CONFIG['localize'], enabled=enabled))
+        self.pool = FakePool()
+        with mock.patch.object(processor_module.mss, 'mss', FakeMSS), \
+                mock.patch.object(processor_module, 'create_engine_pool', return_value=self.pool):
+            return OCRProcessor(config)
+
+    def test_only_text_lines_are_ocrd(self):
+        processor = self.make_processor(True)
+        gray = render([((40, 300), "Press E to open the gate"), ((600, 30), "Score 123")])
+        self.assertEqual(processor.process_frame(gray), "line 1\nline 2")
+        self.assertEqual(len(self.pool.shapes), 2)
+        for height, width in self.pool.shapes:
+            self.assertLess(height, 60)
+
+    def test_blank_frame_skips_ocr(self):
+        processor = self.make_processor(True)
+        self.assertEqual(processor.process_frame(render([])), "")
+        self.assertEqual(self.pool.shapes, [])
+
+    def test_undetected_text_reads_whole_frame(self):
+        processor = self.make_processor(True)
+        gray = render([((20, 200), "Press E")], fill=140, level=200, font_size=8)
+        self.assertEqual(processor.process_frame(gray), "line 1")
+        self.assertEqual(self.pool.shapes, [(400, 800)])
+
+    def test_disabled(self):
+        processor = self.make_processor(False)
+        self.assertEqual(processor.process_frame(render([])), "line 1")
+        self.assertEqual(self.pool.shapes, [(400, 800)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import io
+import logging
+import os
+import sys
+import unittest
+from unittest import mock
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.log import RingBufferHandler, ring_buffer, setup_logging, shutdown_logging
+
+
+class TestLogging(unittest.TestCase):
+    def tearDown(self):
+        shutdown_logging()
+        root = logging.getLogger('src')
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        root.propagate = True
+
+    def test_records_reach_ring_buffer_and_console(self):
+        stderr = io.StringIO()
+        with mock.patch.object(sys, 'stderr', stderr):
+            setup_logging({'level': 'INFO'})
+            start, _ = ring_buffer.since()
+            logger = logging.getLogger('src.ocr.processor')
+            logger.info("captured %d frames", 3)
+            logger.debug("OCR text %r", "hidden")
+            shutdown_logging()
+        _, lines = ring_buffer.since(start)
+        self.assertEqual(len(lines), 1)
+        self.assertIn("INFO    src.ocr.processor: captured 3 frames", lines[0])
+        self.assertIn("captured 3 frames", stderr.getvalue())
+        self.assertNotIn("hidden", stderr.getvalue())
+
+    def test_console_can_be_disabled(self):
+        stderr = io.StringIO()
+        with mock.patch.object(sys, 'stderr', stderr):
+            setup_logging({'level': 'DEBUG', 'console': False})
+            logging.getLogger('src.tts.speaker').debug("TTS queued")
+            shutdown_logging()
+        self.assertEqual(stderr.getvalue(), "")
+
+    def test_no_console_when_frozen_without_stderr(self):
+        with mock.patch.object(sys, 'stderr', None):
+            setup_logging()
+            logging.getLogger('src.main').warning("still recorded")
+            shutdown_logging()
+        _, lines = ring_buffer.since(0)
+        self.assertTrue(any("still recorded" in line for line in lines))
+
+
+class TestRingBufferHandler(unittest.TestCase):
+    def test_keeps_last_records(self):
+        handler = RingBufferHandler(capacity=3)
+        for i in range(5):
+            handler.emit(logging.makeLogRecord({'msg': f"line {i}"}))
+        sequence, lines = handler.since(0)
+        self.assertEqual(sequence, 5)
+        self.assertEqual(lines, ["line 2", "line 3", "line 4"])
+        self.assertEqual(handler.since(4)[1], ["line 4"])
+
+
+if __name__ == '__main__':
+    unittest.main()
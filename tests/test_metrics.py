@@ -0,0 +1,79 @@
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.metrics import Metrics
+
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        self.metrics = Metrics(window=100)
+
+    def test_percentiles(self):
+        for ms in range(1, 101):
+            self.metrics.observe('ocr', ms)
+        stats = self.metrics.snapshot()['latency_ms']['ocr']
+        self.assertEqual(stats['count'], 100)
+        self.assertEqual(stats['sum'], 5050)
+        self.assertEqual(stats['p50'], 51)
+        self.assertEqual(stats['p95'], 96)
+        self.assertEqual(stats['p99'], 100)
+
+    def test_window_is_rolling(self):
+        for ms in range(1000):
+            self.metrics.observe('ocr', ms)
+        stats = self.metrics.snapshot()['latency_ms']['ocr']
+        self.assertEqual(stats['count'], 1000)
+        self.assertGreaterEqual(stats['p50'], 900)
+
+    def test_span_records_duration(self):
+        with self.metrics.span('capture'):
+            pass
+        stats = self.metrics.snapshot()['latency_ms']['capture']
+        self.assertEqual(stats['count'], 1)
+        self.assertGreaterEqual(stats['p50'], 0.0)
+
+    def test_span_records_on_error(self):
+        with self.assertRaises(ValueError):
+            with self.metrics.span('capture'):
+                raise ValueError()
+        self.assertEqual(self.metrics.snapshot()['latency_ms']['capture']['count'], 1)
+
+    def test_counters_are_thread_safe(self):
+        def work():
+            for _ in range(1000):
+                self.metrics.incr('frames')
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(self.metrics.snapshot()['counters']['frames'], 4000)
+
+    def test_prometheus_format(self):
+        self.metrics.observe('ocr', 20)
+        self.metrics.incr('frames', 3)
+        text = self.metrics.to_prometheus()
+        self.assertIn("# TYPE streamerocr_ocr_seconds summary", text)
+        self.assertIn('streamerocr_ocr_seconds{quantile="0.5"} 0.020000', text)
+        self.assertIn("streamerocr_ocr_seconds_count 1", text)
+        self.assertIn("streamerocr_frames_total 3", text)
+
+    def test_export_json(self):
+        self.metrics.incr('cache_hits')
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'metrics.json')
+            self.metrics.export(path)
+            with open(path) as f:
+                self.assertEqual(json.load(f)['counters'], {'cache_hits': 1})
+            self.assertEqual(os.listdir(tmp), ['metrics.json'])
+
+
+if __name__ == '__main__':
+    unittest.main()
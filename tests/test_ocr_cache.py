@@ -0,0 +1,80 @@
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.ocr.cache import OCRCache, content_key, perceptual_hash
+
+
+def make_image(seed):
+    return np.random.default_rng(seed).integers(0, 256, (40, 120), dtype=np.uint8)
+
+
+class TestOCRCache(unittest.TestCase):
+    def test_hit_and_miss_counters(self):
+        cache = OCRCache()
+        image = make_image(0)
+        self.assertIsNone(cache.get(image, 'eng'))
+        cache.put(image, 'eng', "hello")
+        self.assertEqual(cache.get(image.copy(), 'eng'), "hello")
+        self.assertIsNone(cache.get(image, 'deu'))
+        stats = cache.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 2))
+
+    def test_key_depends_on_shape_and_config(self):
+        image = make_image(1)
+        self.assertNotEqual(content_key(image, 'a'), content_key(image, 'b'))
+        self.assertNotEqual(content_key(image), content_key(image.reshape(120, 40)))
+
+    def test_lru_eviction(self):
+        cache = OCRCache(max_bytes=3 * 210)
+        images = [make_image(i) for i in range(4)]
+        for i, image in enumerate(images[:3]):
+            cache.put(image, '', str(i))
+        cache.get(images[0], '')            # 0 becomes most recently used
+        cache.put(images[3], '', "3")       # evicts 1
+        self.assertEqual(cache.get(images[0], ''), "0")
+        self.assertIsNone(cache.get(images[1], ''))
+        self.assertLessEqual(cache.stats()['bytes'], 3 * 210)
+
+    def test_perceptual_hit_on_pixel_noise(self):
+        image = np.full((40, 120), 255, dtype=np.uint8)
+        image[10:30, 10:110:6] = 0
+        cache = OCRCache(perceptual=True)
+        cache.put(image, 'eng', "text")
+        noisy = image.copy()
+        noisy[5, 5] = 0
+        self.assertEqual(cache.get(noisy, 'eng'), "text")
+        self.assertEqual(cache.stats()['perceptual_hits'], 1)
+        self.assertIsNone(cache.get(255 - image, 'eng'))
+
+    def test_images_too_small_to_hash_are_not_matched(self):
+        cache = OCRCache(perceptual=True)
+        first = np.random.default_rng(3).integers(0, 256, (14, 60), dtype=np.uint8)
+        second = np.random.default_rng(4).integers(0, 256, (14, 60), dtype=np.uint8)
+        cache.put(first, 'eng', "HP 42")
+        self.assertIsNone(perceptual_hash(first))
+        self.assertIsNone(cache.get(second, 'eng'))
+        self.assertEqual(cache.get(first, 'eng'), "HP 42")
+
+    def test_disk_tier_survives_restart(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'cache.sqlite3')
+            image = make_image(2)
+            cache = OCRCache(disk_path=path)
+            cache.put(image, 'eng', "persisted")
+            cache.close()
+
+            cache = OCRCache(disk_path=path)
+            self.assertEqual(cache.get(image, 'eng'), "persisted")
+            self.assertEqual(cache.stats()['disk_hits'], 1)
+            cache.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
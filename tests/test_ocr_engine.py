@@ -0,0 +1,85 @@
+import os
+import sys
+import threading
+import unittest
+from unittest import mock
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.ocr import engine as engine_module
+from src.ocr.engine import EnginePool, PytesseractEngine, create_engine_pool
+from src.ocr.profile import OCRProfile, PSM_SINGLE_LINE
+
+
+class FakeEngine:
+    backend = 'fake'
+
+    def __init__(self):
+        self.calls = 0
+        self.closed = False
+
+    def recognize(self, image, profile=None):
+        self.calls += 1
+        return "text"
+
+    def close(self):
+        self.closed = True
+
+
+class TestEnginePool(unittest.TestCase):
+    def test_engines_are_reused(self):
+        created = []
+        pool = EnginePool(lambda: created.append(FakeEngine()) or created[-1], size=2)
+        for _ in range(5):
+            self.assertEqual(pool.recognize(None), "text")
+        self.assertEqual(len(created), 1)
+        self.assertEqual(created[0].calls, 5)
+        self.assertEqual(pool.backend, 'fake')
+
+    def test_pool_never_exceeds_size(self):
+        created = []
+        pool = EnginePool(lambda: created.append(FakeEngine()) or created[-1], size=2)
+        release = threading.Event()
+        held = threading.Barrier(3)
+
+        def worker():
+            with pool.acquire():
+                held.wait()
+                release.wait()
+
+        threads = [threading.Thread(target=worker) for _ in range(2)]
+        for t in threads:
+            t.start()
+        held.wait()
+        self.assertEqual(len(created), 2)
+        release.set()
+        for t in threads:
+            t.join()
+        pool.recognize(None)
+        self.assertEqual(len(created), 2)
+
+    def test_close_releases_engines(self):
+        pool = EnginePool(FakeEngine, size=1)
+        with pool.acquire() as engine:
+            pass
+        pool.close()
+        self.assertTrue(engine.closed)
+
+    def test_falls_back_to_pytesseract(self):
+        with mock.patch.object(engine_module, '_load_library', return_value=None):
+            pool = create_engine_pool(size=1)
+        self.assertEqual(pool.backend, PytesseractEngine.backend)
+
+    def test_pytesseract_engine_applies_profile(self):
+        profile = OCRProfile(psm=PSM_SINGLE_LINE, whitelist='0123456789')
+        with mock.patch.object(engine_module.pytesseract, 'image_to_string',
+                               return_value="42") as image_to_string:
+            self.assertEqual(PytesseractEngine('eng').recognize(None, profile), "42")
+        config = image_to_string.call_args.kwargs['config']
+        self.assertIn("--psm 7", config)
+        self.assertIn("tessedit_char_whitelist=0123456789", config)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,7 +10,7 @@ class TestOCRProcessor(unittest.TestCase):
         region = (0, 0, 100, 100)
         image = self.processor.capture_region(region)
         self.assertIsNotNone(image)
-        self.assertEqual(image.size, (100, 100))
+        self.assertEqual(image.shape, (100, 100, 4))
 
     def tearDown(self):
         del self.processor
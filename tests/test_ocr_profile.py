@@ -0,0 +1,51 @@
+import os
+import sys
+import unittest
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.ocr.profile import (OCRProfile, PROFILE_PRESETS, PSM_AUTO, PSM_SINGLE_LINE,
+                             OEM_DEFAULT, OEM_LSTM, preset_name)
+
+
+class TestOCRProfile(unittest.TestCase):
+    def test_defaults_for_missing_profile(self):
+        profile = OCRProfile.from_dict(None)
+        self.assertEqual(profile.psm, PSM_AUTO)
+        self.assertEqual(profile.oem, OEM_DEFAULT)
+        self.assertEqual(profile.lang, 'eng')
+        self.assertEqual(profile.whitelist, '')
+        self.assertIsNone(profile.dpi)
+
+    def test_round_trip(self):
+        profile = OCRProfile(psm=PSM_SINGLE_LINE, oem=OEM_LSTM, lang='eng+deu',
+                             whitelist='0123456789', dpi=300)
+        self.assertEqual(OCRProfile.from_dict(profile.to_dict()), profile)
+
+    def test_partial_dict_keeps_defaults(self):
+        profile = OCRProfile.from_dict({'whitelist': 'ABC'})
+        self.assertEqual(profile.psm, PSM_AUTO)
+        self.assertEqual(profile.whitelist, 'ABC')
+
+    def test_key_distinguishes_settings(self):
+        self.assertNotEqual(OCRProfile().key, OCRProfile(psm=PSM_SINGLE_LINE).key)
+        self.assertEqual(OCRProfile().key, OCRProfile.from_dict({}).key)
+
+    def test_engine_key_ignores_per_call_settings(self):
+        self.assertEqual(OCRProfile().engine_key,
+                         OCRProfile(psm=PSM_SINGLE_LINE, whitelist='0123456789').engine_key)
+        self.assertNotEqual(OCRProfile().engine_key, OCRProfile(lang='deu').engine_key)
+
+    def test_tesseract_config(self):
+        config = OCRProfile(psm=PSM_SINGLE_LINE, whitelist='0123456789', dpi=300).tesseract_config()
+        self.assertEqual(config, "--psm 7 --oem 3 --dpi 300 -c tessedit_char_whitelist=0123456789")
+
+    def test_preset_name(self):
+        self.assertEqual(preset_name(OCRProfile()), 'default')
+        self.assertEqual(preset_name(OCRProfile.from_dict(PROFILE_PRESETS['digits'].to_dict())), 'digits')
+        self.assertIsNone(preset_name(OCRProfile(lang='deu')))
+
+
+if __name__ == '__main__':
+    unittest.main()
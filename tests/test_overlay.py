@@ -0,0 +1,79 @@
+import math
+import os
+import sys
+import unittest
+from unittest import mock
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PyQt5.QtWidgets import QApplication
+
+from src.gui.overlay import OverlayWindow
+
+
+class TestOverlayWindow(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.overlay = OverlayWindow(font_size=12, max_width=300, max_lines=3, max_chars=40)
+
+    def tearDown(self):
+        self.overlay.close()
+
+    def test_same_text_is_not_laid_out_again(self):
+        self.overlay.set_text("Hello World")
+        with mock.patch.object(self.overlay.static_text, 'prepare') as prepare, \
+                mock.patch.object(self.overlay, 'update') as update:
+            self.overlay.set_text("Hello World")
+            self.overlay.set_text("  Hello World\n")
+        prepare.assert_not_called()
+        update.assert_not_called()
+
+    def test_window_fits_text(self):
+        self.overlay.set_text("Hi")
+        small = self.overlay.geometry()
+        self.overlay.set_text("Quest updated: Find the missing merchant in town")
+        large = self.overlay.geometry()
+        self.assertGreater(large.width(), small.width())
+        self.assertLessEqual(large.width(), 300 + 2 * self.overlay.padding)
+        # Wrapped onto more lines
+        self.assertGreater(large.height(), small.height())
+
+    def test_same_size_repaints_only_the_text(self):
+        self.overlay.set_text("1234")
+        geometry = self.overlay.geometry()
+        with mock.patch.object(self.overlay, 'update') as update:
+            self.overlay.set_text("5678")
+        self.assertEqual(self.overlay.geometry(), geometry)
+        update.assert_called_once_with(self.overlay.text_rect())
+
+    def test_window_fits_the_drawn_layout(self):
+        self.overlay.max_chars = 80
+        self.overlay.set_text("Quest updated: Find the missing merchant in town and then go back")
+        drawn = self.overlay.static_text.size().height()
+        # Room for every drawn line, and not for another one
+        self.assertGreaterEqual(self.overlay.text_rect().height(), math.ceil(drawn))
+        self.assertLess(self.overlay.text_rect().height(), drawn + 10)
+        self.assertLessEqual(self.overlay.width(), 300 + 2 * self.overlay.padding)
+
+    def test_long_text_is_capped(self):
+        text = "\n".join(f"line {i}" for i in range(10)) + "\n" + "x" * 100
+        capped = self.overlay.cap_text(text)
+        lines = capped.splitlines()
+        self.assertEqual(lines[:2], ["line 8", "line 9"])
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(len(lines[2]), 40)
+        self.assertTrue(lines[2].endswith('…'))
+
+    def test_clear(self):
+        self.overlay.set_text("Hello")
+        self.overlay.set_text("")
+        self.assertEqual(self.overlay.text, "")
+        self.overlay.repaint()  # Nothing to draw, must not fail
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+import os
+import sys
+import threading
+import time
+import unittest
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PyQt5.QtWidgets import QApplication
+
+from src.pipeline.worker import JobState, OCRPipeline
+
+
+class FakeOCR:
+    def __init__(self):
+        self.release = threading.Event()
+        self.release.set()
+        self.started = threading.Event()
+        self.calls = []
+
+    def grab_region(self, region, monitor_index):
+        return region
+
+    def process_frame(self, frame, preprocess=None, profile=None):
+        self.calls.append(frame)
+        self.started.set()
+        self.release.wait(5)
+        return f"text {frame}"
+
+    def process_regions(self, regions):
+        self.calls.append(sorted(regions))
+        return {name: f"text {data['region']}" if data['region'] else "" for name, data in regions.items()}
+
+
+class FakeTTS:
+    def __init__(self):
+        self.spoken = []
+
+    def speak(self, text, group=None):
+        self.spoken.append(text)
+        return FakeHandle()
+
+
+class FakeHandle:
+    def __init__(self):
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+def wait_for(condition, timeout=5):
+    app = QApplication.instance()
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        app.processEvents()
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestOCRPipeline(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.ocr = FakeOCR()
+        self.tts = FakeTTS()
+        self.pipeline = OCRPipeline(self.ocr, self.tts)
+        self.finished = []
+        self.texts = []
+        self.pipeline.job_finished.connect(self.finished.append)
+        self.pipeline.text_ready.connect(self.texts.append)
+
+    def tearDown(self):
+        self.ocr.release.set()
+        self.pipeline.shutdown()
+
+    def test_result_is_delivered_by_signal(self):
+        job = self.pipeline.submit('r', 1, 0)
+        self.assertTrue(wait_for(lambda: self.finished))
+        self.assertEqual(job.state, JobState.DONE)
+        self.assertEqual([j.text for j in self.texts], ["text 1"])
+        self.assertFalse(self.pipeline.is_busy('r'))
+
+    def test_requests_are_coalesced(self):
+        self.ocr.release.clear()
+        self.pipeline.submit('r', 1, 0)
+        self.assertTrue(self.ocr.started.wait(5))
+        dropped = [self.pipeline.submit('r', n, 0) for n in (2, 3)]
+        newest = self.pipeline.submit('r', 4, 0)
+        self.assertEqual(self.pipeline.state('r'), JobState.QUEUED)
+        self.ocr.release.set()
+        self.assertTrue(wait_for(lambda: len(self.finished) == 2))
+        self.assertEqual(self.ocr.calls, [1, 4])
+        self.assertTrue(all(j.state == JobState.CANCELLED for j in dropped))
+        self.assertEqual(newest.state, JobState.DONE)
+
+    def test_cancel_discards_in_flight_job(self):
+        self.ocr.release.clear()
+        job = self.pipeline.submit('r', 1, 0)
+        self.assertTrue(self.ocr.started.wait(5))
+        self.pipeline.cancel('r')
+        self.ocr.release.set()
+        self.assertTrue(wait_for(lambda: self.finished))
+        self.assertEqual(job.state, JobState.CANCELLED)
+        self.assertEqual(self.texts, [])
+
+    def test_cancel_cuts_off_speech(self):
+        job = self.pipeline.submit('r', 1, 0)
+        self.assertTrue(wait_for(lambda: self.texts))
+        handle = self.pipeline.speak(job)
+        self.assertEqual(self.tts.spoken, ["text 1"])
+        self.pipeline.cancel('r')
+        self.assertTrue(handle.cancelled)
+
+    def test_batch_results_are_combined(self):
+        regions = {'hp': {'region': 1, 'monitor': 0}, 'empty': {'region': 0, 'monitor': 0},
+                   'ammo': {'region': 2, 'monitor': 0}}
+        job = self.pipeline.submit_batch('all', regions)
+        self.assertTrue(wait_for(lambda: self.finished))
+        self.assertEqual(job.state, JobState.DONE)
+        self.assertEqual(self.ocr.calls, [['ammo', 'empty', 'hp']])
+        self.assertEqual(job.results['hp'], "text 1")
+        self.assertEqual(job.text, "hp: text 1\nammo: text 2")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.ocr import preprocess
+from src.ocr.preprocess import PRESETS, Preprocessor
+
+
+def make_text_image(light_text=False):
+    image = np.full((30, 60), 40 if light_text else 220, dtype=np.uint8)
+    image[10:20, 10:50:4] = 230 if light_text else 20
+    return image
+
+
+class TestPreprocess(unittest.TestCase):
+    def test_otsu_binarizes_in_place(self):
+        image = make_text_image()
+        result = preprocess.otsu(image)
+        self.assertIs(result, image)
+        self.assertEqual(set(np.unique(result)), {0, 255})
+        self.assertEqual(result[15, 10], 0)
+
+    def test_auto_invert_makes_text_dark(self):
+        image = make_text_image(light_text=True)
+        preprocess.auto_invert(image)
+        self.assertGreater(image[0, 0], image[15, 10])
+
+    def test_open_removes_specks(self):
+        image = np.full((20, 20), 255, dtype=np.uint8)
+        image[5, 5] = 0
+        image[10:15, 10:15] = 0
+        preprocess.open_(image)
+        self.assertEqual(image[5, 5], 255)
+        self.assertEqual(image[12, 12], 0)
+
+    def test_scale_and_pad_shapes(self):
+        image = make_text_image()
+        self.assertEqual(preprocess.scale(image, 2).shape, (60, 120))
+        self.assertEqual(preprocess.scale(image, 1.5).shape, (45, 90))
+        self.assertEqual(preprocess.pad(image, 5).shape, (40, 70))
+
+    def test_every_preset_runs(self):
+        for name in PRESETS:
+            result = Preprocessor.from_config(name)(make_text_image())
+            self.assertEqual(result.dtype, np.uint8, name)
+            self.assertEqual(result.ndim, 2, name)
+
+    def test_custom_steps_and_errors(self):
+        steps = [{'op': 'invert'}, {'op': 'pad', 'size': 2}]
+        self.assertEqual(Preprocessor.from_config(steps)(make_text_image()).shape, (34, 64))
+        with self.assertRaises(ValueError):
+            Preprocessor.from_config('missing')
+        with self.assertRaises(ValueError):
+            Preprocessor([{'op': 'sharpen'}])
+
+    def test_read_only_input_is_copied(self):
+        image = make_text_image()
+        image.flags.writeable = False
+        result = Preprocessor.from_config('light_on_dark')(image)
+        self.assertEqual(image[0, 0], 220)
+        self.assertEqual(result.shape, (50, 80))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+import numpy as np
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.config import DEFAULT_CONFIG
+from src.ocr import processor as processor_module
+from src.ocr.processor import OCRProcessor
+
+
+class FakeScreenShot:
+    def __init__(self, pixels):
+        self.height, self.width = pixels.shape[:2]
+        self.raw = bytearray(pixels.tobytes())
+
+
+class FakeMSS:
+    """Two side-by-side 200x100 monitors, each split into a dark and a light half."""
+
+    def __init__(self):
+        self.monitors = [
+            {'left': 0, 'top': 0, 'width': 400, 'height': 100},
+            {'left': 0, 'top': 0, 'width': 200, 'height': 100},
+            {'left': 200, 'top': 0, 'width': 200, 'height': 100},
+        ]
+        self.grabs = []
+
+    def grab(self, monitor):
+        self.grabs.append(monitor['left'])
+        pixels = np.zeros((monitor['height'], monitor['width'], 4), dtype=np.uint8)
+        base = 10 if monitor['left'] == 0 else 100
+        pixels[:, :100, :3] = base
+        pixels[:, 100:, :3] = base + 50
+        return FakeScreenShot(pixels)
+
+    def close(self):
+        pass
+
+
+class FakePool:
+    """Reports the mean gray level of each image instead of reading text."""
+
+    backend = 'fake'
+    size = 4
+
+    def recognize(self, image, profile=None):
+        return str(int(round(float(np.asarray(image).mean()))))
+
+    def close(self):
+        pass
+
+
+class TestProcessRegions(unittest.TestCase):
+    def setUp(self):
+        # The fake engine reports gray levels, so OCR whole crops, not text lines
+        config = dict(DEFAULT_CONFIG, cache=dict(DEFAULT_CONFIG['cache'], enabled=False),
+                      localize=dict(DEFAULT_CONFIG['localize'], enabled=False))
+        with mock.patch.object(processor_module.mss, 'mss', FakeMSS), \
+                mock.patch.object(processor_module, 'create_engine_pool', return_value=FakePool()):
+            self.processor = OCRProcessor(config)
+
+    def tearDown(self):
+        del self.processor
+
+    def test_one_grab_per_monitor(self):
+        regions = {
+            'a': {'region': [0, 0, 50, 50], 'monitor': 0},
+            'b': {'region': [120, 10, 50, 50], 'monitor': 0},
+            'c': {'region': [210, 0, 50, 50], 'monitor': 1},
+            'd': {'region': [350, 50, 40, 40], 'monitor': 1},
+        }
+        results = self.processor.process_regions(regions)
+        self.assertEqual(sorted(self.processor.sct.grabs), [0, 200])
+        self.assertEqual(results, {'a': '10', 'b': '60', 'c': '100', 'd': '150'})
+
+    def test_frames_are_counted_once_per_region(self):
+        counters = processor_module.metrics.snapshot()['counters']
+        frames, crops = counters.get('frames', 0), counters.get('crops', 0)
+        image = np.full((200, 200, 4), 255, dtype=np.uint8)
+        image[10:20, 20:180:4, :3] = 0
+        image[100:110, 20:180:4, :3] = 0
+        self.processor.config = dict(self.processor.config, localize=DEFAULT_CONFIG['localize'])
+        self.processor.process_frame(image)
+        counters = processor_module.metrics.snapshot()['counters']
+        self.assertEqual(counters['frames'] - frames, 1)
+        self.assertEqual(counters['crops'] - crops, 2)
+
+    def test_region_off_monitor_is_empty(self):
+        results = self.processor.process_regions({'gone': {'region': [500, 0, 10, 10], 'monitor': 0}})
+        self.assertEqual(results, {'gone': ''})
+
+    def test_monitor_is_found_from_position(self):
+        # Saved on a machine with more monitors: the index is stale or out of range
+        regions = {
+            'stale': {'region': [210, 0, 50, 50], 'monitor': 0},
+            'missing': {'region': [0, 0, 50, 50], 'monitor': 4},
+            'gone': {'region': [900, 0, 50, 50], 'monitor': 5},
+        }
+        results = self.processor.process_regions(regions)
+        self.assertEqual(results, {'stale': '100', 'missing': '10', 'gone': ''})
+        self.assertEqual(self.processor.monitor_for((150, 0, 120, 10)), 1)
+        self.assertIsNone(self.processor.monitor_for((400, 0, 10, 10)))
+
+    def test_grab_region_uses_global_coordinates(self):
+        frame = self.processor.grab_region((250, 20, 30, 40), 1)
+        self.assertEqual(self.processor.sct.grabs, [250])
+        self.assertEqual(frame.shape, (40, 30, 4))
+
+    def test_monitors_are_cached_until_refreshed(self):
+        moved = FakeMSS()
+        moved.monitors = moved.monitors[:2]
+        with mock.patch.object(processor_module.mss, 'mss', return_value=moved):
+            self.assertEqual(len(self.processor.monitors), 3)
+            self.processor.refresh_monitors()
+        self.assertEqual(len(self.processor.monitors), 2)
+
+    def test_crop_is_clipped_view(self):
+        frame, monitor = self.processor.grab_monitor(1)
+        crop = OCRProcessor.crop(frame, monitor, (380, 90, 50, 50))
+        self.assertEqual(crop.shape, (10, 20, 4))
+        self.assertTrue(np.shares_memory(crop, frame))
+
+
+if __name__ == '__main__':
+    unittest.main()
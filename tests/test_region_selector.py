@@ -1,12 +1,111 @@
 import sys
 import os
+import unittest
+from unittest import mock
 
 # Add the project root directory to Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from PyQt5.QtWidgets import QApplication, QMainWindow, QPushButton, QVBoxLayout, QWidget, QLabel
-from PyQt5.QtCore import Qt, QTimer
-from src.gui.region_selector import RegionSelector
+from PyQt5.QtCore import Qt, QTimer, QPoint, QRect
+from PyQt5.QtGui import QColor, QPixmap, QRegion
+from src.gui.region_selector import RegionSelector, selection_damage
+
+
+class TestSelectionDamage(unittest.TestCase):
+    def test_growing_selection_repaints_only_the_new_strip(self):
+        damage = selection_damage(QRect(100, 100, 200, 100), QRect(100, 100, 210, 100), 2)
+        bounds = damage.boundingRect()
+        # Both right borders and the 10 px strip between them, not the whole rectangle
+        self.assertGreaterEqual(bounds.right(), 310)
+        self.assertFalse(damage.contains(QPoint(200, 150)))
+        self.assertTrue(damage.contains(QPoint(305, 150)))
+        self.assertLess(_area(damage), 200 * 100)
+
+    def test_borders_are_repainted(self):
+        damage = selection_damage(QRect(10, 10, 50, 50), QRect(10, 10, 50, 50), 2)
+        self.assertTrue(damage.contains(QPoint(10, 30)))
+        self.assertTrue(damage.contains(QPoint(59, 30)))
+        self.assertFalse(damage.contains(QPoint(35, 35)))
+
+    def test_no_previous_selection(self):
+        damage = selection_damage(None, QRect(10, 10, 50, 50), 2)
+        self.assertTrue(damage.contains(QPoint(10, 10)))
+        # The first drag frame fills the whole rectangle
+        self.assertTrue(damage.contains(QPoint(35, 35)))
+        self.assertTrue(selection_damage(None, None, 2).isEmpty())
+
+    def test_clearing_a_selection_repaints_all_of_it(self):
+        damage = selection_damage(QRect(100, 100, 200, 200), None, 2)
+        self.assertTrue(damage.contains(QPoint(200, 200)))
+        self.assertTrue(damage.contains(QPoint(100, 100)))
+        self.assertFalse(damage.contains(QPoint(50, 50)))
+
+
+class TestRegionSelector(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def make_selector(self, freeze=False):
+        selector = RegionSelector(QApplication.primaryScreen(), freeze=freeze)
+        self.addCleanup(selector.close)
+        return selector
+
+    def test_moving_selection_updates_only_damaged_region(self):
+        selector = self.make_selector()
+        selector.set_selection(QRect(100, 100, 200, 100))
+        updates = []
+        selector.update = updates.append
+        selector.set_selection(QRect(100, 100, 205, 100))
+        self.assertEqual(len(updates), 1)
+        self.assertIsInstance(updates[0], QRegion)
+        self.assertLess(_area(updates[0]), selector.width() * selector.height() // 100)
+
+    def test_new_press_clears_the_old_fill(self):
+        screen = QApplication.primaryScreen()
+        frame = QPixmap(screen.geometry().size())
+        frame.fill(QColor(0, 200, 0))
+        with mock.patch.object(type(screen), 'grabWindow', return_value=frame):
+            selector = self.make_selector(freeze=True)
+        selector.set_selection(QRect(20, 20, 8, 8))  # Too small to be taken on release
+        shown = selector.grab()
+        self.assertGreater(QColor(shown.toImage().pixel(24, 24)).red(), 0)
+        updates = []
+        selector.update = updates.append
+        selector.set_selection(None)
+        # Repaint only what was damaged, as the window system would
+        selector.render(shown, updates[0].boundingRect().topLeft(), updates[0])
+        self.assertEqual(QColor(shown.toImage().pixel(24, 24)).red(), 0)
+
+    def test_frozen_frame_is_drawn_behind_the_selection(self):
+        screen = QApplication.primaryScreen()
+        frame = QPixmap(screen.geometry().size())
+        frame.fill(QColor(0, 200, 0))
+        with mock.patch.object(type(screen), 'grabWindow', return_value=frame):
+            selector = self.make_selector(freeze=True)
+        self.assertFalse(selector.testAttribute(Qt.WA_TranslucentBackground))
+        selector.set_selection(QRect(20, 20, 100, 100))
+        image = selector.grab().toImage()
+        outside = QColor(image.pixel(5, 5))
+        inside = QColor(image.pixel(60, 60))
+        # Frame dimmed by half outside the selection, half red tint inside
+        self.assertAlmostEqual(outside.green(), 100, delta=3)
+        self.assertEqual(outside.red(), 0)
+        self.assertAlmostEqual(inside.green(), 100, delta=3)
+        self.assertAlmostEqual(inside.red(), 128, delta=3)
+
+    def test_falls_back_to_translucent_without_a_frame(self):
+        screen = QApplication.primaryScreen()
+        with mock.patch.object(type(screen), 'grabWindow', return_value=QPixmap()):
+            selector = self.make_selector(freeze=True)
+        self.assertIsNone(selector.background)
+        self.assertTrue(selector.testAttribute(Qt.WA_TranslucentBackground))
+
+
+def _area(region):
+    return sum(rect.width() * rect.height() for rect in region.rects())
+
 
 class TestWindow(QMainWindow):
     def __init__(self):
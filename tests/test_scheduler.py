@@ -0,0 +1,133 @@
+import os
+import sys
+import unittest
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PyQt5.QtWidgets import QApplication
+
+from src.pipeline.scheduler import WatchScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeDetector:
+    def __init__(self):
+        self.resets = 0
+
+    def reset(self):
+        self.resets += 1
+
+
+class TestWatchScheduler(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.submitted = []
+        self.scheduler = WatchScheduler(
+            lambda name, detector: self.submitted.append(name),
+            min_interval_ms=250, max_interval_ms=4000, backoff=2.0,
+            max_fps=0, cpu_budget=0, clock=self.clock
+        )
+
+    def tearDown(self):
+        self.scheduler.clear()
+
+    def poll(self, name, changed, job_s=None):
+        """Run one capture of a region that is due now."""
+        self.clock.now = self.scheduler.regions[name].next_due
+        self.assertIn(name, self.scheduler.tick())
+        self.scheduler.on_result(name, changed, job_s)
+
+    def test_new_region_is_due_at_once(self):
+        self.scheduler.add('subs')
+        self.assertEqual(self.scheduler.tick(), ['subs'])
+        # Not again until the capture is reported back
+        self.assertEqual(self.scheduler.tick(), [])
+        self.assertFalse(self.scheduler.timer.isActive())
+
+    def test_backs_off_while_unchanged_and_snaps_back(self):
+        self.scheduler.add('hud')
+        intervals = []
+        for _ in range(7):
+            self.poll('hud', changed=False)
+            intervals.append(self.scheduler.interval('hud'))
+        self.assertEqual(intervals, [0.5, 1.0, 2.0, 4.0, 4.0, 4.0, 4.0])
+        self.poll('hud', changed=True)
+        self.assertEqual(self.scheduler.interval('hud'), 0.25)
+
+    def test_next_capture_waits_for_the_interval(self):
+        self.scheduler.add('hud')
+        self.poll('hud', changed=False)
+        self.clock.now += 0.4
+        self.assertEqual(self.scheduler.tick(), [])
+        self.assertTrue(self.scheduler.timer.isActive())
+        self.assertLessEqual(self.scheduler.timer.remainingTime(), 110)
+        self.clock.now += 0.1
+        self.assertEqual(self.scheduler.tick(), ['hud'])
+
+    def run_for(self, seconds, changing):
+        """Advance the clock from poll to poll, reporting which regions changed."""
+        end = self.clock.now + seconds
+        while True:
+            self.clock.now = min(s.next_due for s in self.scheduler.regions.values())
+            if self.clock.now > end:
+                return
+            for name in self.scheduler.tick():
+                self.scheduler.on_result(name, name in changing)
+
+    def test_regions_are_independent(self):
+        self.scheduler.add('subs')
+        self.scheduler.add('hud')
+        self.run_for(5, changing={'subs'})
+        self.assertEqual(self.scheduler.interval('subs'), 0.25)
+        self.assertEqual(self.scheduler.interval('hud'), 4.0)
+        self.assertGreater(self.scheduler.regions['subs'].polls, 5 * self.scheduler.regions['hud'].polls)
+
+    def test_fps_budget_is_split_by_priority(self):
+        self.scheduler.max_fps = 6
+        self.scheduler.add('subs', priority=2)
+        self.scheduler.add('hud', priority=1)
+        self.assertEqual(self.scheduler.tick(), ['subs', 'hud'])
+        self.scheduler.on_result('subs', True)
+        self.scheduler.on_result('hud', True)
+        # 4 and 2 captures per second
+        self.assertAlmostEqual(self.scheduler.interval('subs'), 0.25)
+        self.assertAlmostEqual(self.scheduler.interval('hud'), 0.5)
+
+    def test_cpu_budget_slows_expensive_regions(self):
+        self.scheduler.cpu_budget = 0.5
+        self.scheduler.add('dialog')
+        self.poll('dialog', changed=True, job_s=0.2)
+        # 200 ms of work at most half the time
+        self.assertAlmostEqual(self.scheduler.interval('dialog'), 0.4)
+
+    def test_reset_and_remove(self):
+        detector = FakeDetector()
+        self.scheduler.add('hud', detector=detector)
+        for _ in range(3):
+            self.poll('hud', changed=False)
+        self.scheduler.reset('hud')
+        self.assertEqual(detector.resets, 1)
+        self.assertEqual(self.scheduler.interval('hud'), 0.25)
+        self.assertEqual(self.scheduler.tick(), ['hud'])
+
+        self.assertIsNotNone(self.scheduler.remove('hud'))
+        self.assertNotIn('hud', self.scheduler)
+        self.assertFalse(self.scheduler.timer.isActive())
+        # Late results for removed regions are ignored
+        self.scheduler.on_result('hud', True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import os
+import sys
+import threading
+import time
+import unittest
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PyQt5.QtWidgets import QApplication
+
+from src.startup import BackgroundInit, Readiness, StartupProfile
+
+
+class TestBackgroundInit(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def process_events(self, condition, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while not condition() and time.monotonic() < deadline:
+            self.app.processEvents()
+            time.sleep(0.005)
+
+    def test_subsystems_start_in_parallel(self):
+        barrier = threading.Barrier(2, timeout=2)
+        init = BackgroundInit()
+
+        def factory(result):
+            # Each factory waits for the other, so this only finishes if both run at once
+            barrier.wait()
+            return result
+
+        init.add('ocr', lambda: factory('ocr engine'))
+        init.add('tts', lambda: factory('speaker'))
+        self.assertEqual(init.state('ocr'), Readiness.PENDING)
+        init.start()
+        self.assertTrue(init.wait(2))
+        self.assertTrue(init.all_ready())
+        self.assertEqual(init.result('ocr'), 'ocr engine')
+        self.assertEqual(init.result('tts'), 'speaker')
+
+    def test_state_changes_are_signalled(self):
+        init = BackgroundInit()
+        init.add('ocr', lambda: 'engine')
+        seen = []
+        init.state_changed.connect(lambda name, state: seen.append((name, state)))
+        init.start()
+        self.process_events(lambda: len(seen) == 2)
+        self.assertEqual(seen, [('ocr', Readiness.LOADING), ('ocr', Readiness.READY)])
+
+    def test_failed_factory(self):
+        def broken():
+            raise RuntimeError("no tesseract")
+
+        init = BackgroundInit()
+        init.add('ocr', broken)
+        init.add('tts', lambda: 'speaker')
+        init.start()
+        self.assertTrue(init.wait(2))
+        self.assertEqual(init.failed(), ['ocr'])
+        self.assertFalse(init.all_ready())
+        self.assertIsNone(init.result('ocr'))
+        self.assertIsInstance(init.errors['ocr'], RuntimeError)
+
+    def test_wait_times_out(self):
+        release = threading.Event()
+        init = BackgroundInit()
+        init.add('ocr', release.wait)
+        init.start()
+        self.assertFalse(init.wait(0.05))
+        self.assertEqual(init.state('ocr'), Readiness.LOADING)
+        release.set()
+        self.assertTrue(init.wait(2))
+
+
+class TestStartupProfile(unittest.TestCase):
+    def test_report_lists_phases_in_start_order(self):
+        profile = StartupProfile(enabled=True, start=100.0)
+        profile.record('tts', 'init', 100.5, 100.75)
+        profile.record('ocr', 'import', 100.25, 100.5)
+        with profile.phase('main', 'window'):
+            pass
+
+        lines = profile.report()
+        self.assertEqual(len(lines), 4)
+        self.assertTrue(lines[1].startswith('ocr'))
+        self.assertIn('250.0', lines[1])
+        self.assertTrue(lines[2].startswith('tts'))
+        self.assertTrue(lines[3].startswith('main'))
+
+    def test_init_total_is_recorded(self):
+        profile = StartupProfile()
+        init = BackgroundInit(profile)
+        init.add('ocr', lambda: None)
+        init.start()
+        init.wait(2)
+        self.assertEqual([phase[:2] for phase in profile.phases], [('ocr', 'total')])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import os
+import sys
+import unittest
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.pipeline.text_diff import TextDiffer, normalize_word
+
+
+class TestTextDiffer(unittest.TestCase):
+    def setUp(self):
+        self.differ = TextDiffer()
+
+    def test_confusable_characters_fold_together(self):
+        self.assertEqual(normalize_word("He1lo"), normalize_word("Hello"))
+        self.assertEqual(normalize_word("G0AL"), normalize_word("GOAL"))
+        self.assertEqual(normalize_word("modern"), normalize_word("modem"))
+
+    def test_only_new_lines_are_emitted(self):
+        self.assertEqual(self.differ.new_lines("Hello there\nHow are you"),
+                         ["Hello there", "How are you"])
+        self.assertEqual(self.differ.new_lines("He1lo there\nHow are you?\nI am fine"),
+                         ["I am fine"])
+
+    def test_scrolling_chat(self):
+        self.differ.new_lines("alice: hi\nbob: hello")
+        self.assertEqual(self.differ.diff("bob: hello\ncarol: hey all"), "carol: hey all")
+
+    def test_growing_line_emits_appended_words(self):
+        self.differ.new_lines("The door is")
+        self.assertEqual(self.differ.new_lines("The door is locked, find the key"),
+                         ["locked, find the key"])
+
+    def test_different_line_is_new(self):
+        self.differ.new_lines("HP 100")
+        self.assertEqual(self.differ.new_lines("Game over"), ["Game over"])
+
+    def test_changed_number_is_new(self):
+        self.differ.new_lines("HP 100")
+        self.assertEqual(self.differ.diff("HP 180"), "HP 180")
+        self.assertEqual(self.differ.diff("HP 10"), "HP 10")
+        self.assertEqual(self.differ.diff("HP 1O"), "")
+
+    def test_value_going_back_is_new(self):
+        for text in ("HP 100", "HP 90", "HP 100"):
+            self.assertEqual(self.differ.diff(text), text)
+        for text in ("Gold 5", "Gold 6", "Gold 5"):
+            self.assertEqual(self.differ.diff(text), text)
+
+    def test_alike_lines_shown_together_are_both_kept(self):
+        self.assertEqual(self.differ.new_lines("Ally HP 100\nAlly HP 50"), ["Ally HP 100", "Ally HP 50"])
+        self.assertEqual(self.differ.diff("Ally HP 100\nAlly HP 50"), "")
+
+    def test_reset(self):
+        self.differ.new_lines("Same text")
+        self.differ.reset()
+        self.assertEqual(self.differ.diff("Same text"), "Same text")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import os
+import sys
+import tempfile
+import threading
+import unittest
+import wave
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.tts.cache import CommandPlayer, SpeechCache, clip_duration, speech_key
+
+
+def write_clip(path, seconds=0.1, rate=8000):
+    with wave.open(path, 'wb') as clip:
+        clip.setnchannels(1)
+        clip.setsampwidth(2)
+        clip.setframerate(rate)
+        clip.writeframes(b'\0\0' * int(seconds * rate))
+
+
+class TestSpeechKey(unittest.TestCase):
+    def test_whitespace_is_normalized(self):
+        self.assertEqual(speech_key("Press  E\nto open", 'v', 150, 0.9),
+                         speech_key("Press E to open", 'v', 150, 0.9))
+
+    def test_voice_settings_are_part_of_the_key(self):
+        key = speech_key("Hello", 'v', 150, 0.9)
+        self.assertNotEqual(key, speech_key("Hello", 'w', 150, 0.9))
+        self.assertNotEqual(key, speech_key("Hello", 'v', 200, 0.9))
+        self.assertNotEqual(key, speech_key("Hello", 'v', 150, 0.5))
+        self.assertNotEqual(key, speech_key("HELLO", 'v', 150, 0.9))
+
+
+class TestSpeechCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.tmp.name, 'clips')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def add(self, cache, key, seconds=0.1):
+        path = cache.temp_path(key)
+        write_clip(path, seconds)
+        self.assertTrue(cache.add(key, path))
+        self.assertFalse(os.path.exists(path))
+
+    def test_hit_and_miss(self):
+        cache = SpeechCache(self.directory)
+        self.assertIsNone(cache.get('a'))
+        self.add(cache, 'a')
+        self.assertEqual(cache.get('a'), cache.path('a'))
+        self.assertEqual(cache.stats()['hits'], 1)
+        self.assertEqual(cache.stats()['misses'], 1)
+
+    def test_least_recently_played_is_evicted(self):
+        size = 44 + 2 * 800   # 0.1 s at 8 kHz
+        cache = SpeechCache(self.directory, max_bytes=2 * size)
+        self.add(cache, 'a')
+        self.add(cache, 'b')
+        cache.get('a')
+        self.add(cache, 'c')
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertFalse(os.path.exists(cache.path('b')))
+
+    def test_empty_render_is_rejected(self):
+        cache = SpeechCache(self.directory)
+        path = cache.temp_path('a')
+        open(path, 'wb').close()
+        self.assertFalse(cache.add('a', path))
+        self.assertFalse(cache.add('b', cache.temp_path('b')))
+        self.assertNotIn('a', cache)
+
+    def test_index_survives_restart(self):
+        cache = SpeechCache(self.directory)
+        self.add(cache, 'a')
+        open(cache.temp_path('b'), 'wb').close()
+        cache = SpeechCache(self.directory)
+        self.assertIn('a', cache)
+        self.assertEqual(os.listdir(self.directory), ['a.wav'])
+
+    def test_clip_duration(self):
+        path = os.path.join(self.tmp.name, 'x.wav')
+        write_clip(path, 0.5)
+        self.assertAlmostEqual(clip_duration(path), 0.5)
+
+
+class TestCommandPlayer(unittest.TestCase):
+    def test_interrupt_stops_playback(self):
+        player = CommandPlayer([sys.executable, '-c', 'import time; time.sleep(10)'])
+        interrupt = threading.Event()
+        interrupt.set()
+        self.assertFalse(player.play('clip.wav', interrupt))
+
+    def test_plays_to_the_end(self):
+        player = CommandPlayer([sys.executable, '-c', 'pass'])
+        self.assertTrue(player.play('clip.wav', threading.Event()))
+
+
+if __name__ == '__main__':
+    unittest.main()
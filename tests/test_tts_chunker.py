@@ -0,0 +1,41 @@
+import os
+import sys
+import unittest
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.tts.chunker import split_chunks
+
+
+class TestSplitChunks(unittest.TestCase):
+    def test_short_text_is_one_chunk(self):
+        self.assertEqual(split_chunks("  Quest   complete! "), ["Quest complete!"])
+        self.assertEqual(split_chunks("   "), [])
+
+    def test_sentences_and_lines(self):
+        text = "You found a sword. It glows faintly!\nEquip it now?"
+        self.assertEqual(split_chunks(text, min_chars=5),
+                         ["You found a sword.", "It glows faintly!", "Equip it now?"])
+
+    def test_short_pieces_join_the_chunk_before(self):
+        text = "The door is locked tight. Find the key. Go. Then return to the gate."
+        self.assertEqual(split_chunks(text),
+                         ["The door is locked tight.", "Find the key. Go.", "Then return to the gate."])
+
+    def test_first_chunk_is_not_grown(self):
+        self.assertEqual(split_chunks("Hi. Welcome back, traveller."), ["Hi.", "Welcome back, traveller."])
+
+    def test_long_sentence_splits_at_clauses_then_words(self):
+        text = "When the moon rises over the hills, the gate opens, and the path leads on"
+        chunks = split_chunks(text, max_chars=40, min_chars=5)
+        self.assertEqual(chunks, ["When the moon rises over the hills,", "the gate opens,",
+                                  "and the path leads on"])
+        words = "word " * 30
+        chunks = split_chunks(words, max_chars=24)
+        self.assertTrue(all(len(chunk) <= 24 for chunk in chunks))
+        self.assertEqual(' '.join(chunks).split(), words.split())
+
+
+if __name__ == '__main__':
+    unittest.main()
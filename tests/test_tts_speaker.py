@@ -0,0 +1,256 @@
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.tts.cache import SpeechCache
+from src.tts.speaker import SpeechHandle, TTSSpeaker
+
+
+class FakeEngine:
+    """Speaks one word per 'started-word' callback until stopped."""
+
+    def __init__(self):
+        self.callbacks = []
+        self.properties = {}
+        self.text = None
+        self.spoken = []
+        self.gate = threading.Event()
+        self.gate.set()
+        self.speaking = threading.Event()
+        self.stopped = False
+
+    def connect(self, topic, cb):
+        self.callbacks.append(cb)
+
+    def setProperty(self, name, value):
+        self.properties[name] = value
+
+    def say(self, text):
+        self.text = text
+        self.stopped = False
+
+    def runAndWait(self):
+        self.speaking.set()
+        for i, word in enumerate(self.text.split()):
+            for cb in self.callbacks:
+                cb('utterance', i, len(word))
+            if self.stopped:
+                break
+            self.gate.wait(5)
+        else:
+            self.spoken.append(self.text)
+        self.speaking.clear()
+
+    def stop(self):
+        self.stopped = True
+
+
+class TestTTSSpeaker(unittest.TestCase):
+    def setUp(self):
+        self.engine = FakeEngine()
+        with mock.patch('src.tts.speaker.pyttsx3.init', return_value=self.engine):
+            self.speaker = TTSSpeaker(max_queue=2)
+
+    def tearDown(self):
+        self.engine.gate.set()
+        self.speaker.shutdown()
+
+    def test_speak_returns_immediately(self):
+        self.engine.gate.clear()
+        handle = self.speaker.speak("one two three")
+        self.assertFalse(handle.done)
+        self.engine.gate.set()
+        self.assertTrue(handle.wait(5))
+        self.assertEqual(handle.state, SpeechHandle.DONE)
+        self.assertEqual(self.engine.spoken, ["one two three"])
+        self.assertEqual(self.engine.properties['rate'], 150)
+
+    def test_duplicate_consecutive_text_is_dropped(self):
+        first = self.speaker.speak("Hello there")
+        second = self.speaker.speak("  hello   THERE ")
+        self.assertEqual(second.state, SpeechHandle.DROPPED)
+        first.wait(5)
+
+    def test_barge_in_interrupts_current(self):
+        self.engine.gate.clear()
+        first = self.speaker.speak("a long line of dialog")
+        self.assertTrue(self.engine.speaking.wait(5))
+        queued = self.speaker.speak("queued")
+        second = self.speaker.speak("newest", interrupt=True)
+        self.engine.gate.set()
+        self.assertTrue(second.wait(5))
+        self.assertEqual(first.state, SpeechHandle.CANCELLED)
+        self.assertEqual(queued.state, SpeechHandle.CANCELLED)
+        self.assertEqual(self.engine.spoken, ["newest"])
+
+    def test_queue_is_bounded_by_priority(self):
+        self.engine.gate.clear()
+        self.speaker.speak("busy speaking now")
+        self.assertTrue(self.engine.speaking.wait(5))
+        low = self.speaker.speak("low", priority=TTSSpeaker.PRIORITY_LOW)
+        normal = self.speaker.speak("normal")
+        high = self.speaker.speak("high", priority=TTSSpeaker.PRIORITY_HIGH)
+        self.assertEqual(low.state, SpeechHandle.DROPPED)
+        self.assertEqual(self.speaker.pending(), 2)
+        self.engine.gate.set()
+        self.assertTrue(normal.wait(5))
+        self.assertEqual(self.engine.spoken[-2:], ["high", "normal"])
+
+    def test_flush_and_cancel(self):
+        self.engine.gate.clear()
+        current = self.speaker.speak("still talking here")
+        self.assertTrue(self.engine.speaking.wait(5))
+        queued = self.speaker.speak("next")
+        queued.cancel()
+        self.assertEqual(queued.state, SpeechHandle.CANCELLED)
+        self.speaker.flush()
+        self.engine.gate.set()
+        self.assertTrue(current.wait(5))
+        self.assertEqual(current.state, SpeechHandle.CANCELLED)
+
+    def test_long_text_is_spoken_in_sentences(self):
+        handle = self.speaker.speak("The first sentence is here. The second one follows it.")
+        self.assertTrue(handle.wait(5))
+        self.assertEqual(self.engine.spoken, ["The first sentence is here.", "The second one follows it."])
+        self.assertEqual(handle.chunks_spoken, 2)
+        self.assertIsNotNone(handle.first_audio_ms)
+        self.assertLessEqual(handle.started_at, handle.first_audio_at)
+        self.speaker.chunk_chars = 0
+        self.assertEqual(self.speaker.split("One. Two."), ["One. Two."])
+
+    def test_newer_text_of_group_supersedes(self):
+        self.engine.gate.clear()
+        old = self.speaker.speak("Old line number one. Old line number two.", group='chat')
+        self.assertTrue(self.engine.speaking.wait(5))
+        other = self.speaker.speak("Other region", group='menu')
+        stale = self.speaker.speak("Stale chat line", group='chat')
+        new = self.speaker.speak("Newest chat line", group='chat')
+        self.assertEqual(stale.state, SpeechHandle.CANCELLED)
+        self.engine.gate.set()
+        self.assertTrue(new.wait(5))
+        self.assertEqual(old.state, SpeechHandle.CANCELLED)
+        self.assertEqual(old.chunks_spoken, 1)
+        self.assertEqual(other.state, SpeechHandle.DONE)
+        self.assertEqual(self.engine.spoken, ["Old line number one.", "Other region", "Newest chat line"])
+
+
+class RenderingEngine(FakeEngine):
+    """Also renders text to a (fake) audio file."""
+
+    def __init__(self):
+        super().__init__()
+        self.rendered = []
+        self.target = None
+
+    def getProperty(self, name):
+        return 'test-voice'
+
+    def save_to_file(self, text, filename):
+        self.text = text
+        self.target = filename
+
+    def runAndWait(self):
+        if self.target is None:
+            super().runAndWait()
+            return
+        target, self.target = self.target, None
+        with open(target, 'wb') as f:
+            f.write(b'RIFF' + b'\0' * 100)
+        self.rendered.append(self.text)
+
+
+class FakePlayer:
+    def __init__(self, engine):
+        self.engine = engine
+        self.played = []
+        self.rendered_before = []  # Clips rendered when each playback started
+
+    def start(self, path):
+        self.played.append(path)
+        self.rendered_before.append(len(self.engine.rendered))
+        return self
+
+    def wait(self, interrupt):
+        return True
+
+
+class TestSpeechCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.engine = RenderingEngine()
+        self.player = FakePlayer(self.engine)
+        self.cache = SpeechCache(self.tmp.name)
+        with mock.patch('src.tts.speaker.pyttsx3.init', return_value=self.engine):
+            self.speaker = TTSSpeaker(cache=self.cache, player=self.player, cache_after=2)
+
+    def tearDown(self):
+        self.speaker.shutdown()
+        self.tmp.cleanup()
+
+    def say(self, text):
+        self.speaker.flush()  # Forget the last text so repeats are spoken
+        self.assertTrue(self.speaker.speak(text).wait(5))
+
+    def wait_for_render(self, text):
+        key = self.speaker.clip_key(text)
+        for _ in range(500):
+            if key in self.cache:
+                return
+            threading.Event().wait(0.01)
+        self.fail(f"{text!r} was not rendered")
+
+    def test_repeated_phrase_is_played_from_cache(self):
+        key = self.speaker.clip_key("Inventory full")
+        self.say("Inventory full")
+        self.assertNotIn(key, self.cache)
+        self.say("Inventory full")
+        self.assertIn(key, self.cache)
+        self.say("Inventory  full")
+        self.assertEqual(self.engine.spoken, [])
+        self.assertEqual(self.engine.rendered, ["Inventory full", "Inventory full"])
+        self.assertEqual(self.player.played[-1], self.cache.path(key))
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), [key + '.wav'])
+
+    def test_prewarm(self):
+        self.speaker.prewarm(["Quest complete", "  "])
+        self.wait_for_render("Quest complete")
+        self.say("Quest complete")
+        self.assertEqual(self.engine.spoken, [])
+        self.assertEqual(len(self.player.played), 1)
+
+    def test_prewarm_lists_texts_on_speech_thread(self):
+        threads = []
+
+        def frequent():
+            threads.append(threading.current_thread().name)
+            return ["Level up"]
+
+        self.speaker.prewarm(frequent)
+        self.wait_for_render("Level up")
+        self.assertEqual(threads, ['TTSSpeaker'])
+
+    def test_voice_change_misses(self):
+        self.speaker.prewarm(["Hello"])
+        self.wait_for_render("Hello")
+        self.speaker.rate = 200
+        self.say("Hello")
+        self.assertEqual(self.engine.rendered, ["Hello", "Hello"])
+        self.assertNotEqual(self.player.played, [self.cache.path(self.speaker.clip_key("Hello"))])
+
+    def test_next_sentence_is_rendered_while_playing(self):
+        self.say("The first sentence is here. The second one follows it.")
+        self.assertEqual(self.engine.rendered, ["The first sentence is here.", "The second one follows it."])
+        self.assertEqual(self.player.rendered_before, [1, 2])
+        self.assertNotEqual(self.player.played[0], self.player.played[1])
+        # Spoken once only, so neither clip is kept
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+
+if __name__ == '__main__':
+    unittest.main()